@@ -0,0 +1,54 @@
+-- Stroke summary aggregation in Postgres.
+-- GET /api/stroke/summary used to pull every stroke_analytics row and compute
+-- counts and form scores in Python; these functions return the one summary row.
+
+-- Mirrors the player/opponent check the API applies to stroke metrics: a stroke
+-- counts for the player unless it was confidently attributed to the opponent.
+CREATE OR REPLACE FUNCTION public.stroke_is_player(metrics JSONB)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    confidence DOUBLE PRECISION;
+BEGIN
+    IF metrics IS NULL OR jsonb_typeof(metrics) <> 'object' THEN
+        RETURN TRUE;
+    END IF;
+    IF lower(btrim(coalesce(metrics->>'event_hitter', ''))) <> 'opponent' THEN
+        RETURN TRUE;
+    END IF;
+    IF lower(btrim(coalesce(metrics->>'event_hitter_method', ''))) = 'proximity_10_percent'
+       AND lower(btrim(coalesce(metrics->>'event_hitter_reason', ''))) LIKE 'player\_outside\_%' THEN
+        RETURN TRUE;
+    END IF;
+    BEGIN
+        confidence := (metrics->>'event_hitter_confidence')::DOUBLE PRECISION;
+    EXCEPTION WHEN others THEN
+        confidence := NULL;
+    END;
+    RETURN coalesce(confidence, 0) < 0.75;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_stroke_summary(p_session_id UUID)
+RETURNS TABLE (
+    average_form_score DOUBLE PRECISION,
+    best_form_score DOUBLE PRECISION,
+    total_strokes BIGINT,
+    forehand_count BIGINT,
+    backhand_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        coalesce(avg(form_score), 0)::DOUBLE PRECISION,
+        coalesce(max(form_score), 0)::DOUBLE PRECISION,
+        count(*),
+        count(*) FILTER (WHERE stroke_type = 'forehand'),
+        count(*) FILTER (WHERE stroke_type = 'backhand')
+    FROM public.stroke_analytics
+    WHERE session_id = p_session_id
+      AND public.stroke_is_player(metrics);
+$$;
@@ -0,0 +1,85 @@
+-- Denormalized stroke summary on sessions.
+-- Kept in sync by triggers on stroke_analytics so GET /api/stroke/summary reads
+-- one sessions row instead of aggregating strokes per request.
+-- Depends on get_stroke_summary() from migration 015.
+
+ALTER TABLE sessions ADD COLUMN IF NOT EXISTS average_form_score DOUBLE PRECISION NOT NULL DEFAULT 0;
+ALTER TABLE sessions ADD COLUMN IF NOT EXISTS best_form_score DOUBLE PRECISION NOT NULL DEFAULT 0;
+ALTER TABLE sessions ADD COLUMN IF NOT EXISTS total_strokes INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE sessions ADD COLUMN IF NOT EXISTS forehand_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE sessions ADD COLUMN IF NOT EXISTS backhand_count INTEGER NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION public.refresh_session_stroke_summary(p_session_id UUID)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE public.sessions s
+    SET average_form_score = agg.average_form_score,
+        best_form_score = agg.best_form_score,
+        total_strokes = agg.total_strokes,
+        forehand_count = agg.forehand_count,
+        backhand_count = agg.backhand_count
+    FROM public.get_stroke_summary(p_session_id) agg
+    WHERE s.id = p_session_id;
+$$;
+
+-- Statement-level for inserts/deletes: the pipeline replaces a session's strokes
+-- in bulk, so each affected session is recomputed once per statement.
+CREATE OR REPLACE FUNCTION public.stroke_analytics_refresh_session_summary()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    affected_session UUID;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        FOR affected_session IN SELECT DISTINCT session_id FROM new_rows LOOP
+            PERFORM public.refresh_session_stroke_summary(affected_session);
+        END LOOP;
+    ELSIF TG_OP = 'DELETE' THEN
+        FOR affected_session IN SELECT DISTINCT session_id FROM old_rows LOOP
+            PERFORM public.refresh_session_stroke_summary(affected_session);
+        END LOOP;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- Row-level for updates: transition tables cannot be combined with a column
+-- list, and the column list keeps AI insight writes from triggering a recompute.
+CREATE OR REPLACE FUNCTION public.stroke_analytics_refresh_session_summary_row()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM public.refresh_session_stroke_summary(NEW.session_id);
+    IF OLD.session_id IS DISTINCT FROM NEW.session_id THEN
+        PERFORM public.refresh_session_stroke_summary(OLD.session_id);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS stroke_analytics_summary_insert ON stroke_analytics;
+CREATE TRIGGER stroke_analytics_summary_insert
+    AFTER INSERT ON stroke_analytics
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.stroke_analytics_refresh_session_summary();
+
+DROP TRIGGER IF EXISTS stroke_analytics_summary_delete ON stroke_analytics;
+CREATE TRIGGER stroke_analytics_summary_delete
+    AFTER DELETE ON stroke_analytics
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.stroke_analytics_refresh_session_summary();
+
+DROP TRIGGER IF EXISTS stroke_analytics_summary_update ON stroke_analytics;
+CREATE TRIGGER stroke_analytics_summary_update
+    AFTER UPDATE OF session_id, stroke_type, form_score, metrics ON stroke_analytics
+    FOR EACH ROW
+    EXECUTE FUNCTION public.stroke_analytics_refresh_session_summary_row();
+
+-- Backfill sessions that already have strokes.
+SELECT public.refresh_session_stroke_summary(session_id)
+FROM (SELECT DISTINCT session_id FROM stroke_analytics) existing;
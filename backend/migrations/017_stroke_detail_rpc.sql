@@ -0,0 +1,32 @@
+-- Stroke detail in one round trip.
+-- Returns {"stroke": ..., "pose_frames": [...]} for a stroke owned by p_user_id
+-- (via its session), or NULL when the stroke is missing or not the user's.
+-- The frame window uses idx_pose_analysis_person from migration 010.
+
+CREATE OR REPLACE FUNCTION public.get_stroke_detail(p_stroke_id UUID, p_user_id UUID)
+RETURNS JSON
+LANGUAGE sql
+STABLE
+AS $$
+    WITH stroke AS (
+        SELECT sa.*
+        FROM public.stroke_analytics sa
+        JOIN public.sessions s ON s.id = sa.session_id
+        WHERE sa.id = p_stroke_id
+          AND s.user_id = p_user_id
+    )
+    SELECT json_build_object(
+        'stroke', row_to_json(stroke),
+        'pose_frames', coalesce(
+            (
+                SELECT json_agg(pa ORDER BY pa.frame_number)
+                FROM public.pose_analysis pa
+                WHERE pa.session_id = stroke.session_id
+                  AND pa.person_id = 0
+                  AND pa.frame_number BETWEEN stroke.start_frame AND stroke.end_frame
+            ),
+            '[]'::json
+        )
+    )
+    FROM stroke;
+$$;
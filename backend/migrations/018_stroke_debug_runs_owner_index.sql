@@ -0,0 +1,12 @@
+-- Composite (user_id, id) index for the owner-scoped debug run lookup in
+-- GET /api/stroke/debug-run/{run_id}.
+-- stroke_detection_debug_runs is created outside these migrations, so only
+-- add the index where the table exists.
+DO $$
+BEGIN
+    IF to_regclass('public.stroke_detection_debug_runs') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_stroke_debug_runs_user_id_id
+            ON public.stroke_detection_debug_runs(user_id, id);
+    END IF;
+END
+$$;
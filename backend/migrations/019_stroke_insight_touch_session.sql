@@ -0,0 +1,20 @@
+-- Bump sessions.updated_at when a stroke's AI insight is written.
+-- The stroke read endpoints derive their ETag from the session row, and
+-- insight generation otherwise only touches stroke_analytics, so clients
+-- polling during generation would keep revalidating against a stale tag.
+
+CREATE OR REPLACE FUNCTION public.stroke_analytics_touch_session()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE public.sessions SET updated_at = NOW() WHERE id = NEW.session_id;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS stroke_analytics_insight_touch_session ON stroke_analytics;
+CREATE TRIGGER stroke_analytics_insight_touch_session
+    AFTER UPDATE OF ai_insight, ai_insight_data ON stroke_analytics
+    FOR EACH ROW
+    EXECUTE FUNCTION public.stroke_analytics_touch_session();
@@ -0,0 +1,16 @@
+-- Player settings for stroke detection in one round trip.
+-- camera_facing lives on the session, handedness on the player linked to it
+-- through game_players; NULLs mean "use the API defaults".
+
+CREATE OR REPLACE FUNCTION public.get_player_settings(p_session_id UUID)
+RETURNS TABLE (handedness TEXT, camera_facing TEXT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT p.handedness::TEXT, s.camera_facing::TEXT
+    FROM public.sessions s
+    LEFT JOIN public.game_players gp ON gp.game_id = s.id
+    LEFT JOIN public.players p ON p.id = gp.player_id
+    WHERE s.id = p_session_id
+    LIMIT 1;
+$$;
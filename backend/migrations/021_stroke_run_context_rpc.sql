@@ -0,0 +1,27 @@
+-- Everything process_stroke_detection needs from the session before it loads
+-- pose data: the player settings from get_player_settings plus the trajectory,
+-- video path and owner. Replaces two sequential reads of the sessions row.
+
+CREATE OR REPLACE FUNCTION public.get_stroke_run_context(p_session_id UUID)
+RETURNS TABLE (
+    handedness TEXT,
+    camera_facing TEXT,
+    trajectory_data JSONB,
+    video_path TEXT,
+    user_id UUID
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        p.handedness::TEXT,
+        s.camera_facing::TEXT,
+        s.trajectory_data,
+        s.video_path::TEXT,
+        s.user_id
+    FROM public.sessions s
+    LEFT JOIN public.game_players gp ON gp.game_id = s.id
+    LEFT JOIN public.players p ON p.id = gp.player_id
+    WHERE s.id = p_session_id
+    LIMIT 1;
+$$;
@@ -0,0 +1,35 @@
+-- Store the player/opponent ownership check on each stroke.
+-- stroke_is_player() (migration 015) is IMMUTABLE, so it can back a generated
+-- column: it is evaluated once per insert or metrics update instead of once
+-- per row every time a session summary is recomputed.
+
+ALTER TABLE stroke_analytics
+    ADD COLUMN IF NOT EXISTS is_player_stroke BOOLEAN
+    GENERATED ALWAYS AS (public.stroke_is_player(metrics)) STORED;
+
+-- Summary aggregation only ever reads a session's player strokes.
+CREATE INDEX IF NOT EXISTS idx_stroke_analytics_session_player
+    ON stroke_analytics(session_id)
+    WHERE is_player_stroke;
+
+CREATE OR REPLACE FUNCTION public.get_stroke_summary(p_session_id UUID)
+RETURNS TABLE (
+    average_form_score DOUBLE PRECISION,
+    best_form_score DOUBLE PRECISION,
+    total_strokes BIGINT,
+    forehand_count BIGINT,
+    backhand_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        coalesce(avg(form_score), 0)::DOUBLE PRECISION,
+        coalesce(max(form_score), 0)::DOUBLE PRECISION,
+        count(*),
+        count(*) FILTER (WHERE stroke_type = 'forehand'),
+        count(*) FILTER (WHERE stroke_type = 'backhand')
+    FROM public.stroke_analytics
+    WHERE session_id = p_session_id
+      AND is_player_stroke;
+$$;
@@ -0,0 +1,35 @@
+-- Claim a session for stroke detection in one round trip: verify ownership,
+-- require a pose video or pose rows, and flip stroke_analysis_status to
+-- 'processing'. Returns 'started', 'not_found' or 'no_pose_data'.
+
+CREATE OR REPLACE FUNCTION public.start_stroke_analysis(p_session_id UUID, p_user_id UUID)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_pose_video_path TEXT;
+BEGIN
+    SELECT s.pose_video_path
+    INTO v_pose_video_path
+    FROM public.sessions s
+    WHERE s.id = p_session_id
+      AND s.user_id = p_user_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN 'not_found';
+    END IF;
+
+    IF v_pose_video_path IS NULL AND NOT EXISTS (
+        SELECT 1 FROM public.pose_analysis pa WHERE pa.session_id = p_session_id
+    ) THEN
+        RETURN 'no_pose_data';
+    END IF;
+
+    UPDATE public.sessions
+    SET stroke_analysis_status = 'processing'
+    WHERE id = p_session_id;
+
+    RETURN 'started';
+END;
+$$;
@@ -0,0 +1,16 @@
+-- Per-tournament matchup counts, aggregated in Postgres so list and detail
+-- endpoints read one row per tournament instead of every matchup row.
+-- security_invoker keeps the tournament_matchups RLS policies in force.
+
+CREATE INDEX IF NOT EXISTS idx_matchups_tournament_result
+    ON public.tournament_matchups(tournament_id, result);
+
+CREATE OR REPLACE VIEW public.tournament_stats
+WITH (security_invoker = true) AS
+SELECT
+    tournament_id,
+    COUNT(*)::INT AS matchup_count,
+    (COUNT(*) FILTER (WHERE result = 'win'))::INT AS win_count,
+    (COUNT(*) FILTER (WHERE result = 'loss'))::INT AS loss_count
+FROM public.tournament_matchups
+GROUP BY tournament_id;
@@ -0,0 +1,40 @@
+-- Global tournament/matchup counters for /tournaments/stats/summary in one
+-- row, instead of shipping every tournament and matchup row to the API.
+
+CREATE OR REPLACE FUNCTION public.tournament_stats_summary()
+RETURNS TABLE (
+    total_tournaments INT,
+    upcoming_tournaments INT,
+    completed_tournaments INT,
+    total_matchups INT,
+    wins INT,
+    losses INT,
+    pending_matchups INT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        t.total_tournaments,
+        t.upcoming_tournaments,
+        t.completed_tournaments,
+        m.total_matchups,
+        m.wins,
+        m.losses,
+        m.pending_matchups
+    FROM (
+        SELECT
+            COUNT(*)::INT AS total_tournaments,
+            (COUNT(*) FILTER (WHERE status IN ('upcoming', 'ongoing')))::INT AS upcoming_tournaments,
+            (COUNT(*) FILTER (WHERE status = 'completed'))::INT AS completed_tournaments
+        FROM public.tournaments
+    ) t
+    CROSS JOIN (
+        SELECT
+            COUNT(*)::INT AS total_matchups,
+            (COUNT(*) FILTER (WHERE result = 'win'))::INT AS wins,
+            (COUNT(*) FILTER (WHERE result = 'loss'))::INT AS losses,
+            (COUNT(*) FILTER (WHERE result = 'pending'))::INT AS pending_matchups
+        FROM public.tournament_matchups
+    ) m;
+$$;
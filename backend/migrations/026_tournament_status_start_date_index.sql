@@ -0,0 +1,6 @@
+-- The upcoming/past/status-filtered tournament lists filter on status and
+-- order by start_date; one composite index serves both directions.
+-- (tournament_matchups(tournament_id, result) was added in 024.)
+
+CREATE INDEX IF NOT EXISTS idx_tournaments_status_start_date
+    ON public.tournaments(status, start_date DESC);
@@ -0,0 +1,12 @@
+-- Tournament rows with their matchup counters attached, so the list endpoints
+-- read tournaments and counts in one request. Builds on tournament_stats (024).
+
+CREATE OR REPLACE VIEW public.v_tournaments_with_counts
+WITH (security_invoker = true) AS
+SELECT
+    t.*,
+    COALESCE(s.matchup_count, 0) AS matchup_count,
+    COALESCE(s.win_count, 0) AS win_count,
+    COALESCE(s.loss_count, 0) AS loss_count
+FROM public.tournaments t
+LEFT JOIN public.tournament_stats s ON s.tournament_id = t.id;
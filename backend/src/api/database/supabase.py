@@ -1,25 +1,61 @@
 import os
+import threading
 from typing import Optional
+import httpx
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 
 security = HTTPBearer()
 
 _supabase_client: Optional[Client] = None
+_supabase_http_client: Optional[httpx.Client] = None
+# Background tasks call get_supabase() from threadpool workers, so guard the
+# lazy init to make sure only one client (and one connection pool) is built.
+_supabase_client_lock = threading.Lock()
+
+
+def _build_http_client() -> httpx.Client:
+    """Shared keep-alive HTTP/2 client so PostgREST, Storage and Auth reuse one connection pool."""
+    return httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        timeout=httpx.Timeout(120.0, connect=10.0),
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+    )
+
+
+def _client_is_usable() -> bool:
+    # A closed pool (e.g. after shutdown in tests or a reload) would fail every
+    # request, so it counts as missing and gets rebuilt.
+    return _supabase_client is not None and _supabase_http_client is not None and not _supabase_http_client.is_closed
 
 
 def get_supabase() -> Client:
-    global _supabase_client
-    if _supabase_client is None:
-        url = os.getenv("SUPABASE_URL")
-        key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-        if not url or not key:
-            raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
-        _supabase_client = create_client(url, key)
+    global _supabase_client, _supabase_http_client
+    if _client_is_usable():
+        return _supabase_client
+    with _supabase_client_lock:
+        if not _client_is_usable():
+            url = os.getenv("SUPABASE_URL")
+            key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+            if not url or not key:
+                raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
+            _supabase_http_client = _build_http_client()
+            _supabase_client = create_client(url, key, options=ClientOptions(httpx_client=_supabase_http_client))
     return _supabase_client
 
 
+def close_supabase() -> None:
+    """Close the shared connection pool; the next get_supabase() builds a fresh client."""
+    global _supabase_client, _supabase_http_client
+    with _supabase_client_lock:
+        if _supabase_http_client is not None:
+            _supabase_http_client.close()
+        _supabase_client = None
+        _supabase_http_client = None
+
+
 async def get_current_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> str:
@@ -1,16 +1,31 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from dotenv import load_dotenv
 
 load_dotenv()
 
+from .database.supabase import close_supabase
 from .routes import sessions, sam2, sam3d, egox, pose, stroke, players, ai_chat, recordings, tournaments, analytics, videos, youtube_clips
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The Supabase client is built lazily on first use and its keep-alive
+    # pool is shared by every request; release the connections on shutdown.
+    yield
+    close_supabase()
+
+
 app = FastAPI(
     title="PROVISION API",
     description="AI-powered sports analysis backend",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
@@ -22,6 +37,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Stroke lists, summaries and pose frames are large, key-heavy JSON bodies.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 app.include_router(sessions.router, prefix="/api/sessions", tags=["sessions"])
 app.include_router(sam2.router, prefix="/api/sam2", tags=["sam2"])
@@ -1,22 +1,71 @@
-from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from typing import List, Optional, Dict, Any, Iterator, Mapping, Tuple
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+import asyncio
+import gzip
+import hashlib
+import heapq
+import itertools
+import logging
+import os
+import tempfile
 import traceback
-import json
+import threading
 import uuid
+import orjson
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from time import perf_counter
+from time import perf_counter, time_ns
+from types import MappingProxyType
+from functools import lru_cache
+from operator import attrgetter
+
+from cachetools import TTLCache
 
 from ..database.supabase import get_supabase, get_current_user_id
 from ..services.stroke_event_service import detect_strokes_hybrid
+from ..services.stroke_detector import Stroke
 from ..services.stroke_insight_service import generate_insights_for_session
 from ..services.stroke_debug_utils import debug_header, debug_info, debug_section_end
 
-router = APIRouter()
-STROKE_PROGRESS: Dict[str, Dict[str, Any]] = {}
-
+logger = logging.getLogger(__name__)
 
+router = APIRouter()
+# In-memory pipeline progress per session. Entries age out after an hour without
+# writes; _prune_stroke_progress drops finished runs sooner. Written from
+# background-task threads, so all access goes through _STROKE_PROGRESS_LOCK.
+STROKE_PROGRESS: "TTLCache[str, Dict[str, Any]]" = TTLCache(maxsize=512, ttl=3600)
+# Terminal entries carry the detector's full debug_stats. Past this size only the
+# stage keys the progress UI reads are kept; the full stats live on the debug run.
+_STROKE_PROGRESS_MAX_ENTRY_BYTES = 256 * 1024
+_STROKE_PROGRESS_DEBUG_KEYS = (
+    "phase",
+    "current_stage",
+    "stage_order",
+    "stage_labels",
+    "stage_statuses",
+    "stage_timings_ms",
+    "pipeline_elapsed_ms",
+    "use_claude_classifier",
+    "insights_progress",
+)
+_STROKE_PROGRESS_LOCK = threading.RLock()
+# Seeded from the clock so revisions (and progress ETags) don't repeat across restarts.
+_STROKE_PROGRESS_REVISIONS = itertools.count(time_ns() // 1_000_000)
+# Debug-log uploads and the failed-status session write run off the pipeline
+# thread so they overlap with the terminal debug-run write.
+_STROKE_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="stroke-write")
+# Rows per stroke_analytics insert; keeps long sessions under request size limits.
+_STROKE_INSERT_BATCH_SIZE = 500
+# Minimum spacing between debug_stats patches for "running" progress ticks.
+_DEBUG_RUN_PATCH_INTERVAL_S = 1.0
+
+
+# Progress entries keep their started_at/completed_at strings for the life of a
+# run, so every prune re-parses the same few hundred values.
+@lru_cache(maxsize=2048)
 def _parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value or not isinstance(value, str):
         return None
@@ -33,37 +82,131 @@ def _parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
 def _prune_stroke_progress() -> None:
     """
     Keep in-memory progress bounded. Drop stale completed/failed entries and cap map size.
+    Caller must hold _STROKE_PROGRESS_LOCK.
     """
     now = datetime.now(timezone.utc)
     stale_cutoff = now - timedelta(minutes=30)
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
 
+    # One pass: parse each entry's timestamp once, collect stale finished runs
+    # and keep the parsed value as the sort key for the size cap.
     stale_keys: List[str] = []
+    keyed: List[Tuple[datetime, str]] = []
     for session_id, progress in STROKE_PROGRESS.items():
-        status = progress.get("status")
-        if status not in {"completed", "failed"}:
-            continue
         ended_at = _parse_iso_datetime(progress.get("completed_at")) or _parse_iso_datetime(progress.get("started_at"))
-        if ended_at and ended_at < stale_cutoff:
+        if progress.get("status") in {"completed", "failed"} and ended_at and ended_at < stale_cutoff:
             stale_keys.append(session_id)
+        else:
+            keyed.append((ended_at or oldest, session_id))
 
     for key in stale_keys:
         STROKE_PROGRESS.pop(key, None)
 
     max_entries = 300
-    if len(STROKE_PROGRESS) <= max_entries:
+    overflow = len(keyed) - max_entries
+    if overflow <= 0:
         return
 
-    ordered = sorted(
-        STROKE_PROGRESS.items(),
-        key=lambda item: _parse_iso_datetime(item[1].get("completed_at"))
-        or _parse_iso_datetime(item[1].get("started_at"))
-        or datetime.min.replace(tzinfo=timezone.utc),
-    )
-    overflow = len(STROKE_PROGRESS) - max_entries
-    for session_id, _ in ordered[:overflow]:
+    # Overflow is usually a handful of entries; no need to order the rest.
+    for _, session_id in heapq.nsmallest(overflow, keyed, key=lambda item: item[0]):
         STROKE_PROGRESS.pop(session_id, None)
 
 
+def _cap_stroke_progress_entry(progress: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim an oversized terminal entry's debug_stats down to the stage keys."""
+    debug_stats = progress.get("debug_stats")
+    if not isinstance(debug_stats, dict):
+        return progress
+    if len(_dump_debug_json(debug_stats)) <= _STROKE_PROGRESS_MAX_ENTRY_BYTES:
+        return progress
+    trimmed = {key: debug_stats[key] for key in _STROKE_PROGRESS_DEBUG_KEYS if key in debug_stats}
+    trimmed["truncated"] = True
+    return {**progress, "debug_stats": trimmed}
+
+
+def _store_stroke_progress(session_id: str, progress: Dict[str, Any]) -> None:
+    # In-flight entries only hold the stage maps; size is checked once a run ends.
+    if progress.get("status") in {"completed", "failed"}:
+        progress = _cap_stroke_progress_entry(progress)
+    with _STROKE_PROGRESS_LOCK:
+        # Every store gets a new revision; the progress endpoint's ETag is
+        # derived from it so unchanged polls skip serialization.
+        progress["revision"] = next(_STROKE_PROGRESS_REVISIONS)
+        STROKE_PROGRESS[session_id] = progress
+        _prune_stroke_progress()
+
+
+def _get_stroke_progress(session_id: str) -> Optional[Dict[str, Any]]:
+    with _STROKE_PROGRESS_LOCK:
+        return STROKE_PROGRESS.get(session_id)
+
+
+def _snapshot_stroke_progress(progress: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the stage maps a running detection keeps mutating, before the entry is serialized."""
+    debug_stats = progress.get("debug_stats")
+    if not isinstance(debug_stats, dict):
+        return progress
+    snapshot = dict(debug_stats)
+    for key in ("stage_statuses", "stage_timings_ms"):
+        if isinstance(snapshot.get(key), dict):
+            snapshot[key] = dict(snapshot[key])
+    return {**progress, "debug_stats": snapshot}
+
+
+def _build_stage_order(classify_stage_id: str) -> Tuple[str, ...]:
+    return (
+        "load_session_metadata",
+        "load_pose_data",
+        "detect_pose_strokes",
+        "detect_trajectory_reversals",
+        "detect_contacts",
+        "merge_detection_events",
+        classify_stage_id,
+        "infer_hitter",
+        "build_final_strokes",
+        "persist_results",
+        "generate_insights",
+    )
+
+
+# Shared by every run and never mutated; unknown detector stages rebind a run-local copy.
+# Labels stay a plain dict since supabase-py's stdlib json cannot encode MappingProxyType.
+_STAGE_ORDER_CLAUDE = _build_stage_order("classify_events_claude")
+_STAGE_ORDER_ELBOW = _build_stage_order("classify_events_elbow")
+_STAGE_LABELS: Dict[str, str] = {
+    "load_session_metadata": "Load session metadata",
+    "load_pose_data": "Load pose frames",
+    "detect_pose_strokes": "Detect pose stroke proposals",
+    "detect_trajectory_reversals": "Detect trajectory reversals",
+    "detect_contacts": "Detect wrist-ball contacts",
+    "merge_detection_events": "Merge detection events",
+    "classify_events_claude": "Classify events (Claude)",
+    "classify_events_elbow": "Classify events (Elbow trend)",
+    "infer_hitter": "Infer hitter (player/opponent)",
+    "build_final_strokes": "Build final strokes",
+    "persist_results": "Persist stroke analytics",
+    "generate_insights": "Generate AI insights",
+}
+_INITIAL_STAGE_STATUSES_CLAUDE: Mapping[str, str] = MappingProxyType(dict.fromkeys(_STAGE_ORDER_CLAUDE, "pending"))
+_INITIAL_STAGE_STATUSES_ELBOW: Mapping[str, str] = MappingProxyType(dict.fromkeys(_STAGE_ORDER_ELBOW, "pending"))
+
+
+# pose_analysis columns read by the hybrid detector; id/session_id/created_at
+# are never used and would only add bytes to the largest read of a run.
+_POSE_FRAME_COLUMNS = "frame_number, timestamp, person_id, keypoints, joint_angles, body_metrics"
+
+# Player-only aggregates maintained on sessions by migration 016.
+_SESSION_SUMMARY_COLUMNS = (
+    "id, updated_at, stroke_summary, average_form_score, best_form_score, "
+    "total_strokes, forehand_count, backhand_count"
+)
+# Session columns feeding the stroke read ETags. Until migration 016 adds
+# sessions.total_strokes, an embedded stroke count stands in for it.
+_SESSION_ETAG_COLUMNS = "id, updated_at, total_strokes"
+_SESSION_ETAG_COLUMNS_PRE_016 = "id, updated_at, total_strokes:stroke_analytics(count)"
+_SESSION_SUMMARY_COLUMNS_PRE_016 = "id, updated_at, stroke_summary, total_strokes:stroke_analytics(count)"
+
+
 class StrokeResponse(BaseModel):
     id: str
     session_id: str
@@ -100,14 +243,197 @@ class StrokeSummaryResponse(BaseModel):
     timeline_tips: List[TimelineTipResponse] = []
 
 
+# The summary returns these columns verbatim instead of rebuilding StrokeResponse models.
+_STROKE_SUMMARY_COLUMNS = ", ".join(StrokeResponse.model_fields)
+
+
+def _is_player_stroke_row(row: Dict[str, Any]) -> bool:
+    """Python twin of stroke_is_player() (migration 015): opponent strokes count only below 0.75 confidence."""
+    metrics = row.get("metrics")
+    if not isinstance(metrics, dict):
+        return True
+
+    hitter = str(metrics.get("event_hitter") or "").strip().lower()
+    if hitter != "opponent":
+        return True
+
+    method = str(metrics.get("event_hitter_method") or "").strip().lower()
+    reason = str(metrics.get("event_hitter_reason") or "").strip().lower()
+    if method == "proximity_10_percent" and reason.startswith("player_outside_"):
+        return True
+
+    try:
+        confidence = float(metrics.get("event_hitter_confidence"))
+    except (TypeError, ValueError):
+        confidence = 0.0
+    return confidence < 0.75
+
+
+def _summarize_player_strokes(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """The migration 016 session aggregates, computed from stroke rows for pre-016 deployments."""
+    player_rows = [r for r in rows if _is_player_stroke_row(r)]
+    scores = [r.get("form_score") for r in player_rows if isinstance(r.get("form_score"), (int, float))]
+    return {
+        "average_form_score": (sum(scores) / len(scores)) if scores else 0,
+        "best_form_score": max(scores) if scores else 0,
+        "total_strokes": len(player_rows),
+        "forehand_count": sum(1 for r in player_rows if r.get("stroke_type") == "forehand"),
+        "backhand_count": sum(1 for r in player_rows if r.get("stroke_type") == "backhand"),
+    }
+
+
+def _timeline_tip_from_raw(raw_tip: Dict[str, Any], idx: int) -> Optional[Dict[str, Any]]:
+    """
+    Coerce a stored timeline tip to TimelineTipResponse's shape, or None if it is malformed.
+    Each key is read once; the dict goes into the response without a model round trip.
+    """
+    get = raw_tip.get
+    seek_time = get("seek_time")
+    try:
+        return {
+            "id": str(get("id") or f"timeline-{idx}"),
+            "timestamp": float(get("timestamp") or 0.0),
+            "duration": float(get("duration") or 2.0),
+            "title": str(get("title") or "Rally Snapshot")[:64],
+            "message": str(get("message") or "")[:220],
+            "seek_time": float(seek_time) if seek_time is not None else None,
+        }
+    except (TypeError, ValueError):
+        return None
+
+
+# /strokes projection: callers may pick any StrokeResponse column; by default the
+# heavy metrics and AI insight payloads are left out of the list view.
+_STROKE_LIST_FIELDS = frozenset(StrokeResponse.model_fields)
+_DEFAULT_STROKE_LIST_COLUMNS = (
+    "id, session_id, start_frame, end_frame, peak_frame, "
+    "stroke_type, duration, max_velocity, form_score"
+)
+
+
+# Short-lived cache of (etag, body) for the stroke read endpoints, keyed by
+# (session_id, endpoint, user_id, *params). The pipeline drops a session's
+# entries whenever it writes strokes or insights.
+_STROKE_READ_CACHE: "TTLCache[Tuple[Any, ...], Any]" = TTLCache(maxsize=4096, ttl=15)
+_STROKE_READ_LOCK = threading.Lock()
+
+
+# (session_id, user_id) pairs already confirmed by the progress endpoint's
+# ownership fallback, so clients polling before a run starts cost one lookup.
+_PROGRESS_OWNER_CACHE: "TTLCache[Tuple[str, str], bool]" = TTLCache(maxsize=4096, ttl=300)
+_PROGRESS_OWNER_LOCK = threading.Lock()
+
+
+def _get_cached_stroke_read(key: Tuple[Any, ...]) -> Any:
+    with _STROKE_READ_LOCK:
+        return _STROKE_READ_CACHE.get(key)
+
+
+def _set_cached_stroke_read(key: Tuple[Any, ...], value: Any) -> None:
+    with _STROKE_READ_LOCK:
+        _STROKE_READ_CACHE[key] = value
+
+
+def _invalidate_stroke_reads(session_id: str) -> None:
+    with _STROKE_READ_LOCK:
+        for key in [k for k in _STROKE_READ_CACHE.keys() if k[0] == session_id]:
+            _STROKE_READ_CACHE.pop(key, None)
+
+
+# Stroke reads revalidate on every request; unchanged data costs a 304 with no
+# body and, when the tag matches before the stroke query, no stroke fetch.
+_STROKE_READ_CACHE_CONTROL = "private, no-cache"
+
+
+def _stroke_read_etag(session_row: Dict[str, Any], *variant: Any) -> str:
+    """ETag from the session's updated_at (bumped by stroke/insight writes) and stroke count."""
+    raw = f"{session_row.get('id')}:{session_row.get('updated_at')}:{session_row.get('total_strokes')}:{variant}"
+    return f'"{hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _stroke_read_response(request: Request, etag: str, body: Dict[str, Any]) -> Response:
+    headers = {"ETag": etag, "Cache-Control": _STROKE_READ_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(body, headers=headers)
+
+
+def _require_session_owner(supabase, session_id: str, user_id: str) -> Dict[str, Any]:
+    """Return the session's id/updated_at/total_strokes, or raise 404 unless the user owns it."""
+    result = supabase.table("sessions")\
+        .select(_session_etag_columns(supabase))\
+        .eq("id", session_id)\
+        .eq("user_id", user_id)\
+        .limit(1)\
+        .execute()
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return result.data[0]
+
+
+# Signed debug-log URLs are valid for an hour; reuse them for 50 minutes.
+_SIGNED_LOG_URL_TTL_SECONDS = 3600
+_SIGNED_LOG_URL_CACHE: "TTLCache[str, str]" = TTLCache(maxsize=2048, ttl=3000)
+_SIGNED_LOG_URL_LOCK = threading.Lock()
+
+
+def _signed_debug_log_url(supabase, storage_path: str) -> Optional[str]:
+    with _SIGNED_LOG_URL_LOCK:
+        cached = _SIGNED_LOG_URL_CACHE.get(storage_path)
+    if cached:
+        return cached
+    try:
+        signed = supabase.storage.from_("provision-videos").create_signed_url(
+            storage_path, _SIGNED_LOG_URL_TTL_SECONDS
+        )
+    except Exception:
+        return None
+    if not isinstance(signed, dict):
+        return None
+    url = signed.get("signedURL") or signed.get("signed_url") or signed.get("signedUrl")
+    if url:
+        with _SIGNED_LOG_URL_LOCK:
+            _SIGNED_LOG_URL_CACHE[storage_path] = url
+    return url
+
+
 def _get_player_settings_for_session(supabase, session_id: str, session_data: dict = None) -> dict:
     """Look up handedness (from player) and camera_facing (from session)."""
     settings = {"handedness": "right", "camera_facing": "auto"}
+    try:
+        rpc_result = supabase.rpc("get_player_settings", {"p_session_id": session_id}).execute()
+        row = rpc_result.data[0] if rpc_result.data else {}
+        if row.get("camera_facing"):
+            settings["camera_facing"] = row["camera_facing"]
+        if row.get("handedness"):
+            settings["handedness"] = row["handedness"]
+    except Exception as exc:
+        if _is_missing_rpc_error(exc):
+            _load_player_settings_from_tables(supabase, session_id, settings, session_data)
 
-    # camera_facing lives on the session
     if session_data and session_data.get("camera_facing"):
         settings["camera_facing"] = session_data["camera_facing"]
-    else:
+
+    return settings
+
+
+def _load_player_settings_from_tables(
+    supabase,
+    session_id: str,
+    settings: Dict[str, str],
+    session_data: Optional[dict] = None,
+) -> None:
+    """Table-by-table lookup used until get_player_settings is deployed."""
+    # camera_facing lives on the session
+    if not (session_data and session_data.get("camera_facing")):
         try:
             sess = supabase.table("sessions").select("camera_facing").eq("id", session_id).single().execute()
             if sess.data and sess.data.get("camera_facing"):
@@ -125,22 +451,79 @@ def _get_player_settings_for_session(supabase, session_id: str, session_data: di
                 settings["handedness"] = player_result.data["handedness"]
     except Exception:
         pass
-    return settings
 
 
-def _serialize_stroke_for_debug(stroke: Any) -> Dict[str, Any]:
+def _load_stroke_run_context(supabase, session_id: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Session metadata and player settings for a detection run, in one round trip when possible."""
+    try:
+        rpc_result = supabase.rpc("get_stroke_run_context", {"p_session_id": session_id}).execute()
+    except Exception as exc:
+        if not _is_missing_rpc_error(exc):
+            raise
+        session_result = supabase.table("sessions")\
+            .select("trajectory_data, video_path, user_id, camera_facing")\
+            .eq("id", session_id)\
+            .single()\
+            .execute()
+        session_data = session_result.data or {}
+        return session_data, _get_player_settings_for_session(supabase, session_id, session_data)
+
+    session_data = rpc_result.data[0] if rpc_result.data else {}
+    settings = {
+        "handedness": session_data.get("handedness") or "right",
+        "camera_facing": session_data.get("camera_facing") or "auto",
+    }
+    return session_data, settings
+
+
+# Every Stroke field is always set, so one C-level getter reads them all.
+_stroke_debug_fields = attrgetter(
+    "start_frame", "end_frame", "peak_frame", "stroke_type",
+    "duration", "max_velocity", "form_score", "metrics",
+)
+
+
+def _serialize_stroke_for_debug(stroke: Stroke) -> Dict[str, Any]:
+    start_frame, end_frame, peak_frame, stroke_type, duration, max_velocity, form_score, metrics = (
+        _stroke_debug_fields(stroke)
+    )
     return {
-        "start_frame": int(getattr(stroke, "start_frame", 0)),
-        "end_frame": int(getattr(stroke, "end_frame", 0)),
-        "peak_frame": int(getattr(stroke, "peak_frame", 0)),
-        "stroke_type": str(getattr(stroke, "stroke_type", "unknown")),
-        "duration": float(getattr(stroke, "duration", 0.0)),
-        "max_velocity": float(getattr(stroke, "max_velocity", 0.0)),
-        "form_score": float(getattr(stroke, "form_score", 0.0)),
-        "metrics": getattr(stroke, "metrics", {}) or {},
+        "start_frame": int(start_frame),
+        "end_frame": int(end_frame),
+        "peak_frame": int(peak_frame),
+        "stroke_type": str(stroke_type),
+        "duration": float(duration),
+        "max_velocity": float(max_velocity),
+        "form_score": float(form_score),
+        "metrics": metrics or {},
     }
 
 
+def _json_default(value: Any) -> Any:
+    """orjson fallback for the few non-native values that end up in debug payloads."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+_DEBUG_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+# Debug logs with at least this many hybrid events are encoded to a temp file
+# and uploaded from it, so the full JSON never sits in memory next to the payload.
+_DEBUG_LOG_SPOOL_MIN_EVENTS = 500
+# Logs are stored gzipped (.json.gz); level 1 already shrinks the repetitive
+# event JSON several times over at a fraction of the default level's CPU.
+_DEBUG_LOG_GZIP_LEVEL = 1
+_DEBUG_LOG_FILE_OPTIONS = {"content-type": "application/gzip"}
+
+
+def _dump_debug_json(payload: Dict[str, Any], *, indent: bool = False) -> bytes:
+    """Encode a debug payload to UTF-8 JSON bytes (indented for files meant to be read by hand)."""
+    option = _DEBUG_JSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _DEBUG_JSON_OPTIONS
+    return orjson.dumps(payload, default=_json_default, option=option)
+
+
 def _upload_debug_log_to_storage(
     supabase,
     *,
@@ -152,16 +535,119 @@ def _upload_debug_log_to_storage(
     if not user_id:
         return {"ok": False, "reason": "missing_user_id", "path": None, "url": None}
 
-    storage_path = f"{user_id}/{session_id}/debug/stroke-analysis/{run_id}.json"
+    storage_path = f"{user_id}/{session_id}/debug/stroke-analysis/{run_id}.json.gz"
     try:
-        content = json.dumps(payload, ensure_ascii=True, default=str, indent=2).encode("utf-8")
-        supabase.storage.from_("provision-videos").upload(storage_path, content)
+        hybrid_events = (payload.get("hybrid_debug") or {}).get("events") or []
+        if len(hybrid_events) < _DEBUG_LOG_SPOOL_MIN_EVENTS:
+            supabase.storage.from_("provision-videos").upload(
+                storage_path,
+                gzip.compress(_dump_debug_json(payload), compresslevel=_DEBUG_LOG_GZIP_LEVEL),
+                dict(_DEBUG_LOG_FILE_OPTIONS),
+            )
+        else:
+            _upload_debug_log_from_spool(supabase, storage_path, payload)
         url = supabase.storage.from_("provision-videos").get_public_url(storage_path)
         return {"ok": True, "reason": "ok", "path": storage_path, "url": url}
     except Exception as exc:
         return {"ok": False, "reason": str(exc), "path": storage_path, "url": None}
 
 
+def _write_debug_json(fh, value: Any, depth: int = 2) -> None:
+    """Encode value into fh, emitting the top `depth` levels of dicts key by key."""
+    if depth <= 0 or not isinstance(value, dict):
+        fh.write(orjson.dumps(value, default=_json_default, option=_DEBUG_JSON_OPTIONS))
+        return
+    fh.write(b"{")
+    for index, (key, item) in enumerate(value.items()):
+        if index:
+            fh.write(b",")
+        fh.write(orjson.dumps(key if isinstance(key, str) else str(key)))
+        fh.write(b":")
+        _write_debug_json(fh, item, depth - 1)
+    fh.write(b"}")
+
+
+def _upload_debug_log_from_spool(supabase, storage_path: str, payload: Dict[str, Any]) -> None:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".json.gz") as spool:
+        spool_path = spool.name
+        with gzip.GzipFile(fileobj=spool, mode="wb", compresslevel=_DEBUG_LOG_GZIP_LEVEL) as gz:
+            _write_debug_json(gz, payload)
+    try:
+        # storage3 streams an open binary reader into the multipart body.
+        with open(spool_path, "rb") as fh:
+            supabase.storage.from_("provision-videos").upload(storage_path, fh, dict(_DEBUG_LOG_FILE_OPTIONS))
+    finally:
+        os.unlink(spool_path)
+
+
+# stroke_detection_debug_runs is optional (created outside the migrations).
+# Remember whether it exists for 10 minutes so deployments without it skip a
+# guaranteed-to-fail round trip, while a later migration is still picked up.
+_DEBUG_RUNS_TABLE = "stroke_detection_debug_runs"
+_DEBUG_RUNS_TABLE_PROBE: "TTLCache[str, bool]" = TTLCache(maxsize=1, ttl=600)
+_DEBUG_RUNS_TABLE_PROBE_LOCK = threading.Lock()
+# Same probe for migration 016's summary columns on sessions.
+_SESSION_SUMMARY_COLUMNS_PROBE: "TTLCache[str, bool]" = TTLCache(maxsize=1, ttl=600)
+_SESSION_SUMMARY_COLUMNS_PROBE_LOCK = threading.Lock()
+
+
+def _is_missing_table_error(exc: Exception) -> bool:
+    code = str(getattr(exc, "code", "") or "").upper()
+    if code in {"42P01", "PGRST205"}:
+        return True
+    msg = str(exc).lower()
+    return "does not exist" in msg or "could not find the table" in msg
+
+
+def _is_missing_column_error(exc: Exception) -> bool:
+    code = str(getattr(exc, "code", "") or "").upper()
+    if code == "42703":
+        return True
+    msg = str(exc).lower()
+    return "column" in msg and "does not exist" in msg
+
+
+def _session_summary_columns_exist(supabase) -> bool:
+    """Whether migration 016's summary columns are on sessions; re-probed like the debug-runs table."""
+    with _SESSION_SUMMARY_COLUMNS_PROBE_LOCK:
+        cached = _SESSION_SUMMARY_COLUMNS_PROBE.get("sessions")
+    if cached is not None:
+        return cached
+    try:
+        supabase.table("sessions").select("total_strokes").limit(1).execute()
+        exists = True
+    except Exception as exc:
+        if not _is_missing_column_error(exc):
+            # Unknown failure: don't cache, let the real query surface it.
+            return True
+        exists = False
+    with _SESSION_SUMMARY_COLUMNS_PROBE_LOCK:
+        _SESSION_SUMMARY_COLUMNS_PROBE["sessions"] = exists
+    return exists
+
+
+def _session_etag_columns(supabase) -> str:
+    return _SESSION_ETAG_COLUMNS if _session_summary_columns_exist(supabase) else _SESSION_ETAG_COLUMNS_PRE_016
+
+
+def _debug_runs_table_exists(supabase) -> bool:
+    with _DEBUG_RUNS_TABLE_PROBE_LOCK:
+        cached = _DEBUG_RUNS_TABLE_PROBE.get(_DEBUG_RUNS_TABLE)
+    if cached is not None:
+        return cached
+    try:
+        supabase.table(_DEBUG_RUNS_TABLE).select("id").limit(1).execute()
+        exists = True
+    except Exception as exc:
+        if not _is_missing_table_error(exc):
+            # Unknown failure: don't cache, let the real query surface it.
+            return True
+        exists = False
+    with _DEBUG_RUNS_TABLE_PROBE_LOCK:
+        _DEBUG_RUNS_TABLE_PROBE[_DEBUG_RUNS_TABLE] = exists
+    return exists
+
+
 def _insert_or_update_debug_run(
     supabase,
     *,
@@ -170,7 +656,7 @@ def _insert_or_update_debug_run(
     user_id: Optional[str],
     payload: Dict[str, Any],
 ) -> bool:
-    if not user_id:
+    if not user_id or not _debug_runs_table_exists(supabase):
         return False
     try:
         row = {
@@ -179,15 +665,112 @@ def _insert_or_update_debug_run(
             "user_id": user_id,
             **payload,
         }
-        supabase.table("stroke_detection_debug_runs").upsert(row, on_conflict="id").execute()
+        supabase.table(_DEBUG_RUNS_TABLE).upsert(row, on_conflict="id").execute()
         return True
     except Exception as exc:
-        print(f"[StrokeDetection] Debug run DB write skipped: {exc}")
+        logger.warning("Debug run DB write skipped: %s", exc)
         return False
 
 
+def _patch_debug_run(
+    supabase,
+    *,
+    run_id: str,
+    patch: Dict[str, Any],
+) -> bool:
+    """Update only the given columns of an existing debug run row."""
+    try:
+        supabase.table(_DEBUG_RUNS_TABLE).update(patch).eq("id", run_id).execute()
+        return True
+    except Exception as exc:
+        logger.warning("Debug run DB patch skipped: %s", exc)
+        return False
+
+
+def _submit_debug_log_upload(
+    supabase,
+    *,
+    user_id: Optional[str],
+    session_id: str,
+    run_id: str,
+    payload: Dict[str, Any],
+) -> "Future[Dict[str, Any]]":
+    return _STROKE_WRITE_EXECUTOR.submit(
+        _upload_debug_log_to_storage,
+        supabase,
+        user_id=user_id,
+        session_id=session_id,
+        run_id=run_id,
+        payload=payload,
+    )
+
+
+def _submit_session_failed_status(supabase, session_id: str) -> Future:
+    return _STROKE_WRITE_EXECUTOR.submit(
+        lambda: supabase.table("sessions").update({
+            "stroke_analysis_status": "failed"
+        }).eq("id", session_id).execute()
+    )
+
+
+def _wait_session_failed_status(status_write: Future, session_id: str) -> None:
+    """Wait for the 'failed' status write; a failure is logged since the run is already finalized."""
+    try:
+        status_write.result()
+    except Exception as exc:
+        logger.error("Failed to mark session %s as failed; it may stay in processing: %s", session_id, exc)
+
+
+def _patch_storage_pointers_when_done(
+    supabase,
+    *,
+    session_id: str,
+    run_id: str,
+    upload_future: "Future[Dict[str, Any]]",
+    row_written: bool,
+) -> None:
+    """Copy the upload's storage pointers onto the run row once the upload finishes.
+
+    Register this only after the terminal upsert so the patch always lands last,
+    passing that upsert's result; nothing is registered when no row was written.
+    """
+    if not row_written:
+        return
+
+    def _on_done(future: "Future[Dict[str, Any]]") -> None:
+        try:
+            upload_result = future.result()
+        except Exception as exc:
+            logger.warning("Debug log upload failed: %s", exc)
+            return
+        if not upload_result.get("path") and not upload_result.get("url"):
+            return
+        _patch_debug_run(
+            supabase,
+            run_id=run_id,
+            patch={
+                "storage_path": upload_result.get("path"),
+                "storage_url": upload_result.get("url"),
+            },
+        )
+        _invalidate_stroke_reads(session_id)
+
+    upload_future.add_done_callback(_on_done)
+
+
+_LOCAL_SHOT_LOG_DIR = Path(__file__).resolve().parents[1] / "services" / "stroke_run_logs"
+
+
+def _local_shot_label_log_path(session_id: str, run_id: str) -> Path:
+    """backend/src/api/services/stroke_run_logs/stroke_labels_<timestamp>_<session>_<run>.json"""
+    now = datetime.now(timezone.utc)
+    timestamp = f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    return _LOCAL_SHOT_LOG_DIR / f"stroke_labels_{timestamp}_{session_id}_{run_id}.json"
+
+
 def _write_local_shot_label_log(
     *,
+    output_path: Path,
     session_id: str,
     run_id: str,
     started_at: str,
@@ -198,25 +781,25 @@ def _write_local_shot_label_log(
 ) -> Optional[str]:
     """
     Persist one local JSON file per stroke-detection run with per-shot labeling details.
-
-    File location:
-    backend/src/api/services/stroke_run_logs/stroke_labels_<timestamp>_<session>_<run>.json
     """
     try:
-        logs_dir = Path(__file__).resolve().parents[1] / "services" / "stroke_run_logs"
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        output_path = logs_dir / f"stroke_labels_{timestamp}_{session_id}_{run_id}.json"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
         event_logs = hybrid_debug_payload.get("events", []) if isinstance(hybrid_debug_payload, dict) else []
-        events_by_frame: Dict[int, List[Dict[str, Any]]] = {}
+        # First event per frame, and per (frame, classified label), so each shot
+        # resolves its event with two dict lookups.
+        first_event_by_frame: Dict[int, Dict[str, Any]] = {}
+        first_event_by_frame_label: Dict[Tuple[int, str], Dict[str, Any]] = {}
         for event in event_logs:
             if not isinstance(event, dict):
                 continue
             frame = event.get("frame")
             if not isinstance(frame, int):
                 continue
-            events_by_frame.setdefault(frame, []).append(event)
+            first_event_by_frame.setdefault(frame, event)
+            cls = event.get("classification")
+            cls_label = str((cls or {}).get("label") or "").strip().lower() if isinstance(cls, dict) else ""
+            first_event_by_frame_label.setdefault((frame, cls_label), event)
 
         hitter_by_hitter: Dict[str, int] = {}
         hitter_by_method: Dict[str, int] = {}
@@ -248,16 +831,10 @@ def _write_local_shot_label_log(
             except Exception:
                 event_frame = int(stroke.get("peak_frame", 0) or 0)
 
-            matching_events = events_by_frame.get(event_frame, [])
-            matched_event = None
-            for candidate in matching_events:
-                cls = candidate.get("classification") if isinstance(candidate, dict) else None
-                cls_label = str((cls or {}).get("label") or "").strip().lower()
-                if cls_label == label:
-                    matched_event = candidate
-                    break
-            if matched_event is None and matching_events:
-                matched_event = matching_events[0]
+            matched_event = (
+                first_event_by_frame_label.get((event_frame, label))
+                or first_event_by_frame.get(event_frame)
+            )
 
             classification = (
                 matched_event.get("classification")
@@ -335,13 +912,10 @@ def _write_local_shot_label_log(
             "shots": shots,
         }
 
-        output_path.write_text(
-            json.dumps(payload, ensure_ascii=True, default=str, indent=2),
-            encoding="utf-8",
-        )
+        output_path.write_bytes(_dump_debug_json(payload, indent=True))
         return str(output_path)
     except Exception as exc:
-        print(f"[StrokeDetection] Failed to write local shot label log: {exc}")
+        logger.warning("Failed to write local shot label log: %s", exc)
         return None
 
 
@@ -359,19 +933,50 @@ def process_stroke_detection(
     run_started_at = datetime.now(timezone.utc).isoformat()
     session_owner_id: Optional[str] = owner_user_id
 
+    # Stage state and the in-memory progress writer exist before anything can
+    # fail, so the error handler below can always report them.
+    stage_order = _STAGE_ORDER_CLAUDE if use_claude_classifier else _STAGE_ORDER_ELBOW
+    stage_labels = _STAGE_LABELS
+    stage_statuses: Dict[str, str] = dict(
+        _INITIAL_STAGE_STATUSES_CLAUDE if use_claude_classifier else _INITIAL_STAGE_STATUSES_ELBOW
+    )
+    stage_timings_ms: Dict[str, float] = {}
+    pipeline_elapsed_ms = 0.0
+    active_stage: Optional[str] = None
+    debug_run_row_written = False
+    last_debug_write_at = 0.0
+
+    def _set_in_memory_progress(
+        status: str,
+        debug_stats: Dict[str, Any],
+        *,
+        completed_at: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        payload: Dict[str, Any] = {
+            "run_id": run_id,
+            "session_id": session_id,
+            "user_id": session_owner_id,
+            "status": status,
+            "started_at": run_started_at,
+            "use_claude_classifier": bool(use_claude_classifier),
+            "debug_stats": debug_stats,
+        }
+        if completed_at:
+            payload["completed_at"] = completed_at
+        if error:
+            payload["error"] = error
+        _store_stroke_progress(session_id, payload)
+
     try:
-        print(f"\n{'*'*80}")
-        print(f"{'*'*80}")
-        print(f"[STROKE DETECTION] 🚀 BACKGROUND TASK STARTED")
-        print(f"[STROKE DETECTION]    Session ID: {session_id}")
-        print(f"[STROKE DETECTION]    Run ID: {run_id}")
-        print(f"[STROKE DETECTION]    Started at: {run_started_at}")
-        print(f"{'*'*80}")
-        print(f"{'*'*80}\n")
-
-        # Determine player handedness and camera facing
+        logger.info("Stroke detection started session=%s run=%s started_at=%s", session_id, run_id, run_started_at)
+
+        # Session metadata (debug logging, Claude frame extraction) and player
+        # handedness / camera facing come back together.
         debug_info("⚙️ LOADING PLAYER SETTINGS")
-        player_settings = _get_player_settings_for_session(supabase, session_id)
+        session_meta_started = perf_counter()
+        session_data, player_settings = _load_stroke_run_context(supabase, session_id)
+        session_meta_elapsed_ms = (perf_counter() - session_meta_started) * 1000.0
         handedness = player_settings["handedness"]
         camera_facing = player_settings["camera_facing"]
 
@@ -380,70 +985,23 @@ def process_stroke_detection(
                          Camera_Facing=camera_facing.upper(),
                          Use_Claude=use_claude_classifier)
 
-        classify_stage_id = "classify_events_claude" if use_claude_classifier else "classify_events_elbow"
-        stage_order = [
-            "load_session_metadata",
-            "load_pose_data",
-            "detect_pose_strokes",
-            "detect_trajectory_reversals",
-            "detect_contacts",
-            "merge_detection_events",
-            classify_stage_id,
-            "infer_hitter",
-            "build_final_strokes",
-            "persist_results",
-            "generate_insights",
-        ]
-        stage_labels = {
-            "load_session_metadata": "Load session metadata",
-            "load_pose_data": "Load pose frames",
-            "detect_pose_strokes": "Detect pose stroke proposals",
-            "detect_trajectory_reversals": "Detect trajectory reversals",
-            "detect_contacts": "Detect wrist-ball contacts",
-            "merge_detection_events": "Merge detection events",
-            "classify_events_claude": "Classify events (Claude)",
-            "classify_events_elbow": "Classify events (Elbow trend)",
-            "infer_hitter": "Infer hitter (player/opponent)",
-            "build_final_strokes": "Build final strokes",
-            "persist_results": "Persist stroke analytics",
-            "generate_insights": "Generate AI insights",
-        }
-        stage_statuses: Dict[str, str] = {stage_id: "pending" for stage_id in stage_order}
-        stage_timings_ms: Dict[str, float] = {}
-        active_stage: Optional[str] = None
-
-        def _set_in_memory_progress(
-            status: str,
-            debug_stats: Dict[str, Any],
-            *,
-            completed_at: Optional[str] = None,
-            error: Optional[str] = None,
-        ) -> None:
-            payload: Dict[str, Any] = {
-                "run_id": run_id,
-                "session_id": session_id,
-                "user_id": session_owner_id,
-                "status": status,
-                "started_at": run_started_at,
-                "use_claude_classifier": bool(use_claude_classifier),
-                "debug_stats": debug_stats,
-            }
-            if completed_at:
-                payload["completed_at"] = completed_at
-            if error:
-                payload["error"] = error
-            STROKE_PROGRESS[session_id] = payload
-            _prune_stroke_progress()
+        def _record_stage_timing(stage_id: str, duration_ms: float) -> None:
+            nonlocal pipeline_elapsed_ms
+            rounded = round(float(duration_ms), 1)
+            pipeline_elapsed_ms += rounded - stage_timings_ms.get(stage_id, 0.0)
+            stage_timings_ms[stage_id] = rounded
 
         def _processing_debug_stats(extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            # References the live stage maps; the progress endpoint snapshots
+            # them when it serves the in-memory entry.
             payload: Dict[str, Any] = {
                 "phase": "processing",
                 "current_stage": active_stage,
                 "stage_order": stage_order,
                 "stage_labels": stage_labels,
-                "stage_statuses": dict(stage_statuses),
-                "stage_timings_ms": dict(stage_timings_ms),
-                "pipeline_elapsed_ms": round(sum(stage_timings_ms.values()), 1),
+                "stage_statuses": stage_statuses,
+                "stage_timings_ms": stage_timings_ms,
+                "pipeline_elapsed_ms": round(pipeline_elapsed_ms, 1),
                 "use_claude_classifier": bool(use_claude_classifier),
             }
             if extra:
@@ -456,14 +1014,14 @@ def process_stroke_detection(
             duration_ms: Optional[float] = None,
             extra_debug: Optional[Dict[str, Any]] = None,
         ) -> None:
-            nonlocal active_stage
+            nonlocal active_stage, debug_run_row_written, stage_order, last_debug_write_at
             if stage_id:
                 if stage_id not in stage_statuses:
                     stage_statuses[stage_id] = "pending"
-                    stage_order.append(stage_id)
+                    stage_order = (*stage_order, stage_id)
                 stage_statuses[stage_id] = status
             if isinstance(duration_ms, (int, float)):
-                stage_timings_ms[stage_id] = round(float(duration_ms), 1)
+                _record_stage_timing(stage_id, duration_ms)
             if status == "running":
                 active_stage = stage_id
             elif active_stage == stage_id and status in {"completed", "failed"}:
@@ -472,7 +1030,19 @@ def process_stroke_detection(
             current_debug_stats = _processing_debug_stats(extra_debug)
             _set_in_memory_progress("processing", current_debug_stats)
 
-            _insert_or_update_debug_run(
+            # The first write inserts the full row; later ticks only change debug_stats.
+            # "running" ticks are coalesced to one patch per interval since the
+            # progress endpoint serves the in-memory entry, and _finalize_run
+            # always writes the final stats.
+            now = perf_counter()
+            if debug_run_row_written:
+                if status == "running" and now - last_debug_write_at < _DEBUG_RUN_PATCH_INTERVAL_S:
+                    return
+                last_debug_write_at = now
+                _patch_debug_run(supabase, run_id=run_id, patch={"debug_stats": current_debug_stats})
+                return
+            last_debug_write_at = now
+            debug_run_row_written = _insert_or_update_debug_run(
                 supabase,
                 run_id=run_id,
                 session_id=session_id,
@@ -489,23 +1059,63 @@ def process_stroke_detection(
                 },
             )
 
-        # Session metadata needed for debug logging and Claude frame extraction
-        _update_progress_stage("load_session_metadata", "running")
-        session_meta_started = perf_counter()
-        session_result = supabase.table("sessions")\
-            .select("trajectory_data, video_path, user_id")\
-            .eq("id", session_id)\
-            .single()\
-            .execute()
-        session_meta_elapsed_ms = (perf_counter() - session_meta_started) * 1000.0
+        def _finalize_run(
+            status: str,
+            error: Optional[str],
+            storage_payload: Optional[Dict[str, Any]],
+            *,
+            completed_at: str,
+            debug_stats: Dict[str, Any],
+            event_logs: Optional[List[Any]] = None,
+            final_strokes: Optional[List[Dict[str, Any]]] = None,
+        ) -> None:
+            # Terminal write for the run: a single upsert carrying the final stats
+            # and error. The Storage upload (if any) runs alongside it and its
+            # pointers are patched onto the row when it lands.
+            _set_in_memory_progress(status, debug_stats, completed_at=completed_at, error=error)
+            upload_future = None
+            if storage_payload is not None and session_owner_id:
+                upload_future = _submit_debug_log_upload(
+                    supabase,
+                    user_id=session_owner_id,
+                    session_id=session_id,
+                    run_id=run_id,
+                    payload=storage_payload,
+                )
+            payload: Dict[str, Any] = {
+                "status": status,
+                "started_at": run_started_at,
+                "completed_at": completed_at,
+                "handedness": handedness,
+                "camera_facing": camera_facing,
+                "use_claude_classifier": use_claude_classifier,
+                "debug_stats": debug_stats,
+                "event_logs": event_logs or [],
+                "final_strokes": final_strokes or [],
+            }
+            if error:
+                payload["error"] = error
+            row_written = _insert_or_update_debug_run(
+                supabase,
+                run_id=run_id,
+                session_id=session_id,
+                user_id=session_owner_id,
+                payload=payload,
+            )
+            _invalidate_stroke_reads(session_id)
+            if upload_future is not None:
+                _patch_storage_pointers_when_done(
+                    supabase,
+                    session_id=session_id,
+                    run_id=run_id,
+                    upload_future=upload_future,
+                    row_written=row_written,
+                )
 
-        trajectory_data = {}
-        video_url = None
-        if session_result.data:
-            traj = session_result.data.get("trajectory_data")
-            trajectory_data = traj if isinstance(traj, dict) else {}
-            video_url = session_result.data.get("video_path")
-            session_owner_id = session_result.data.get("user_id") or session_owner_id
+        traj = session_data.get("trajectory_data")
+        trajectory_data = traj if isinstance(traj, dict) else {}
+        video_url = session_data.get("video_path")
+        session_owner_id = session_data.get("user_id") or session_owner_id
         _update_progress_stage(
             "load_session_metadata",
             "completed",
@@ -516,66 +1126,36 @@ def process_stroke_detection(
             },
         )
 
+        def _fail_pose_load(reason: str, elapsed_ms: float) -> None:
+            nonlocal active_stage
+            stage_statuses["load_pose_data"] = "failed"
+            _record_stage_timing("load_pose_data", elapsed_ms)
+            active_stage = None
+            status_write = _submit_session_failed_status(supabase, session_id)
+            # Nothing to debug on an empty session, so skip the Storage log.
+            _finalize_run(
+                "failed",
+                reason,
+                None,
+                completed_at=datetime.now(timezone.utc).isoformat(),
+                debug_stats=_processing_debug_stats({"phase": "failed", "error": reason}),
+            )
+            _wait_session_failed_status(status_write, session_id)
+
         # Get pose analysis for tracked players (person_id 0=player, 1=opponent).
         # We need both for hitter inference; player-only rows are filtered below.
         _update_progress_stage("load_pose_data", "running")
         pose_load_started = perf_counter()
         pose_result = supabase.table("pose_analysis")\
-            .select("*")\
+            .select(_POSE_FRAME_COLUMNS)\
             .eq("session_id", session_id)\
             .order("timestamp")\
             .execute()
         pose_load_elapsed_ms = (perf_counter() - pose_load_started) * 1000.0
 
         if not pose_result.data or len(pose_result.data) == 0:
-            _update_progress_stage(
-                "load_pose_data",
-                "failed",
-                duration_ms=pose_load_elapsed_ms,
-                extra_debug={"error": "no_pose_data"},
-            )
-            print(f"[StrokeDetection] No pose data found for session: {session_id}")
-            failed_at = datetime.now(timezone.utc).isoformat()
-            # Mark analysis as failed
-            supabase.table("sessions").update({
-                "stroke_analysis_status": "failed"
-            }).eq("id", session_id).execute()
-            empty_payload = {
-                "run_id": run_id,
-                "session_id": session_id,
-                "user_id": session_owner_id,
-                "status": "failed",
-                "started_at": run_started_at,
-                "completed_at": failed_at,
-                "error": "no_pose_data",
-            }
-            upload_result = _upload_debug_log_to_storage(
-                supabase,
-                user_id=session_owner_id,
-                session_id=session_id,
-                run_id=run_id,
-                payload=empty_payload,
-            )
-            _insert_or_update_debug_run(
-                supabase,
-                run_id=run_id,
-                session_id=session_id,
-                user_id=session_owner_id,
-                payload={
-                    "status": "failed",
-                    "started_at": run_started_at,
-                    "completed_at": failed_at,
-                    "handedness": handedness,
-                    "camera_facing": camera_facing,
-                    "use_claude_classifier": use_claude_classifier,
-                    "debug_stats": _processing_debug_stats({"phase": "failed", "error": "no_pose_data"}),
-                    "event_logs": [],
-                    "final_strokes": [],
-                    "storage_path": upload_result.get("path"),
-                    "storage_url": upload_result.get("url"),
-                    "error": "no_pose_data",
-                },
-            )
+            logger.info("No pose data found for session: %s", session_id)
+            _fail_pose_load("no_pose_data", pose_load_elapsed_ms)
             return
 
         pose_frames_all = pose_result.data
@@ -598,72 +1178,42 @@ def process_stroke_detection(
                 },
             )
         if len(pose_frames) == 0:
-            _update_progress_stage(
-                "load_pose_data",
-                "failed",
-                duration_ms=pose_load_elapsed_ms,
-                extra_debug={"error": "no_player_pose_data"},
-            )
-            print(f"[StrokeDetection] No player pose data (person_id=0) found for session: {session_id}")
-            failed_at = datetime.now(timezone.utc).isoformat()
-            # Mark analysis as failed
-            supabase.table("sessions").update({
-                "stroke_analysis_status": "failed"
-            }).eq("id", session_id).execute()
-            empty_payload = {
-                "run_id": run_id,
-                "session_id": session_id,
-                "user_id": session_owner_id,
-                "status": "failed",
-                "started_at": run_started_at,
-                "completed_at": failed_at,
-                "error": "no_player_pose_data",
-            }
-            upload_result = _upload_debug_log_to_storage(
-                supabase,
-                user_id=session_owner_id,
-                session_id=session_id,
-                run_id=run_id,
-                payload=empty_payload,
-            )
-            _insert_or_update_debug_run(
-                supabase,
-                run_id=run_id,
-                session_id=session_id,
-                user_id=session_owner_id,
-                payload={
-                    "status": "failed",
-                    "started_at": run_started_at,
-                    "completed_at": failed_at,
-                    "handedness": handedness,
-                    "camera_facing": camera_facing,
-                    "use_claude_classifier": use_claude_classifier,
-                    "debug_stats": _processing_debug_stats({"phase": "failed", "error": "no_player_pose_data"}),
-                    "event_logs": [],
-                    "final_strokes": [],
-                    "storage_path": upload_result.get("path"),
-                    "storage_url": upload_result.get("url"),
-                    "error": "no_player_pose_data",
-                },
-            )
+            logger.info("No player pose data (person_id=0) found for session: %s", session_id)
+            _fail_pose_load("no_player_pose_data", pose_load_elapsed_ms)
             return
 
         def _on_hybrid_progress(update: Dict[str, Any]) -> None:
+            nonlocal stage_labels
             stage_id = str(update.get("stage_id") or "")
             status = str(update.get("status") or "running")
             duration_ms_raw = update.get("duration_ms")
             duration_ms = float(duration_ms_raw) if isinstance(duration_ms_raw, (int, float)) else None
 
+            timings_changed = False
             stage_timings_from_update = update.get("stage_timings_ms")
             if isinstance(stage_timings_from_update, dict):
                 for key, val in stage_timings_from_update.items():
                     if isinstance(val, (int, float)):
-                        stage_timings_ms[str(key)] = round(float(val), 1)
-                        stage_statuses[str(key)] = "completed"
+                        key = str(key)
+                        if stage_timings_ms.get(key) != round(float(val), 1) or stage_statuses.get(key) != "completed":
+                            _record_stage_timing(key, val)
+                            stage_statuses[key] = "completed"
+                            timings_changed = True
+
+            # Repeat "still running" notifications carry nothing new.
+            if (
+                not timings_changed
+                and duration_ms is None
+                and status == "running"
+                and active_stage == stage_id
+                and stage_statuses.get(stage_id) == "running"
+            ):
+                return
 
             if stage_id:
                 if stage_id not in stage_labels:
-                    stage_labels[stage_id] = stage_id.replace("_", " ").title()
+                    # Copy before adding so the shared module-level labels stay untouched.
+                    stage_labels = {**stage_labels, stage_id: stage_id.replace("_", " ").title()}
                 _update_progress_stage(stage_id, status, duration_ms=duration_ms)
 
         # Hybrid detection:
@@ -687,9 +1237,9 @@ def process_stroke_detection(
         # Delete existing stroke analytics for this session
         supabase.table("stroke_analytics").delete().eq("session_id", session_id).execute()
 
-        # Store each stroke in database
-        for stroke in strokes:
-            supabase.table("stroke_analytics").insert({
+        # Store strokes with multi-row inserts, _STROKE_INSERT_BATCH_SIZE rows per request
+        stroke_rows = [
+            {
                 "session_id": session_id,
                 "start_frame": stroke.start_frame,
                 "end_frame": stroke.end_frame,
@@ -699,7 +1249,13 @@ def process_stroke_detection(
                 "max_velocity": stroke.max_velocity,
                 "form_score": stroke.form_score,
                 "metrics": stroke.metrics
-            }).execute()
+            }
+            for stroke in strokes
+        ]
+        for batch_start in range(0, len(stroke_rows), _STROKE_INSERT_BATCH_SIZE):
+            supabase.table("stroke_analytics")\
+                .insert(stroke_rows[batch_start:batch_start + _STROKE_INSERT_BATCH_SIZE])\
+                .execute()
 
         # Calculate overall statistics
         summary = detector.calculate_overall_form_score(strokes)
@@ -709,6 +1265,7 @@ def process_stroke_detection(
             "stroke_summary": summary,
             "stroke_analysis_status": "completed",
         }).eq("id", session_id).execute()
+        _invalidate_stroke_reads(session_id)
 
         persist_elapsed_ms = (perf_counter() - persist_started) * 1000.0
         _update_progress_stage(
@@ -727,6 +1284,8 @@ def process_stroke_detection(
             }).eq("id", session_id).execute()
 
             def _insight_progress(update: Dict[str, Any]) -> None:
+                # Each tick follows a stroke insight write.
+                _invalidate_stroke_reads(session_id)
                 insights_prog = update.get("insights_progress")
                 _update_progress_stage(
                     "generate_insights",
@@ -781,11 +1340,15 @@ def process_stroke_detection(
                         "insights_total": insight_result.get("total", 0),
                     },
                 )
-                print(f"[StrokeDetection] AI insights: {insight_result.get('completed', 0)}/{insight_result.get('total', 0)} completed")
+                logger.info(
+                    "AI insights: %s/%s completed",
+                    insight_result.get("completed", 0),
+                    insight_result.get("total", 0),
+                )
 
         except Exception as insight_exc:
             insight_elapsed_ms = (perf_counter() - insight_started) * 1000.0
-            print(f"[StrokeDetection] AI insight generation failed (non-fatal): {insight_exc}")
+            logger.warning("AI insight generation failed (non-fatal): %s", insight_exc)
             try:
                 supabase.table("sessions").update({
                     "insight_generation_status": "failed"
@@ -798,10 +1361,17 @@ def process_stroke_detection(
                 duration_ms=insight_elapsed_ms,
                 extra_debug={"insight_error": str(insight_exc)},
             )
+        # Insight generation may also have rewritten stroke types and the stored summary.
+        _invalidate_stroke_reads(session_id)
 
         debug_strokes = [_serialize_stroke_for_debug(s) for s in strokes]
         run_completed_at = datetime.now(timezone.utc).isoformat()
-        local_shot_log_path = _write_local_shot_label_log(
+        # The local log is written on the write executor while the Storage
+        # upload and debug-run upsert go out; its path is fixed up front.
+        local_shot_log_path = str(_local_shot_label_log_path(session_id, run_id))
+        local_shot_log_write = _STROKE_WRITE_EXECUTOR.submit(
+            _write_local_shot_label_log,
+            output_path=Path(local_shot_log_path),
             session_id=session_id,
             run_id=run_id,
             started_at=run_started_at,
@@ -810,8 +1380,6 @@ def process_stroke_detection(
             hybrid_debug_payload=hybrid_debug_payload if isinstance(hybrid_debug_payload, dict) else {},
             debug_strokes=debug_strokes,
         )
-        if local_shot_log_path:
-            print(f"[StrokeDetection] Local shot label log written: {local_shot_log_path}")
         merged_debug_stats = dict(debug_stats or {})
         merged_debug_stats.update(
             {
@@ -821,12 +1389,11 @@ def process_stroke_detection(
                 "stage_labels": stage_labels,
                 "stage_statuses": dict(stage_statuses),
                 "stage_timings_ms": dict(stage_timings_ms),
-                "pipeline_elapsed_ms": round(sum(stage_timings_ms.values()), 1),
+                "pipeline_elapsed_ms": round(pipeline_elapsed_ms, 1),
                 "use_claude_classifier": bool(use_claude_classifier),
                 "local_shot_label_log_path": local_shot_log_path,
             }
         )
-        _set_in_memory_progress("completed", merged_debug_stats, completed_at=run_completed_at)
         debug_log_payload = {
             "run_id": run_id,
             "session_id": session_id,
@@ -841,49 +1408,26 @@ def process_stroke_detection(
             "debug_stats": merged_debug_stats,
             "final_strokes": debug_strokes,
         }
-        upload_result = _upload_debug_log_to_storage(
-            supabase,
-            user_id=session_owner_id,
-            session_id=session_id,
-            run_id=run_id,
-            payload=debug_log_payload,
-        )
-
-        _insert_or_update_debug_run(
-            supabase,
-            run_id=run_id,
-            session_id=session_id,
-            user_id=session_owner_id,
-            payload={
-                "status": "completed",
-                "started_at": run_started_at,
-                "completed_at": run_completed_at,
-                "handedness": handedness,
-                "camera_facing": camera_facing,
-                "use_claude_classifier": use_claude_classifier,
-                "debug_stats": merged_debug_stats,
-                "event_logs": hybrid_debug_payload.get("events", []),
-                "final_strokes": debug_strokes,
-                "storage_path": upload_result.get("path"),
-                "storage_url": upload_result.get("url"),
-            },
+        _finalize_run(
+            "completed",
+            None,
+            debug_log_payload,
+            completed_at=run_completed_at,
+            debug_stats=merged_debug_stats,
+            event_logs=hybrid_debug_payload.get("events", []),
+            final_strokes=debug_strokes,
         )
+        if local_shot_log_write.result():
+            logger.info("Local shot label log written: %s", local_shot_log_path)
 
-        print(f"[StrokeDetection] Completed stroke detection for session: {session_id}")
-        print(f"[StrokeDetection] Summary: {summary}")
+        logger.info("Completed stroke detection for session: %s summary=%s", session_id, summary)
 
     except Exception as e:
-        print(f"[StrokeDetection] Error processing session {session_id}: {str(e)}")
         tb = traceback.format_exc()
-        print(f"[StrokeDetection] Traceback: {tb}")
+        logger.error("Error processing session %s: %s\n%s", session_id, e, tb)
         failed_at = datetime.now(timezone.utc).isoformat()
-        # Mark analysis as failed
-        try:
-            supabase.table("sessions").update({
-                "stroke_analysis_status": "failed"
-            }).eq("id", session_id).execute()
-        except Exception:
-            pass
+        # Mark analysis as failed alongside the debug-run write below.
+        status_write = _submit_session_failed_status(supabase, session_id)
         error_payload = {
             "run_id": run_id,
             "session_id": session_id,
@@ -894,28 +1438,28 @@ def process_stroke_detection(
             "error": str(e),
             "traceback": tb,
         }
-        upload_result = _upload_debug_log_to_storage(
+        upload_future = _submit_debug_log_upload(
             supabase,
             user_id=session_owner_id,
             session_id=session_id,
             run_id=run_id,
             payload=error_payload,
         )
-        failed_debug_stats: Dict[str, Any] = {"phase": "failed", "error": str(e)}
-        if "stage_order" in locals() and "stage_labels" in locals():
-            failed_debug_stats.update(
-                {
-                    "current_stage": locals().get("active_stage"),
-                    "stage_order": locals().get("stage_order"),
-                    "stage_labels": locals().get("stage_labels"),
-                    "stage_statuses": dict(locals().get("stage_statuses", {})),
-                    "stage_timings_ms": dict(locals().get("stage_timings_ms", {})),
-                    "pipeline_elapsed_ms": round(sum(dict(locals().get("stage_timings_ms", {})).values()), 1),
-                    "use_claude_classifier": bool(use_claude_classifier),
-                }
-            )
+        # One copy of each stage map serves the memory entry, the DB row and
+        # the Storage log.
+        failed_debug_stats: Dict[str, Any] = {
+            "phase": "failed",
+            "error": str(e),
+            "current_stage": active_stage,
+            "stage_order": stage_order,
+            "stage_labels": stage_labels,
+            "stage_statuses": dict(stage_statuses),
+            "stage_timings_ms": dict(stage_timings_ms),
+            "pipeline_elapsed_ms": round(pipeline_elapsed_ms, 1),
+            "use_claude_classifier": bool(use_claude_classifier),
+        }
         _set_in_memory_progress("failed", failed_debug_stats, completed_at=failed_at, error=str(e))
-        _insert_or_update_debug_run(
+        failed_row_written = _insert_or_update_debug_run(
             supabase,
             run_id=run_id,
             session_id=session_id,
@@ -927,11 +1471,49 @@ def process_stroke_detection(
                 "debug_stats": failed_debug_stats,
                 "event_logs": [],
                 "final_strokes": [],
-                "storage_path": upload_result.get("path"),
-                "storage_url": upload_result.get("url"),
                 "error": str(e),
             },
         )
+        _invalidate_stroke_reads(session_id)
+        _patch_storage_pointers_when_done(
+            supabase,
+            session_id=session_id,
+            run_id=run_id,
+            upload_future=upload_future,
+            row_written=failed_row_written,
+        )
+        _wait_session_failed_status(status_write, session_id)
+
+
+def _start_stroke_analysis(supabase, session_id: str, user_id: str) -> str:
+    """Claim a session for detection; returns 'started', 'not_found' or 'no_pose_data'."""
+    try:
+        rpc_result = supabase.rpc(
+            "start_stroke_analysis",
+            {"p_session_id": session_id, "p_user_id": user_id},
+        ).execute()
+        return str(rpc_result.data or "not_found")
+    except Exception as exc:
+        if not _is_missing_rpc_error(exc):
+            raise
+
+    # Verify session exists and belongs to user
+    result = supabase.table("sessions").select("pose_video_path").eq("id", session_id).eq("user_id", user_id).limit(1).execute()
+    if not result.data:
+        return "not_found"
+
+    # Check if pose video or pose data exists (don't rely on status field)
+    if not result.data[0].get("pose_video_path"):
+        # Only existence matters here, so fetch at most one row instead of counting them all.
+        pose_probe = supabase.table("pose_analysis").select("id").eq("session_id", session_id).limit(1).execute()
+        if not pose_probe.data:
+            return "no_pose_data"
+
+    # Mark session as processing strokes
+    supabase.table("sessions").update({
+        "stroke_analysis_status": "processing"
+    }).eq("id", session_id).execute()
+    return "started"
 
 
 class AnalyzeStrokesBody(BaseModel):
@@ -951,33 +1533,21 @@ async def analyze_strokes(
     """
     supabase = get_supabase()
 
-    # Verify session exists and belongs to user
-    result = supabase.table("sessions").select("*").eq("id", session_id).eq("user_id", user_id).single().execute()
-    if not result.data:
+    # Ownership check, pose precondition and status flip in one round trip.
+    outcome = _start_stroke_analysis(supabase, session_id, user_id)
+    if outcome == "not_found":
         raise HTTPException(status_code=404, detail="Session not found")
-
-    session = result.data
-
-    # Check if pose video or pose data exists (don't rely on status field)
-    if not session.get("pose_video_path"):
-        pose_count = supabase.table("pose_analysis").select("id", count="exact").eq("session_id", session_id).execute()
-        if not pose_count.data or pose_count.count == 0:
-            raise HTTPException(status_code=400, detail="Pose analysis must be completed first. No pose video or pose data found.")
+    if outcome == "no_pose_data":
+        raise HTTPException(status_code=400, detail="Pose analysis must be completed first. No pose video or pose data found.")
 
     requested_use_claude = bool(body.use_claude_classifier) if body is not None else False
     # Force non-Claude path for forehand/backhand classification.
     use_claude_classifier = False
     if requested_use_claude:
-        print("[StrokeDetection] Claude classifier request ignored; using elbow-trend classifier.")
-
-    # Mark session as processing strokes
-    supabase.table("sessions").update({
-        "stroke_analysis_status": "processing"
-    }).eq("id", session_id).execute()
+        logger.info("Claude classifier request ignored; using elbow-trend classifier.")
 
     # Seed in-memory progress immediately so polling can avoid database lookups.
-    _prune_stroke_progress()
-    STROKE_PROGRESS[session_id] = {
+    _store_stroke_progress(session_id, {
         "run_id": str(uuid.uuid4()),
         "session_id": session_id,
         "user_id": user_id,
@@ -994,7 +1564,7 @@ async def analyze_strokes(
             "pipeline_elapsed_ms": 0.0,
             "use_claude_classifier": bool(use_claude_classifier),
         },
-    }
+    })
 
     # Add background task for stroke detection
     background_tasks.add_task(
@@ -1037,182 +1607,325 @@ async def cancel_stroke_insights(
     return {"status": "cancelled", "session_id": session_id}
 
 
-@router.get("/summary/{session_id}", response_model=StrokeSummaryResponse)
+@router.get("/summary/{session_id}", response_model=None, responses={200: {"model": StrokeSummaryResponse}})
 async def get_stroke_summary(
     session_id: str,
+    request: Request,
+    include_strokes: bool = True,
     user_id: str = Depends(get_current_user_id),
 ):
     """
     Get stroke analysis summary for a session.
+
+    Counts and form scores are read from the denormalized sessions columns
+    (kept current by triggers on stroke_analytics), or aggregated from the
+    stroke rows until migration 016 is applied; pass include_strokes=false
+    to skip fetching the stroke rows themselves. Stroke rows are passed through
+    to orjson as-is rather than round-tripping through pydantic.
     """
+    cache_key = (session_id, "summary", user_id, include_strokes)
+    cached = _get_cached_stroke_read(cache_key)
+    if cached is not None:
+        return _stroke_read_response(request, *cached)
+
     supabase = get_supabase()
 
-    # Verify session exists and belongs to user
-    session_result = supabase.table("sessions").select("*").eq("id", session_id).eq("user_id", user_id).single().execute()
-    if not session_result.data:
-        raise HTTPException(status_code=404, detail="Session not found")
+    # Before migration 016 the aggregates come from the stroke rows, so those
+    # are fetched even when the caller doesn't want them returned.
+    summary_columns_exist = await asyncio.to_thread(_session_summary_columns_exist, supabase)
+    need_strokes = include_strokes or not summary_columns_exist
 
-    session = session_result.data
+    # Verify session exists and belongs to user
+    def _fetch_session():
+        return supabase.table("sessions")\
+            .select(_SESSION_SUMMARY_COLUMNS if summary_columns_exist else _SESSION_SUMMARY_COLUMNS_PRE_016)\
+            .eq("id", session_id)\
+            .eq("user_id", user_id)\
+            .limit(1)\
+            .execute()
 
-    # Get all strokes for the session
-    strokes_result = supabase.table("stroke_analytics")\
-        .select("*")\
-        .eq("session_id", session_id)\
-        .order("start_frame")\
-        .execute()
+    def _fetch_strokes():
+        return supabase.table("stroke_analytics")\
+            .select(_STROKE_SUMMARY_COLUMNS)\
+            .eq("session_id", session_id)\
+            .order("start_frame")\
+            .execute()
 
-    if not strokes_result.data:
-        return StrokeSummaryResponse(
-            session_id=session_id,
-            average_form_score=0,
-            best_form_score=0,
-            consistency_score=0,
-            total_strokes=0,
-            forehand_count=0,
-            backhand_count=0,
-            strokes=[],
-            timeline_tips=[],
+    # A conditional request will most likely end in a 304, so it checks the
+    # session first; otherwise both reads go out together and the strokes are
+    # dropped if the ownership check fails.
+    strokes_result = None
+    if need_strokes and "if-none-match" not in request.headers:
+        session_result, strokes_result = await asyncio.gather(
+            asyncio.to_thread(_fetch_session),
+            asyncio.to_thread(_fetch_strokes),
         )
+    else:
+        session_result = await asyncio.to_thread(_fetch_session)
+    if not session_result.data:
+        raise HTTPException(status_code=404, detail="Session not found")
 
-    # Get summary from session
-    stroke_summary = session.get("stroke_summary", {})
+    session = session_result.data[0]
+    etag = _stroke_read_etag(session, "summary", include_strokes)
+    if _etag_matches(request, etag):
+        return _stroke_read_response(request, etag, {})
+
+    strokes: List[Dict[str, Any]] = []
+    if need_strokes and strokes_result is None:
+        strokes_result = await asyncio.to_thread(_fetch_strokes)
+    if include_strokes:
+        if not strokes_result.data:
+            response = {
+                "session_id": session_id,
+                "average_form_score": 0,
+                "best_form_score": 0,
+                "consistency_score": 0,
+                "total_strokes": 0,
+                "forehand_count": 0,
+                "backhand_count": 0,
+                "strokes": [],
+                "timeline_tips": [],
+            }
+            _set_cached_stroke_read(cache_key, (etag, response))
+            return _stroke_read_response(request, etag, response)
 
-    def _is_player_stroke(row: Dict[str, Any]) -> bool:
-        metrics = row.get("metrics")
-        if not isinstance(metrics, dict):
-            return True
+        strokes = strokes_result.data
 
-        hitter = str(metrics.get("event_hitter") or "").strip().lower()
-        if hitter != "opponent":
-            return True
+    aggregates = session if summary_columns_exist else _summarize_player_strokes(strokes_result.data or [])
 
-        method = str(metrics.get("event_hitter_method") or "").strip().lower()
-        reason = str(metrics.get("event_hitter_reason") or "").strip().lower()
-        if method == "proximity_10_percent" and reason.startswith("player_outside_"):
-            return True
-
-        confidence_raw = metrics.get("event_hitter_confidence")
-        try:
-            confidence = float(confidence_raw)
-        except (TypeError, ValueError):
-            confidence = 0.0
-        return confidence < 0.75
-
-    if not stroke_summary:
-        player_rows = [s for s in strokes_result.data if _is_player_stroke(s)]
-        total = len(player_rows)
-        forehand = sum(1 for s in player_rows if s.get("stroke_type") == "forehand")
-        backhand = sum(1 for s in player_rows if s.get("stroke_type") == "backhand")
-        scores = [s.get("form_score") for s in player_rows if isinstance(s.get("form_score"), (int, float))]
-        avg_score = sum(scores) / len(scores) if scores else 0
-        best_score = max(scores) if scores else 0
-        stroke_summary = {
-            "average_form_score": avg_score,
-            "best_form_score": best_score,
-            "consistency_score": 0,
-            "total_strokes": total,
-            "forehand_count": forehand,
-            "backhand_count": backhand,
-        }
-
-    # Format strokes
-    strokes = [
-        StrokeResponse(
-            id=s["id"],
-            session_id=s["session_id"],
-            start_frame=s["start_frame"],
-            end_frame=s["end_frame"],
-            peak_frame=s["peak_frame"],
-            stroke_type=s["stroke_type"],
-            duration=s["duration"],
-            max_velocity=s["max_velocity"],
-            form_score=s["form_score"],
-            metrics=s["metrics"],
-            ai_insight=s.get("ai_insight"),
-            ai_insight_data=s.get("ai_insight_data"),
-        )
-        for s in strokes_result.data
-    ]
+    # Stored summary only supplies consistency_score and timeline tips.
+    stroke_summary = session.get("stroke_summary") or {}
 
     timeline_tips_raw = stroke_summary.get("timeline_tips", []) if isinstance(stroke_summary, dict) else []
-    timeline_tips: List[TimelineTipResponse] = []
+    timeline_tips: List[Dict[str, Any]] = []
     if isinstance(timeline_tips_raw, list):
         for idx, raw_tip in enumerate(timeline_tips_raw):
             if not isinstance(raw_tip, dict):
                 continue
-            try:
-                timeline_tips.append(
-                    TimelineTipResponse(
-                        id=str(raw_tip.get("id") or f"timeline-{idx}"),
-                        timestamp=float(raw_tip.get("timestamp", 0.0) or 0.0),
-                        duration=float(raw_tip.get("duration", 2.0) or 2.0),
-                        title=str(raw_tip.get("title") or "Rally Snapshot")[:64],
-                        message=str(raw_tip.get("message") or "")[:220],
-                        seek_time=(
-                            float(raw_tip.get("seek_time"))
-                            if raw_tip.get("seek_time") is not None
-                            else None
-                        ),
-                    )
-                )
-            except (TypeError, ValueError):
-                continue
-
-    player_rows = [s for s in strokes_result.data if _is_player_stroke(s)]
-    player_scores = [s.get("form_score") for s in player_rows if isinstance(s.get("form_score"), (int, float))]
-    computed_average_form = (sum(player_scores) / len(player_scores)) if player_scores else 0
-    computed_best_form = max(player_scores) if player_scores else 0
-    computed_forehand = sum(1 for s in player_rows if s.get("stroke_type") == "forehand")
-    computed_backhand = sum(1 for s in player_rows if s.get("stroke_type") == "backhand")
+            tip = _timeline_tip_from_raw(raw_tip, idx)
+            if tip is not None:
+                timeline_tips.append(tip)
 
-    return StrokeSummaryResponse(
-        session_id=session_id,
-        average_form_score=computed_average_form,
-        best_form_score=computed_best_form,
-        consistency_score=stroke_summary.get("consistency_score", 0),
-        total_strokes=len(player_rows),
-        forehand_count=computed_forehand,
-        backhand_count=computed_backhand,
-        strokes=strokes,
-        timeline_tips=timeline_tips,
-    )
+    response = {
+        "session_id": session_id,
+        "average_form_score": aggregates.get("average_form_score") or 0,
+        "best_form_score": aggregates.get("best_form_score") or 0,
+        "consistency_score": stroke_summary.get("consistency_score", 0),
+        "total_strokes": aggregates.get("total_strokes") or 0,
+        "forehand_count": aggregates.get("forehand_count") or 0,
+        "backhand_count": aggregates.get("backhand_count") or 0,
+        "strokes": strokes,
+        "timeline_tips": timeline_tips,
+    }
+    _set_cached_stroke_read(cache_key, (etag, response))
+    return _stroke_read_response(request, etag, response)
 
 
 @router.get("/strokes/{session_id}")
 async def get_strokes(
     session_id: str,
+    request: Request,
     stroke_type: Optional[str] = None,
+    fields: Optional[str] = Query(default=None, description="Comma-separated stroke columns"),
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     user_id: str = Depends(get_current_user_id),
 ):
     """
-    Get all strokes for a session, optionally filtered by type.
+    Get strokes for a session, optionally filtered by type.
+
+    Returns the lightweight list columns unless `fields` asks for others
+    (e.g. `fields=id,metrics`); `limit`/`offset` page through the rows.
     """
+    if fields:
+        requested = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = sorted(set(requested) - _STROKE_LIST_FIELDS)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown stroke fields: {', '.join(unknown)}")
+        columns = ", ".join(dict.fromkeys(requested)) or _DEFAULT_STROKE_LIST_COLUMNS
+    else:
+        columns = _DEFAULT_STROKE_LIST_COLUMNS
+
+    cache_key = (session_id, "strokes", user_id, stroke_type, columns, limit, offset)
+    cached = _get_cached_stroke_read(cache_key)
+    if cached is not None:
+        return _stroke_read_response(request, *cached)
+
     supabase = get_supabase()
 
-    # Verify session exists and belongs to user
-    result = supabase.table("sessions").select("id").eq("id", session_id).eq("user_id", user_id).single().execute()
+    if "if-none-match" not in request.headers:
+        return _get_strokes_with_owner_check(supabase, session_id, user_id, columns, stroke_type, limit, offset, cache_key)
+
+    session_row = _require_session_owner(supabase, session_id, user_id)
+    etag = _stroke_read_etag(session_row, *cache_key[1:])
+    if _etag_matches(request, etag):
+        return _stroke_read_response(request, etag, {})
+
+    # Same first-page fetch and stream decision as the unconditional path, so
+    # an ETag always maps to one body.
+    strokes = _fetch_strokes_page(supabase, session_id, columns, stroke_type, offset, limit or _STROKE_STREAM_PAGE_SIZE)
+    return _strokes_list_response(supabase, session_id, columns, stroke_type, limit, offset, strokes, etag, cache_key)
+
+
+# Sessions with more strokes than one page are streamed page by page rather
+# than materialized (and cached) as a single response.
+_STROKE_STREAM_PAGE_SIZE = 1000
+
+
+def _get_strokes_with_owner_check(
+    supabase,
+    session_id: str,
+    user_id: str,
+    columns: str,
+    stroke_type: Optional[str],
+    limit: Optional[int],
+    offset: int,
+    cache_key: Tuple[Any, ...],
+):
+    """
+    Unconditional /strokes read: the owned session row and the first page of
+    strokes come back together by embedding stroke_analytics in the sessions
+    select, so ownership costs no extra round trip.
+    """
+    page_size = limit or _STROKE_STREAM_PAGE_SIZE
+    query = supabase.table("sessions")\
+        .select(f"{_session_etag_columns(supabase)}, stroke_analytics({columns})")\
+        .eq("id", session_id)\
+        .eq("user_id", user_id)
+    if stroke_type:
+        query = query.eq("stroke_analytics.stroke_type", stroke_type)
+    result = query\
+        .order("start_frame", foreign_table="stroke_analytics")\
+        .order("id", foreign_table="stroke_analytics")\
+        .range(offset, offset + page_size - 1, foreign_table="stroke_analytics")\
+        .limit(1)\
+        .execute()
     if not result.data:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Build query
-    query = supabase.table("stroke_analytics").select("*").eq("session_id", session_id)
+    session_row = result.data[0]
+    strokes = session_row.pop("stroke_analytics", None) or []
+    etag = _stroke_read_etag(session_row, *cache_key[1:])
+    return _strokes_list_response(supabase, session_id, columns, stroke_type, limit, offset, strokes, etag, cache_key)
 
+
+def _fetch_strokes_page(
+    supabase,
+    session_id: str,
+    columns: str,
+    stroke_type: Optional[str],
+    start: int,
+    size: int,
+) -> List[Dict[str, Any]]:
+    query = supabase.table("stroke_analytics").select(columns).eq("session_id", session_id)
     if stroke_type:
         query = query.eq("stroke_type", stroke_type)
+    # id breaks start_frame ties so pages never overlap or skip rows.
+    return query.order("start_frame").order("id")\
+        .range(start, start + size - 1)\
+        .execute().data or []
 
-    strokes_result = query.order("start_frame").execute()
 
-    if not strokes_result.data:
-        return {
-            "session_id": session_id,
-            "count": 0,
-            "strokes": []
-        }
+def _strokes_list_response(
+    supabase,
+    session_id: str,
+    columns: str,
+    stroke_type: Optional[str],
+    limit: Optional[int],
+    offset: int,
+    strokes: List[Dict[str, Any]],
+    etag: str,
+    cache_key: Tuple[Any, ...],
+) -> Response:
+    """
+    Body for a /strokes read given its first page: an unpaged request whose
+    first page is full is streamed (and not cached), anything else is returned whole.
+    """
+    headers = {"ETag": etag, "Cache-Control": _STROKE_READ_CACHE_CONTROL}
+    if limit is None and not offset and len(strokes) >= _STROKE_STREAM_PAGE_SIZE:
+        return StreamingResponse(
+            _iter_strokes_json(supabase, session_id, columns, stroke_type, first_page=strokes),
+            media_type="application/json",
+            headers=headers,
+        )
 
-    return {
+    response = {
         "session_id": session_id,
-        "count": len(strokes_result.data),
-        "strokes": strokes_result.data
+        "count": len(strokes),
+        "strokes": strokes
+    }
+    _set_cached_stroke_read(cache_key, (etag, response))
+    return ORJSONResponse(response, headers=headers)
+
+
+def _iter_strokes_json(
+    supabase,
+    session_id: str,
+    columns: str,
+    stroke_type: Optional[str],
+    first_page: Optional[List[Dict[str, Any]]] = None,
+) -> Iterator[bytes]:
+    """Yield the /strokes JSON body while paging stroke_analytics with .range()."""
+    yield b'{"session_id":' + orjson.dumps(session_id) + b',"strokes":['
+    count = 0
+    start = 0
+    if first_page is not None:
+        for row in first_page:
+            yield (b"," if count else b"") + orjson.dumps(row)
+            count += 1
+        start = len(first_page)
+    while True:
+        page = _fetch_strokes_page(supabase, session_id, columns, stroke_type, start, _STROKE_STREAM_PAGE_SIZE)
+        for row in page:
+            yield (b"," if count else b"") + orjson.dumps(row)
+            count += 1
+        if len(page) < _STROKE_STREAM_PAGE_SIZE:
+            break
+        start += _STROKE_STREAM_PAGE_SIZE
+    yield b'],"count":' + str(count).encode() + b"}"
+
+
+def _is_missing_rpc_error(exc: Exception) -> bool:
+    """True when PostgREST reports the function is absent (migration not applied)."""
+    return getattr(exc, "code", None) == "PGRST202" or "could not find the function" in str(exc).lower()
+
+
+async def _get_stroke_detail_without_rpc(supabase, stroke_id: str, user_id: str) -> Dict[str, Any]:
+    """Stroke detail from plain table reads; ownership and pose frames are fetched concurrently."""
+    stroke_result = await asyncio.to_thread(
+        lambda: supabase.table("stroke_analytics").select("*").eq("id", stroke_id).limit(1).execute()
+    )
+    if not stroke_result.data:
+        raise HTTPException(status_code=404, detail="Stroke not found")
+    stroke = stroke_result.data[0]
+
+    session_result, pose_frames_result = await asyncio.gather(
+        asyncio.to_thread(
+            lambda: supabase.table("sessions")
+            .select("id")
+            .eq("id", stroke["session_id"])
+            .eq("user_id", user_id)
+            .limit(1)
+            .execute()
+        ),
+        # Player only (person_id=0) within the stroke's frame window.
+        asyncio.to_thread(
+            lambda: supabase.table("pose_analysis")
+            .select("*")
+            .eq("session_id", stroke["session_id"])
+            .eq("person_id", 0)
+            .gte("frame_number", stroke["start_frame"])
+            .lte("frame_number", stroke["end_frame"])
+            .order("frame_number")
+            .execute()
+        ),
+    )
+    if not session_result.data:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return {
+        "stroke": stroke,
+        "pose_frames": pose_frames_result.data or [],
     }
 
 
@@ -1223,34 +1936,28 @@ async def get_stroke_detail(
 ):
     """
     Get detailed information about a specific stroke.
+
+    Ownership check and the player's pose window come back from a single
+    get_stroke_detail RPC call.
     """
     supabase = get_supabase()
 
-    # Get stroke
-    stroke_result = supabase.table("stroke_analytics").select("*").eq("id", stroke_id).single().execute()
-    if not stroke_result.data:
+    try:
+        detail_result = supabase.rpc(
+            "get_stroke_detail",
+            {"p_stroke_id": stroke_id, "p_user_id": user_id},
+        ).execute()
+    except Exception as exc:
+        if not _is_missing_rpc_error(exc):
+            raise
+        return await _get_stroke_detail_without_rpc(supabase, stroke_id, user_id)
+    detail = detail_result.data
+    if not isinstance(detail, dict) or not detail.get("stroke"):
         raise HTTPException(status_code=404, detail="Stroke not found")
 
-    stroke = stroke_result.data
-
-    # Verify session belongs to user
-    session_result = supabase.table("sessions").select("id").eq("id", stroke["session_id"]).eq("user_id", user_id).single().execute()
-    if not session_result.data:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    # Get pose frames for this stroke (player only, person_id=0)
-    pose_frames_result = supabase.table("pose_analysis")\
-        .select("*")\
-        .eq("session_id", stroke["session_id"])\
-        .eq("person_id", 0)\
-        .gte("frame_number", stroke["start_frame"])\
-        .lte("frame_number", stroke["end_frame"])\
-        .order("frame_number")\
-        .execute()
-
     return {
-        "stroke": stroke,
-        "pose_frames": pose_frames_result.data if pose_frames_result.data else []
+        "stroke": detail["stroke"],
+        "pose_frames": detail.get("pose_frames") or [],
     }
 
 
@@ -1258,57 +1965,63 @@ async def get_stroke_detail(
 async def get_stroke_debug_runs(
     session_id: str,
     limit: int = 20,
+    offset: int = Query(default=0, ge=0),
     user_id: str = Depends(get_current_user_id),
 ):
     """
-    List stroke detection debug runs for a session.
+    List stroke detection debug runs for a session, newest first.
+
+    The list leaves out debug_stats; fetch /debug-run/{run_id} for a run's full stats.
     """
+    safe_limit = max(1, min(int(limit), 100))
+    # Finished runs only change when a new run starts or finalizes (both drop
+    # the session's read cache); a live run's row is patched every tick.
+    progress = _get_stroke_progress(session_id)
+    cacheable = not (progress and progress.get("status") == "processing")
+    cache_key = (session_id, "debug_runs", user_id, safe_limit, offset)
+    if cacheable:
+        cached = _get_cached_stroke_read(cache_key)
+        if cached is not None:
+            return cached
+
     supabase = get_supabase()
 
-    # Verify ownership via session
-    session_result = (
-        supabase.table("sessions")
-        .select("id")
-        .eq("id", session_id)
-        .eq("user_id", user_id)
-        .single()
-        .execute()
-    )
-    if not session_result.data:
-        raise HTTPException(status_code=404, detail="Session not found")
+    _require_session_owner(supabase, session_id, user_id)
+
+    if not _debug_runs_table_exists(supabase):
+        return {
+            "session_id": session_id,
+            "count": 0,
+            "runs": [],
+        }
 
-    safe_limit = max(1, min(int(limit), 100))
     try:
         runs_result = (
-            supabase.table("stroke_detection_debug_runs")
+            supabase.table(_DEBUG_RUNS_TABLE)
             .select(
                 "id, session_id, status, started_at, completed_at, "
-                "handedness, camera_facing, debug_stats, storage_path, storage_url, created_at, error"
+                "handedness, camera_facing, storage_path, storage_url, created_at, error"
             )
             .eq("session_id", session_id)
             .eq("user_id", user_id)
             .order("created_at", desc=True)
-            .limit(safe_limit)
+            .range(offset, offset + safe_limit - 1)
             .execute()
         )
     except Exception as exc:
-        msg = str(exc).lower()
-        if "does not exist" in msg or "42p01" in msg or "stroke_detection_debug_runs" in msg:
-            return {
-                "session_id": session_id,
-                "count": 0,
-                "runs": [],
-            }
         raise HTTPException(
             status_code=500,
             detail=f"Failed to load debug runs (ensure migration is applied): {exc}",
         )
 
-    return {
+    response = {
         "session_id": session_id,
         "count": len(runs_result.data or []),
         "runs": runs_result.data or [],
     }
+    if cacheable:
+        _set_cached_stroke_read(cache_key, response)
+    return response
 
 
 @router.get("/debug-run/{run_id}")
@@ -1320,9 +2033,11 @@ async def get_stroke_debug_run(
     Get full payload for a stroke detection debug run.
     """
     supabase = get_supabase()
+    if not _debug_runs_table_exists(supabase):
+        raise HTTPException(status_code=404, detail="Debug run not found")
     try:
         run_result = (
-            supabase.table("stroke_detection_debug_runs")
+            supabase.table(_DEBUG_RUNS_TABLE)
             .select("*")
             .eq("id", run_id)
             .eq("user_id", user_id)
@@ -1339,15 +2054,8 @@ async def get_stroke_debug_run(
         raise HTTPException(status_code=404, detail="Debug run not found")
 
     run_data = run_result.data
-    signed_log_url = None
     storage_path = run_data.get("storage_path")
-    if storage_path:
-        try:
-            signed = supabase.storage.from_("provision-videos").create_signed_url(storage_path, 3600)
-            if isinstance(signed, dict):
-                signed_log_url = signed.get("signedURL") or signed.get("signed_url") or signed.get("signedUrl")
-        except Exception:
-            signed_log_url = None
+    signed_log_url = _signed_debug_log_url(supabase, storage_path) if storage_path else None
 
     return {
         "run": run_data,
@@ -1358,34 +2066,42 @@ async def get_stroke_debug_run(
 @router.get("/progress/{session_id}")
 async def get_stroke_progress(
     session_id: str,
+    request: Request,
     user_id: str = Depends(get_current_user_id),
 ):
     """
     Get in-memory stroke pipeline progress for a session.
+
+    Responses carry an ETag tied to the progress revision, so a poll that
+    sends it back gets a 304 until the pipeline reports something new.
     """
-    progress = STROKE_PROGRESS.get(session_id)
+    progress = _get_stroke_progress(session_id)
     if progress:
         progress_user_id = progress.get("user_id")
         if progress_user_id and progress_user_id != user_id:
             raise HTTPException(status_code=404, detail="Session not found")
         if progress_user_id == user_id:
-            return {
-                "session_id": session_id,
-                "progress": progress,
-            }
+            etag = f'"progress-{progress.get("run_id")}-{progress.get("revision")}"'
+            if _etag_matches(request, etag):
+                return _stroke_read_response(request, etag, {})
+            return _stroke_read_response(
+                request,
+                etag,
+                {
+                    "session_id": session_id,
+                    "progress": _snapshot_stroke_progress(progress),
+                },
+            )
+        progress = _snapshot_stroke_progress(progress)
 
     # Fallback ownership verification when no in-memory progress is available.
-    supabase = get_supabase()
-    session_result = (
-        supabase.table("sessions")
-        .select("id")
-        .eq("id", session_id)
-        .eq("user_id", user_id)
-        .single()
-        .execute()
-    )
-    if not session_result.data:
-        raise HTTPException(status_code=404, detail="Session not found")
+    owner_key = (session_id, user_id)
+    with _PROGRESS_OWNER_LOCK:
+        known_owner = owner_key in _PROGRESS_OWNER_CACHE
+    if not known_owner:
+        _require_session_owner(get_supabase(), session_id, user_id)
+        with _PROGRESS_OWNER_LOCK:
+            _PROGRESS_OWNER_CACHE[owner_key] = True
 
     return {
         "session_id": session_id,
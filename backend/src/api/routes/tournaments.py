@@ -1,11 +1,17 @@
 import uuid
+import asyncio
 import logging
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime, date
 
+from cachetools import TTLCache
+
 from ..database.supabase import get_supabase, get_current_user_id
+from ..services.wtt_tournament_seeder import REAL_TOURNAMENTS
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +110,151 @@ class MatchupResponse(BaseModel):
     updated_at: Optional[str] = None
 
 
+# --- Helpers ---
+
+def _utc_now_iso() -> str:
+    """Naive-UTC ISO timestamp, as stored in created_at/updated_at."""
+    return datetime.utcnow().isoformat()
+
+
+# Static seed data, so the name -> thumbnail map is built once at import.
+_WTT_PREVIEW_THUMBNAILS = {
+    t["name"]: t["preview_thumbnail"]
+    for t in REAL_TOURNAMENTS
+    if t.get("preview_thumbnail")
+}
+
+# List and stats reads are global (identical for every user), so they are cached
+# briefly in-process and dropped on any tournament or matchup write.
+_TOURNAMENT_READ_CACHE: "TTLCache[Tuple[Any, ...], Any]" = TTLCache(maxsize=64, ttl=30)
+_TOURNAMENT_READ_LOCK = threading.Lock()
+
+
+def _get_cached_tournament_read(key: Tuple[Any, ...]) -> Any:
+    with _TOURNAMENT_READ_LOCK:
+        return _TOURNAMENT_READ_CACHE.get(key)
+
+
+def _set_cached_tournament_read(key: Tuple[Any, ...], value: Any) -> None:
+    with _TOURNAMENT_READ_LOCK:
+        _TOURNAMENT_READ_CACHE[key] = value
+
+
+def _invalidate_tournament_reads() -> None:
+    with _TOURNAMENT_READ_LOCK:
+        _TOURNAMENT_READ_CACHE.clear()
+
+
+_MATCHUP_WITH_PLAYER_COLUMNS = "*, player:players(name)"
+
+_STATS_COUNTER_KEYS = (
+    "total_tournaments",
+    "upcoming_tournaments",
+    "completed_tournaments",
+    "total_matchups",
+    "wins",
+    "losses",
+    "pending_matchups",
+)
+
+_EMPTY_MATCHUP_COUNTS = {"matchup_count": 0, "win_count": 0, "loss_count": 0}
+
+
+def _is_missing_relation_error(exc: Exception) -> bool:
+    """True when PostgREST can't find the table/view (migration not applied)."""
+    return getattr(exc, "code", None) in ("PGRST205", "42P01") or "does not exist" in str(exc).lower()
+
+
+def _is_missing_rpc_error(exc: Exception) -> bool:
+    """True when PostgREST reports the function is absent (migration not applied)."""
+    return getattr(exc, "code", None) == "PGRST202" or "could not find the function" in str(exc).lower()
+
+
+def _matchup_counts(supabase, tournament_ids: List[str]) -> Dict[str, Dict[str, int]]:
+    """Matchup/win/loss counts per tournament id; ids without matchups are absent."""
+    if not tournament_ids:
+        return {}
+
+    try:
+        stats = (
+            supabase.table("tournament_stats")
+            .select("tournament_id, matchup_count, win_count, loss_count")
+            .in_("tournament_id", tournament_ids)
+            .execute()
+        )
+        return {
+            row["tournament_id"]: {
+                "matchup_count": row["matchup_count"],
+                "win_count": row["win_count"],
+                "loss_count": row["loss_count"],
+            }
+            for row in stats.data
+        }
+    except Exception as exc:
+        if not _is_missing_relation_error(exc):
+            raise
+
+    # tournament_stats view not deployed yet: tally the matchup rows here.
+    counts: Dict[str, Dict[str, int]] = {}
+    matchups = (
+        supabase.table("tournament_matchups")
+        .select("tournament_id, result")
+        .in_("tournament_id", tournament_ids)
+        .execute()
+    )
+    for m in matchups.data:
+        c = counts.setdefault(m["tournament_id"], dict(_EMPTY_MATCHUP_COUNTS))
+        c["matchup_count"] += 1
+        result = m.get("result")
+        if result == "win":
+            c["win_count"] += 1
+        elif result == "loss":
+            c["loss_count"] += 1
+    return counts
+
+
+def _with_matchup_counts(supabase, rows: List[dict]) -> List[dict]:
+    """Attach matchup/win/loss counts to tournament rows with one stats query for all of them."""
+    counts = _matchup_counts(supabase, [t["id"] for t in rows])
+    for t in rows:
+        t.update(counts.get(t["id"], _EMPTY_MATCHUP_COUNTS))
+    return rows
+
+
+def _select_tournaments_with_counts(supabase, apply_filters: Callable[[Any], Any]) -> List[dict]:
+    """
+    Tournament rows with matchup/win/loss counts, read from v_tournaments_with_counts
+    in one request. apply_filters adds the endpoint's filters and ordering.
+    """
+    try:
+        return apply_filters(supabase.table("v_tournaments_with_counts").select("*")).execute().data
+    except Exception as exc:
+        if not _is_missing_relation_error(exc):
+            raise
+
+    # View not deployed yet: plain tournaments read, counts attached separately.
+    result = apply_filters(supabase.table("tournaments").select("*")).execute()
+    return _with_matchup_counts(supabase, result.data)
+
+
+def _player_name(supabase, player_id: Optional[str]) -> Optional[str]:
+    if not player_id:
+        return None
+    player = supabase.table("players").select("name").eq("id", player_id).limit(1).execute()
+    return player.data[0].get("name") if player.data else None
+
+
+# List endpoints validate and serialize a whole page in one pydantic-core call
+# and return the bytes directly, instead of building a model per row and having
+# FastAPI re-validate them against response_model.
+_TOURNAMENT_LIST_ADAPTER = TypeAdapter(List[TournamentResponse])
+_MATCHUP_LIST_ADAPTER = TypeAdapter(List[MatchupResponse])
+
+
+def _json_list_body(adapter: TypeAdapter, rows: List[dict]) -> bytes:
+    return adapter.dump_json(adapter.validate_python(rows))
+
+
 # --- Tournament CRUD ---
 
 @router.post("", response_model=TournamentResponse)
@@ -113,7 +264,7 @@ async def create_tournament(
 ):
     supabase = get_supabase()
     tournament_id = str(uuid.uuid4())
-    now = datetime.utcnow().isoformat()
+    now = _utc_now_iso()
 
     data = {
         "id": tournament_id,
@@ -132,7 +283,8 @@ async def create_tournament(
     }
 
     try:
-        result = supabase.table("tournaments").insert(data).execute()
+        result = await asyncio.to_thread(lambda: supabase.table("tournaments").insert(data).execute())
+        _invalidate_tournament_reads()
         row = result.data[0]
         row["matchup_count"] = 0
         row["win_count"] = 0
@@ -142,87 +294,81 @@ async def create_tournament(
         raise HTTPException(status_code=500, detail=f"Failed to create tournament: {str(e)}")
 
 
-@router.get("", response_model=List[TournamentResponse])
+@router.get("", response_model=None, responses={200: {"model": List[TournamentResponse]}})
 async def list_tournaments(
     user_id: str = Depends(get_current_user_id),
     status: Optional[str] = Query(None),
 ):
+    cache_key = ("all", status)
+    cached = _get_cached_tournament_read(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     supabase = get_supabase()
 
     try:
         # Global: show all tournaments to any authenticated user
-        query = supabase.table("tournaments").select("*").order("start_date", desc=True)
-        if status:
-            query = query.eq("status", status)
-        result = query.execute()
-
-        tournaments = []
-        for t in result.data:
-            matchups = supabase.table("tournament_matchups").select("result").eq("tournament_id", t["id"]).execute()
-            t["matchup_count"] = len(matchups.data)
-            t["win_count"] = sum(1 for m in matchups.data if m.get("result") == "win")
-            t["loss_count"] = sum(1 for m in matchups.data if m.get("result") == "loss")
-            tournaments.append(TournamentResponse(**t))
-
-        return tournaments
+        def _filter(query):
+            query = query.order("start_date", desc=True)
+            return query.eq("status", status) if status else query
+
+        rows = await asyncio.to_thread(_select_tournaments_with_counts, supabase, _filter)
+
+        body = _json_list_body(_TOURNAMENT_LIST_ADAPTER, rows)
+        _set_cached_tournament_read(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list tournaments: {str(e)}")
 
 
-@router.get("/upcoming", response_model=List[TournamentResponse])
+@router.get("/upcoming", response_model=None, responses={200: {"model": List[TournamentResponse]}})
 async def list_upcoming_tournaments(
     user_id: str = Depends(get_current_user_id),
 ):
+    cache_key = ("upcoming",)
+    cached = _get_cached_tournament_read(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     supabase = get_supabase()
 
     try:
         # Global: show all upcoming/ongoing tournaments
-        result = (
-            supabase.table("tournaments")
-            .select("*")
-            .in_("status", ["upcoming", "ongoing"])
-            .order("start_date", desc=False)
-            .execute()
+        rows = await asyncio.to_thread(
+            _select_tournaments_with_counts,
+            supabase,
+            lambda query: query.in_("status", ["upcoming", "ongoing"]).order("start_date", desc=False),
         )
 
-        tournaments = []
-        for t in result.data:
-            matchups = supabase.table("tournament_matchups").select("result").eq("tournament_id", t["id"]).execute()
-            t["matchup_count"] = len(matchups.data)
-            t["win_count"] = sum(1 for m in matchups.data if m.get("result") == "win")
-            t["loss_count"] = sum(1 for m in matchups.data if m.get("result") == "loss")
-            tournaments.append(TournamentResponse(**t))
-
-        return tournaments
+        body = _json_list_body(_TOURNAMENT_LIST_ADAPTER, rows)
+        _set_cached_tournament_read(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list upcoming tournaments: {str(e)}")
 
 
-@router.get("/past", response_model=List[TournamentResponse])
+@router.get("/past", response_model=None, responses={200: {"model": List[TournamentResponse]}})
 async def list_past_tournaments(
     user_id: str = Depends(get_current_user_id),
 ):
+    cache_key = ("past",)
+    cached = _get_cached_tournament_read(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     supabase = get_supabase()
 
     try:
         # Global: show all past tournaments
-        result = (
-            supabase.table("tournaments")
-            .select("*")
-            .in_("status", ["completed", "cancelled"])
-            .order("start_date", desc=True)
-            .execute()
+        rows = await asyncio.to_thread(
+            _select_tournaments_with_counts,
+            supabase,
+            lambda query: query.in_("status", ["completed", "cancelled"]).order("start_date", desc=True),
         )
 
-        tournaments = []
-        for t in result.data:
-            matchups = supabase.table("tournament_matchups").select("result").eq("tournament_id", t["id"]).execute()
-            t["matchup_count"] = len(matchups.data)
-            t["win_count"] = sum(1 for m in matchups.data if m.get("result") == "win")
-            t["loss_count"] = sum(1 for m in matchups.data if m.get("result") == "loss")
-            tournaments.append(TournamentResponse(**t))
-
-        return tournaments
+        body = _json_list_body(_TOURNAMENT_LIST_ADAPTER, rows)
+        _set_cached_tournament_read(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list past tournaments: {str(e)}")
 
@@ -230,6 +376,14 @@ async def list_past_tournaments(
 # --- ITTF Calendar Import ---
 # NOTE: These MUST be before /{tournament_id} to avoid being caught by the path param
 
+# The scraped calendar changes a few times a day at most, so results are kept
+# per year for an hour. The static fallback list is only held for a couple of
+# minutes so a recovered ITTF site shows up quickly. Only touched from the
+# event loop, so no lock.
+_ITTF_CALENDAR_CACHE: "TTLCache[Optional[int], List[dict]]" = TTLCache(maxsize=8, ttl=3600)
+_ITTF_FALLBACK_CACHE: "TTLCache[Optional[int], List[dict]]" = TTLCache(maxsize=8, ttl=120)
+
+
 @router.get("/ittf-calendar")
 async def get_ittf_calendar(
     user_id: str = Depends(get_current_user_id),
@@ -238,8 +392,18 @@ async def get_ittf_calendar(
     from ..services.tournament_service import scrape_ittf_tournaments
 
     try:
-        events = await scrape_ittf_tournaments(year)
-        return {"events": events, "count": len(events)}
+        events = _ITTF_CALENDAR_CACHE.get(year)
+        from_fallback = False
+        if events is None:
+            events = _ITTF_FALLBACK_CACHE.get(year)
+            from_fallback = events is not None
+        if events is None:
+            events, from_fallback = await scrape_ittf_tournaments(year)
+            if from_fallback:
+                _ITTF_FALLBACK_CACHE[year] = events
+            else:
+                _ITTF_CALENDAR_CACHE[year] = events
+        return {"events": events, "count": len(events), "fallback": from_fallback}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch ITTF calendar: {str(e)}")
 
@@ -256,7 +420,8 @@ async def sync_wtt_tournaments(
 
     supabase = get_supabase()
     try:
-        results = await seed_real_wtt_tournaments(user_id, supabase)
+        results = await asyncio.to_thread(seed_real_wtt_tournaments, user_id, supabase)
+        _invalidate_tournament_reads()
         return {"message": f"Synced {len(results)} tournaments", "tournaments": results}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"WTT sync failed: {str(e)}")
@@ -270,7 +435,8 @@ async def backfill_tournament_videos(
 
     supabase = get_supabase()
     try:
-        stats = await backfill_videos(user_id, supabase)
+        stats = await asyncio.to_thread(backfill_videos, user_id, supabase)
+        _invalidate_tournament_reads()
         return {"message": f"Searched {stats['searched']}, found {stats['found']}", **stats}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Video backfill failed: {str(e)}")
@@ -281,48 +447,85 @@ async def backfill_tournament_previews(
     user_id: str = Depends(get_current_user_id),
 ):
     """Backfill preview thumbnails for existing WTT tournaments"""
-    from ..services.wtt_tournament_seeder import REAL_TOURNAMENTS
-
     supabase = get_supabase()
-    
-    preview_map = {
-        t["name"]: t.get("preview_thumbnail")
-        for t in REAL_TOURNAMENTS
-        if t.get("preview_thumbnail")
-    }
-    
+
+    # One read for every seeded name, one upsert for every match.
+    try:
+        result = await asyncio.to_thread(
+            lambda: supabase.table("tournaments")
+            .select("id, coach_id, name, metadata")
+            .eq("coach_id", user_id)
+            .in_("name", list(_WTT_PREVIEW_THUMBNAILS))
+            .execute()
+        )
+    except Exception as e:
+        logger.error(f"Failed to read tournaments for preview backfill: {e}")
+        return {"message": "Updated 0 tournaments with preview thumbnails", "updated": 0}
+
+    # Like the per-name lookup this replaces, only the first row for a name is updated.
+    updates = {}
+    for tournament in result.data:
+        name = tournament["name"]
+        if name in updates:
+            continue
+        thumbnail_url = _WTT_PREVIEW_THUMBNAILS[name]
+        updates[name] = {
+            "id": tournament["id"],
+            "coach_id": tournament["coach_id"],
+            "name": name,
+            "metadata": {
+                **(tournament.get("metadata") or {}),
+                "thumbnail_url": thumbnail_url,
+                "preview_image_url": thumbnail_url,
+            },
+        }
+
+    updated = await asyncio.to_thread(_write_preview_updates, supabase, list(updates.values()))
+    if updated:
+        _invalidate_tournament_reads()
+    return {"message": f"Updated {updated} tournaments with preview thumbnails", "updated": updated}
+
+
+def _write_preview_updates(supabase, rows: List[dict]) -> int:
+    """
+    One upsert for every row; if it is rejected, update row by row so one bad
+    tournament doesn't block the rest. Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+    try:
+        supabase.table("tournaments").upsert(rows).execute()
+        return len(rows)
+    except Exception as e:
+        logger.warning(f"Batch preview backfill of {len(rows)} tournaments failed, retrying individually: {e}")
+
     updated = 0
-    for name, thumbnail_url in preview_map.items():
+    for row in rows:
         try:
-            # Find tournament by name
-            result = (
-                supabase.table("tournaments")
-                .select("id, metadata")
-                .eq("coach_id", user_id)
-                .eq("name", name)
-                .execute()
-            )
-            
-            if not result.data:
-                continue
-                
-            tournament = result.data[0]
-            metadata = tournament.get("metadata") or {}
-            metadata["thumbnail_url"] = thumbnail_url
-            metadata["preview_image_url"] = thumbnail_url
-            
-            # Update tournament
-            supabase.table("tournaments").update({
-                "metadata": metadata,
-            }).eq("id", tournament["id"]).execute()
-            
+            supabase.table("tournaments").update({"metadata": row["metadata"]}).eq("id", row["id"]).execute()
             updated += 1
-            
-        except Exception as e:
-            logger.error(f"Failed to update preview for {name}: {e}")
-            continue
-    
-    return {"message": f"Updated {updated} tournaments with preview thumbnails", "updated": updated}
+        except Exception as row_exc:
+            logger.error(f"Failed to update preview for {row['name']}: {row_exc}")
+    return updated
+
+
+def _insert_tournaments(supabase, rows: List[dict]) -> List[dict]:
+    """
+    One multi-row INSERT; if any row is rejected, retry row by row so the
+    valid events still land. Returns the inserted rows.
+    """
+    try:
+        return supabase.table("tournaments").insert(rows).execute().data
+    except Exception as e:
+        logger.warning(f"Batch import of {len(rows)} tournaments failed, retrying individually: {e}")
+
+    inserted = []
+    for data in rows:
+        try:
+            inserted.extend(supabase.table("tournaments").insert(data).execute().data)
+        except Exception as row_exc:
+            logger.error(f"Failed to import tournament '{data['name']}': {row_exc}")
+    return inserted
 
 
 @router.post("/import-ittf", response_model=List[TournamentResponse])
@@ -331,14 +534,11 @@ async def import_ittf_tournaments(
     user_id: str = Depends(get_current_user_id),
 ):
     supabase = get_supabase()
-    imported = []
-
-    for event in request.events:
-        tournament_id = str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
+    now = _utc_now_iso()
 
-        data = {
-            "id": tournament_id,
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
             "coach_id": user_id,
             "name": event.get("name", "Unnamed Event"),
             "location": event.get("location"),
@@ -349,19 +549,15 @@ async def import_ittf_tournaments(
             "created_at": now,
             "updated_at": now,
         }
+        for event in request.events
+    ]
+    if not rows:
+        return []
 
-        try:
-            result = supabase.table("tournaments").insert(data).execute()
-            row = result.data[0]
-            row["matchup_count"] = 0
-            row["win_count"] = 0
-            row["loss_count"] = 0
-            imported.append(TournamentResponse(**row))
-        except Exception as e:
-            logger.error(f"Failed to import tournament '{event.get('name')}': {e}")
-            continue
-
-    return imported
+    inserted = await asyncio.to_thread(_insert_tournaments, supabase, rows)
+    if inserted:
+        _invalidate_tournament_reads()
+    return [TournamentResponse(**row, **_EMPTY_MATCHUP_COUNTS) for row in inserted]
 
 
 @router.get("/{tournament_id}", response_model=TournamentResponse)
@@ -372,23 +568,22 @@ async def get_tournament(
     supabase = get_supabase()
 
     try:
-        # Global: any authenticated user can view any tournament
-        result = (
-            supabase.table("tournaments")
-            .select("*")
-            .eq("id", tournament_id)
-            .single()
-            .execute()
+        # Global: any authenticated user can view any tournament. The counts only
+        # need the id, so both reads go out together.
+        result, counts = await asyncio.gather(
+            asyncio.to_thread(
+                lambda: supabase.table("tournaments")
+                .select("*")
+                .eq("id", tournament_id)
+                .limit(1)
+                .execute()
+            ),
+            asyncio.to_thread(_matchup_counts, supabase, [tournament_id]),
         )
         if not result.data:
             raise HTTPException(status_code=404, detail="Tournament not found")
 
-        matchups = supabase.table("tournament_matchups").select("result").eq("tournament_id", tournament_id).execute()
-        result.data["matchup_count"] = len(matchups.data)
-        result.data["win_count"] = sum(1 for m in matchups.data if m.get("result") == "win")
-        result.data["loss_count"] = sum(1 for m in matchups.data if m.get("result") == "loss")
-
-        return TournamentResponse(**result.data)
+        return TournamentResponse(**result.data[0], **counts.get(tournament_id, _EMPTY_MATCHUP_COUNTS))
     except HTTPException:
         raise
     except Exception as e:
@@ -403,37 +598,32 @@ async def update_tournament(
 ):
     supabase = get_supabase()
 
-    try:
-        existing = supabase.table("tournaments").select("*").eq("id", tournament_id).eq("coach_id", user_id).single().execute()
-        if not existing.data:
-            raise HTTPException(status_code=404, detail="Tournament not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to find tournament: {str(e)}")
-
-    update_data = {}
-    for k, v in tournament.model_dump().items():
-        if v is not None:
-            if isinstance(v, date):
-                update_data[k] = v.isoformat()
-            else:
-                update_data[k] = v
+    # mode="json" renders dates as ISO strings; unset fields are dropped.
+    update_data = tournament.model_dump(exclude_none=True, mode="json")
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    update_data["updated_at"] = datetime.utcnow().isoformat()
+    update_data["updated_at"] = _utc_now_iso()
 
     try:
-        result = supabase.table("tournaments").update(update_data).eq("id", tournament_id).execute()
+        # The owner filter rides on the UPDATE itself; no row back means not found.
+        result, counts = await asyncio.gather(
+            asyncio.to_thread(
+                lambda: supabase.table("tournaments")
+                .update(update_data)
+                .eq("id", tournament_id)
+                .eq("coach_id", user_id)
+                .execute()
+            ),
+            asyncio.to_thread(_matchup_counts, supabase, [tournament_id]),
+        )
+        if not result.data:
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        _invalidate_tournament_reads()
         row = result.data[0]
-
-        matchups = supabase.table("tournament_matchups").select("result").eq("tournament_id", tournament_id).execute()
-        row["matchup_count"] = len(matchups.data)
-        row["win_count"] = sum(1 for m in matchups.data if m.get("result") == "win")
-        row["loss_count"] = sum(1 for m in matchups.data if m.get("result") == "loss")
-
-        return TournamentResponse(**row)
+        return TournamentResponse(**row, **counts.get(tournament_id, _EMPTY_MATCHUP_COUNTS))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update tournament: {str(e)}")
 
@@ -446,11 +636,12 @@ async def delete_tournament(
     supabase = get_supabase()
 
     try:
-        existing = supabase.table("tournaments").select("*").eq("id", tournament_id).eq("coach_id", user_id).single().execute()
-        if not existing.data:
+        result = await asyncio.to_thread(
+            lambda: supabase.table("tournaments").delete().eq("id", tournament_id).eq("coach_id", user_id).execute()
+        )
+        if not result.data:
             raise HTTPException(status_code=404, detail="Tournament not found")
-
-        supabase.table("tournaments").delete().eq("id", tournament_id).execute()
+        _invalidate_tournament_reads()
         return {"message": "Tournament deleted"}
     except HTTPException:
         raise
@@ -469,7 +660,14 @@ async def create_matchup(
     supabase = get_supabase()
 
     try:
-        existing = supabase.table("tournaments").select("id").eq("id", tournament_id).eq("coach_id", user_id).single().execute()
+        # The player's name only depends on the request, so it is looked up
+        # alongside the ownership check rather than after the insert.
+        existing, player_name = await asyncio.gather(
+            asyncio.to_thread(
+                lambda: supabase.table("tournaments").select("id").eq("id", tournament_id).eq("coach_id", user_id).limit(1).execute()
+            ),
+            asyncio.to_thread(_player_name, supabase, matchup.player_id),
+        )
         if not existing.data:
             raise HTTPException(status_code=404, detail="Tournament not found")
     except HTTPException:
@@ -478,7 +676,7 @@ async def create_matchup(
         raise HTTPException(status_code=500, detail=f"Failed to find tournament: {str(e)}")
 
     matchup_id = str(uuid.uuid4())
-    now = datetime.utcnow().isoformat()
+    now = _utc_now_iso()
 
     data = {
         "id": matchup_id,
@@ -500,21 +698,17 @@ async def create_matchup(
     }
 
     try:
-        result = supabase.table("tournament_matchups").insert(data).execute()
+        result = await asyncio.to_thread(lambda: supabase.table("tournament_matchups").insert(data).execute())
+        _invalidate_tournament_reads()
         row = result.data[0]
-
-        if row.get("player_id"):
-            player = supabase.table("players").select("name").eq("id", row["player_id"]).single().execute()
-            row["player_name"] = player.data.get("name") if player.data else None
-        else:
-            row["player_name"] = None
+        row["player_name"] = player_name
 
         return MatchupResponse(**row)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create matchup: {str(e)}")
 
 
-@router.get("/{tournament_id}/matchups", response_model=List[MatchupResponse])
+@router.get("/{tournament_id}/matchups", response_model=None, responses={200: {"model": List[MatchupResponse]}})
 async def list_matchups(
     tournament_id: str,
     user_id: str = Depends(get_current_user_id),
@@ -522,31 +716,28 @@ async def list_matchups(
     supabase = get_supabase()
 
     try:
-        # Global: verify tournament exists (no owner check)
-        existing = supabase.table("tournaments").select("id").eq("id", tournament_id).single().execute()
+        # Global: verify tournament exists (no owner check). The matchups read
+        # goes out alongside it and is dropped if the tournament is missing.
+        # Player names come back embedded through the player_id foreign key.
+        existing, result = await asyncio.gather(
+            asyncio.to_thread(
+                lambda: supabase.table("tournaments").select("id").eq("id", tournament_id).limit(1).execute()
+            ),
+            asyncio.to_thread(
+                lambda: supabase.table("tournament_matchups")
+                .select(_MATCHUP_WITH_PLAYER_COLUMNS)
+                .eq("tournament_id", tournament_id)
+                .order("scheduled_at", desc=False)
+                .execute()
+            ),
+        )
         if not existing.data:
             raise HTTPException(status_code=404, detail="Tournament not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to find tournament: {str(e)}")
-
-    try:
-        result = supabase.table("tournament_matchups").select("*").eq("tournament_id", tournament_id).order("scheduled_at", desc=False).execute()
 
-        matchups = []
         for m in result.data:
-            if m.get("player_id"):
-                try:
-                    player = supabase.table("players").select("name").eq("id", m["player_id"]).single().execute()
-                    m["player_name"] = player.data.get("name") if player.data else None
-                except Exception:
-                    m["player_name"] = None
-            else:
-                m["player_name"] = None
-            matchups.append(MatchupResponse(**m))
+            m["player_name"] = (m.pop("player", None) or {}).get("name")
 
-        return matchups
+        return Response(content=_json_list_body(_MATCHUP_LIST_ADAPTER, result.data), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -561,34 +752,41 @@ async def update_matchup(
 ):
     supabase = get_supabase()
 
-    try:
-        existing = supabase.table("tournament_matchups").select("*").eq("id", matchup_id).eq("coach_id", user_id).single().execute()
-        if not existing.data:
-            raise HTTPException(status_code=404, detail="Matchup not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to find matchup: {str(e)}")
-
-    update_data = {k: v for k, v in matchup.model_dump().items() if v is not None}
-    if "scheduled_at" in update_data and update_data["scheduled_at"]:
-        update_data["scheduled_at"] = update_data["scheduled_at"].isoformat()
+    update_data = matchup.model_dump(exclude_none=True, mode="json")
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    update_data["updated_at"] = datetime.utcnow().isoformat()
+    update_data["updated_at"] = _utc_now_iso()
 
     try:
-        result = supabase.table("tournament_matchups").update(update_data).eq("id", matchup_id).execute()
-        row = result.data[0]
-
-        if row.get("player_id"):
-            player = supabase.table("players").select("name").eq("id", row["player_id"]).single().execute()
-            row["player_name"] = player.data.get("name") if player.data else None
+        update_call = asyncio.to_thread(
+            lambda: supabase.table("tournament_matchups")
+            .update(update_data)
+            .eq("id", matchup_id)
+            .eq("coach_id", user_id)
+            .execute()
+        )
+        # A new player_id is known up front, so its name is read alongside the
+        # update; otherwise it comes from the updated row.
+        if "player_id" in update_data:
+            result, player_name = await asyncio.gather(
+                update_call,
+                asyncio.to_thread(_player_name, supabase, update_data["player_id"]),
+            )
         else:
-            row["player_name"] = None
+            result = await update_call
+            player_name = None
+        if not result.data:
+            raise HTTPException(status_code=404, detail="Matchup not found")
+        _invalidate_tournament_reads()
+        row = result.data[0]
+        if "player_id" not in update_data:
+            player_name = await asyncio.to_thread(_player_name, supabase, row.get("player_id"))
+        row["player_name"] = player_name
 
         return MatchupResponse(**row)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update matchup: {str(e)}")
 
@@ -601,11 +799,12 @@ async def delete_matchup(
     supabase = get_supabase()
 
     try:
-        existing = supabase.table("tournament_matchups").select("*").eq("id", matchup_id).eq("coach_id", user_id).single().execute()
-        if not existing.data:
+        result = await asyncio.to_thread(
+            lambda: supabase.table("tournament_matchups").delete().eq("id", matchup_id).eq("coach_id", user_id).execute()
+        )
+        if not result.data:
             raise HTTPException(status_code=404, detail="Matchup not found")
-
-        supabase.table("tournament_matchups").delete().eq("id", matchup_id).execute()
+        _invalidate_tournament_reads()
         return {"message": "Matchup deleted"}
     except HTTPException:
         raise
@@ -615,36 +814,58 @@ async def delete_matchup(
 
 # --- Stats ---
 
+def _tournament_stats_from_rpc(supabase) -> Optional[Dict[str, int]]:
+    """Global tournament/matchup counters aggregated in Postgres; None if the RPC isn't deployed."""
+    try:
+        row = (supabase.rpc("tournament_stats_summary").execute().data or [{}])[0]
+        return {key: row.get(key) or 0 for key in _STATS_COUNTER_KEYS}
+    except Exception as exc:
+        if not _is_missing_rpc_error(exc):
+            raise
+    return None
+
+
+def _tally_tournament_stats(tournaments: List[dict], matchups: List[dict]) -> Dict[str, int]:
+    # One pass per table; each category is then a dict lookup.
+    by_status = Counter(t.get("status") for t in tournaments)
+    by_result = Counter(m.get("result") for m in matchups)
+    return {
+        "total_tournaments": len(tournaments),
+        "upcoming_tournaments": by_status["upcoming"] + by_status["ongoing"],
+        "completed_tournaments": by_status["completed"],
+        "total_matchups": len(matchups),
+        "wins": by_result["win"],
+        "losses": by_result["loss"],
+        "pending_matchups": by_result["pending"],
+    }
+
+
 @router.get("/stats/summary")
 async def get_tournament_stats(
     user_id: str = Depends(get_current_user_id),
 ):
+    cached = _get_cached_tournament_read(("stats",))
+    if cached is not None:
+        return cached
+
     supabase = get_supabase()
 
     try:
         # Global: aggregate stats across all tournaments
-        tournaments = supabase.table("tournaments").select("id, status").execute()
-        matchups = supabase.table("tournament_matchups").select("result").execute()
-
-        total_tournaments = len(tournaments.data)
-        upcoming = sum(1 for t in tournaments.data if t["status"] in ("upcoming", "ongoing"))
-        completed = sum(1 for t in tournaments.data if t["status"] == "completed")
-
-        total_matchups = len(matchups.data)
-        wins = sum(1 for m in matchups.data if m.get("result") == "win")
-        losses = sum(1 for m in matchups.data if m.get("result") == "loss")
-        pending = sum(1 for m in matchups.data if m.get("result") == "pending")
+        counters = await asyncio.to_thread(_tournament_stats_from_rpc, supabase)
+        if counters is None:
+            # The two table reads are independent, so they go out together.
+            tournaments, matchups = await asyncio.gather(
+                asyncio.to_thread(lambda: supabase.table("tournaments").select("status").execute()),
+                asyncio.to_thread(lambda: supabase.table("tournament_matchups").select("result").execute()),
+            )
+            counters = _tally_tournament_stats(tournaments.data, matchups.data)
+        wins = counters["wins"]
+        losses = counters["losses"]
         win_rate = round((wins / (wins + losses)) * 100, 1) if (wins + losses) > 0 else 0
 
-        return {
-            "total_tournaments": total_tournaments,
-            "upcoming_tournaments": upcoming,
-            "completed_tournaments": completed,
-            "total_matchups": total_matchups,
-            "wins": wins,
-            "losses": losses,
-            "pending_matchups": pending,
-            "win_rate": win_rate,
-        }
+        summary = {**counters, "win_rate": win_rate}
+        _set_cached_tournament_read(("stats",), summary)
+        return summary
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
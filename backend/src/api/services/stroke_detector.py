@@ -467,8 +467,31 @@ class StrokeDetector:
             # Only trust opponent ownership when confidence is solid.
             return confidence < 0.75
 
-        player_strokes = [s for s in strokes if _is_player_stroke(s)]
-        if not player_strokes:
+        # One pass over the strokes: ownership check, counts and score moments.
+        # Mean and variance use Welford's update, which stays accurate when the
+        # scores sit close together (E[x^2] - mean^2 cancels badly there).
+        total = 0
+        forehand_count = 0
+        backhand_count = 0
+        mean_score = 0.0
+        score_m2 = 0.0
+        best_score = float('-inf')
+        for s in strokes:
+            if not _is_player_stroke(s):
+                continue
+            total += 1
+            score = s.form_score
+            delta = score - mean_score
+            mean_score += delta / total
+            score_m2 += delta * (score - mean_score)
+            if score > best_score:
+                best_score = score
+            if s.stroke_type == 'forehand':
+                forehand_count += 1
+            elif s.stroke_type == 'backhand':
+                backhand_count += 1
+
+        if not total:
             return {
                 'average_form_score': 0,
                 'best_form_score': 0,
@@ -478,13 +501,10 @@ class StrokeDetector:
                 'backhand_count': 0,
             }
 
-        form_scores = [s.form_score for s in player_strokes]
-
-        avg_score = sum(form_scores) / len(form_scores)
-        best_score = max(form_scores)
+        avg_score = mean_score
 
         # Calculate consistency (lower variance = higher consistency)
-        variance = sum((score - avg_score) ** 2 for score in form_scores) / len(form_scores)
+        variance = score_m2 / total
         std_dev = math.sqrt(variance)
         consistency = max(0, 100 - std_dev * 2)  # Convert to 0-100 scale
 
@@ -492,7 +512,7 @@ class StrokeDetector:
             'average_form_score': round(avg_score, 1),
             'best_form_score': round(best_score, 1),
             'consistency_score': round(consistency, 1),
-            'total_strokes': len(player_strokes),
-            'forehand_count': sum(1 for s in player_strokes if s.stroke_type == 'forehand'),
-            'backhand_count': sum(1 for s in player_strokes if s.stroke_type == 'backhand'),
+            'total_strokes': total,
+            'forehand_count': forehand_count,
+            'backhand_count': backhand_count,
         }
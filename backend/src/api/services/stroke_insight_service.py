@@ -733,14 +733,27 @@ def generate_insights_for_session(
                     .eq("session_id", session_id)
                     .execute()
                 )
-                rows = updated_strokes.data or []
-                player_rows = [r for r in rows if _is_player_stroke(r)]
-                forehand_count = sum(1 for r in player_rows if r.get("stroke_type") == "forehand")
-                backhand_count = sum(1 for r in player_rows if r.get("stroke_type") == "backhand")
-                scores = [r.get("form_score", 0) for r in player_rows if isinstance(r.get("form_score"), (int, float))]
-                total_strokes = len(player_rows)
-                avg_score = sum(scores) / len(scores) if scores else 0
-                best_score = max(scores) if scores else 0
+                # Single pass: counts, score sum and best score without intermediate lists.
+                total_strokes = forehand_count = backhand_count = scored = 0
+                score_sum = 0.0
+                best_score = None
+                for r in updated_strokes.data or []:
+                    if not _is_player_stroke(r):
+                        continue
+                    total_strokes += 1
+                    stroke_type = r.get("stroke_type")
+                    if stroke_type == "forehand":
+                        forehand_count += 1
+                    elif stroke_type == "backhand":
+                        backhand_count += 1
+                    score = r.get("form_score")
+                    if isinstance(score, (int, float)):
+                        score_sum += score
+                        scored += 1
+                        if best_score is None or score > best_score:
+                            best_score = score
+                avg_score = score_sum / scored if scored else 0
+                best_score = best_score if best_score is not None else 0
 
                 supabase.table("sessions").update({
                     "stroke_summary": {
@@ -29,8 +29,12 @@ KNOWN_WTT_EVENTS_2026 = [
 ]
 
 
-async def scrape_ittf_tournaments(year: Optional[int] = None) -> list[dict]:
-    """Fetch WTT/ITTF tournament data. Tries scraping first, falls back to known events."""
+async def scrape_ittf_tournaments(year: Optional[int] = None) -> tuple[list[dict], bool]:
+    """Fetch WTT/ITTF tournament data. Tries scraping first, falls back to known events.
+
+    Returns ``(tournaments, from_fallback)`` so callers can tell a live scrape
+    from the static list.
+    """
     tournaments: list[dict] = []
 
     # Try scraping the ITTF calendar
@@ -62,8 +66,9 @@ async def scrape_ittf_tournaments(year: Optional[int] = None) -> list[dict]:
         logger.warning(f"ITTF calendar scrape failed, using fallback: {e}")
 
     # If scraping produced nothing, use known events
-    if not tournaments:
+    from_fallback = not tournaments
+    if from_fallback:
         logger.info("Using known WTT 2026 events as fallback")
         tournaments = list(KNOWN_WTT_EVENTS_2026)
 
-    return tournaments[:20]
+    return tournaments[:20], from_fallback
@@ -161,11 +161,12 @@ def _find_youtube_video(
     return None
 
 
-async def seed_real_wtt_tournaments(coach_id: str, supabase) -> list[dict]:
+def seed_real_wtt_tournaments(coach_id: str, supabase) -> list[dict]:
     """
     Seed the tournaments + tournament_matchups tables with real WTT data.
     Skips tournaments that already exist (by name + coach_id).
     Does NOT search YouTube (that's done separately via backfill_videos).
+    Blocking (sync Supabase client); call from a worker thread.
     """
     now = datetime.utcnow().isoformat()
     results = []
@@ -248,10 +249,11 @@ async def seed_real_wtt_tournaments(coach_id: str, supabase) -> list[dict]:
     return results
 
 
-async def backfill_videos(coach_id: str, supabase) -> dict:
+def backfill_videos(coach_id: str, supabase) -> dict:
     """
     Find YouTube videos for matchups that don't have one yet.
     Uses yt-dlp to search @ITTFWorld channel. Returns stats.
+    Blocking (sync Supabase client + yt-dlp); call from a worker thread.
     """
     stats = {"searched": 0, "found": 0, "skipped": 0}
 
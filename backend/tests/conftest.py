@@ -0,0 +1,489 @@
+"""Shared fixtures: an in-memory stand-in for the supabase client."""
+
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+from fastapi.testclient import TestClient
+from postgrest.exceptions import APIError
+
+from src.api.database.supabase import get_current_user_id
+from src.api.main import app
+from src.api.routes import stroke, tournaments
+
+USER_ID = "u1"
+
+
+def api_error(code: str, message: str = "") -> APIError:
+    return APIError({"code": code, "message": message or code, "hint": None, "details": None})
+
+
+# (parent table, embedded resource) -> (child table, child column, parent column, to-many)
+_EMBEDS = {
+    ("sessions", "stroke_analytics"): ("stroke_analytics", "session_id", "id", True),
+    ("tournament_matchups", "players"): ("players", "id", "player_id", False),
+}
+
+
+def _split_columns(columns: str) -> List[str]:
+    """Split a PostgREST select list on top-level commas."""
+    items, depth, current = [], 0, ""
+    for char in columns:
+        if char == "," and depth == 0:
+            items.append(current.strip())
+            current = ""
+            continue
+        depth += char == "("
+        depth -= char == ")"
+        current += char
+    if current.strip():
+        items.append(current.strip())
+    return items
+
+
+def _sort_key(column: str):
+    return lambda row: (row.get(column) is None, row.get(column))
+
+
+class FakeQuery:
+    """Chainable builder over FakeSupabase rows covering the calls the routes make."""
+
+    def __init__(self, client: "FakeSupabase", table: str):
+        self.client = client
+        self.table = table
+        self.op = "select"
+        self.columns = "*"
+        self.payload: Any = None
+        self.filters: List[Tuple[str, str, Any]] = []
+        self.orders: Dict[Optional[str], List[Tuple[str, bool]]] = {}
+        self.ranges: Dict[Optional[str], Tuple[int, int]] = {}
+        self.row_limit: Optional[int] = None
+        self.one: Optional[str] = None
+
+    def select(self, columns: str = "*", **_: Any) -> "FakeQuery":
+        self.columns = columns
+        return self
+
+    def insert(self, rows: Any) -> "FakeQuery":
+        self.op, self.payload = "insert", rows
+        return self
+
+    def upsert(self, rows: Any, **_: Any) -> "FakeQuery":
+        self.op, self.payload = "upsert", rows
+        return self
+
+    def update(self, patch: Dict[str, Any]) -> "FakeQuery":
+        self.op, self.payload = "update", patch
+        return self
+
+    def delete(self) -> "FakeQuery":
+        self.op = "delete"
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append((column, "eq", value))
+        return self
+
+    def in_(self, column: str, values: List[Any]) -> "FakeQuery":
+        self.filters.append((column, "in", list(values)))
+        return self
+
+    def gte(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append((column, "gte", value))
+        return self
+
+    def lte(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append((column, "lte", value))
+        return self
+
+    def order(self, column: str, *, desc: bool = False, foreign_table: Optional[str] = None) -> "FakeQuery":
+        self.orders.setdefault(foreign_table, []).append((column, desc))
+        return self
+
+    def range(self, start: int, end: int, *, foreign_table: Optional[str] = None) -> "FakeQuery":
+        self.ranges[foreign_table] = (start, end)
+        return self
+
+    def limit(self, count: int) -> "FakeQuery":
+        self.row_limit = count
+        return self
+
+    def single(self) -> "FakeQuery":
+        self.one = "single"
+        return self
+
+    def maybe_single(self) -> "FakeQuery":
+        self.one = "maybe"
+        return self
+
+    def execute(self) -> SimpleNamespace:
+        self.client.calls.append(self)
+        for table, op, when, error in self.client.failures:
+            if table == self.table and op == self.op and (when is None or when(self)):
+                raise error
+        rows = self.client.rows(self.table)
+        data = getattr(self, f"_{self.op}")(rows)
+        if self.one == "single":
+            if len(data) != 1:
+                raise api_error("PGRST116", "JSON object requested, multiple (or no) rows returned")
+            return SimpleNamespace(data=data[0])
+        if self.one == "maybe":
+            return SimpleNamespace(data=data[0] if data else None)
+        return SimpleNamespace(data=data)
+
+    # -- operations --
+
+    def _select(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        rows = self._page(self._matching(rows, None), None)
+        if self.row_limit is not None:
+            rows = rows[:self.row_limit]
+        return [self._project(row) for row in rows]
+
+    def _insert(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        new_rows = [dict(r) for r in (self.payload if isinstance(self.payload, list) else [self.payload])]
+        rows.extend(new_rows)
+        return [dict(r) for r in new_rows]
+
+    def _upsert(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        out = []
+        for new in self.payload if isinstance(self.payload, list) else [self.payload]:
+            existing = next((r for r in rows if r.get("id") == new.get("id")), None)
+            if existing is None:
+                existing = {}
+                rows.append(existing)
+            existing.update(new)
+            out.append(dict(existing))
+        return out
+
+    def _update(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        matched = self._matching(rows, None)
+        for row in matched:
+            row.update(self.payload)
+        return [dict(r) for r in matched]
+
+    def _delete(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        matched = self._matching(rows, None)
+        rows[:] = [r for r in rows if r not in matched]
+        return [dict(r) for r in matched]
+
+    # -- helpers --
+
+    def _matching(self, rows: List[Dict[str, Any]], prefix: Optional[str]) -> List[Dict[str, Any]]:
+        for column, op, value in self.filters:
+            scope, _, name = column.rpartition(".")
+            if (scope or None) != prefix:
+                continue
+            if op == "eq":
+                rows = [r for r in rows if r.get(name) == value]
+            elif op == "in":
+                rows = [r for r in rows if r.get(name) in value]
+            elif op == "gte":
+                rows = [r for r in rows if r.get(name) is not None and r[name] >= value]
+            elif op == "lte":
+                rows = [r for r in rows if r.get(name) is not None and r[name] <= value]
+        return list(rows)
+
+    def _page(self, rows: List[Dict[str, Any]], scope: Optional[str]) -> List[Dict[str, Any]]:
+        for column, desc in reversed(self.orders.get(scope, [])):
+            rows.sort(key=_sort_key(column), reverse=desc)
+        if scope in self.ranges:
+            start, end = self.ranges[scope]
+            rows = rows[start:end + 1]
+        return rows
+
+    def _project(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        missing = self.client.missing_columns.get(self.table, set())
+        for item in _split_columns(self.columns):
+            if item == "*":
+                out.update(row)
+                continue
+            if "(" not in item:
+                if item in missing:
+                    raise api_error("42703", f"column {self.table}.{item} does not exist")
+                out[item] = row.get(item)
+                continue
+            head, inner = item[:-1].split("(", 1)
+            alias, _, resource = head.rpartition(":")
+            out[alias or resource] = self._embed(row, resource, inner)
+        return out
+
+    def _embed(self, row: Dict[str, Any], resource: str, columns: str) -> Any:
+        child_table, child_column, parent_column, many = _EMBEDS[(self.table, resource)]
+        children = [r for r in self.client.rows(child_table) if r.get(child_column) == row.get(parent_column)]
+        if columns == "count":
+            return [{"count": len(children)}]
+        children = self._page(self._matching(children, resource), resource)
+        nested = FakeQuery(self.client, child_table).select(columns)
+        projected = [nested._project(child) for child in children]
+        if many:
+            return projected
+        return projected[0] if projected else None
+
+
+class FakeRpc:
+    def __init__(self, client: "FakeSupabase", name: str, params: Dict[str, Any]):
+        self.client = client
+        self.name = name
+        self.params = params
+
+    def execute(self) -> SimpleNamespace:
+        self.client.rpc_calls.append((self.name, self.params))
+        handler = self.client.rpcs.get(self.name)
+        if handler is None:
+            raise api_error("PGRST202", f"Could not find the function public.{self.name}")
+        return SimpleNamespace(data=handler(self.params))
+
+
+class FakeBucket:
+    def __init__(self, name: str):
+        self.name = name
+        self.uploads: Dict[str, bytes] = {}
+        self.upload_options: Dict[str, Dict[str, str]] = {}
+        self.signed: List[str] = []
+
+    def upload(self, path: str, file: Any, options: Optional[Dict[str, str]] = None) -> None:
+        self.uploads[path] = file if isinstance(file, bytes) else file.read()
+        self.upload_options[path] = dict(options or {})
+
+    def get_public_url(self, path: str) -> str:
+        return f"https://storage.test/{self.name}/{path}"
+
+    def create_signed_url(self, path: str, expires_in: int) -> Dict[str, str]:
+        self.signed.append(path)
+        return {"signedURL": f"https://storage.test/{self.name}/{path}?token={len(self.signed)}"}
+
+
+class FakeStorage:
+    def __init__(self):
+        self.buckets: Dict[str, FakeBucket] = {}
+
+    def from_(self, name: str) -> FakeBucket:
+        return self.buckets.setdefault(name, FakeBucket(name))
+
+
+class FakeSupabase:
+    """
+    Tables and views are plain row lists; a name that is in neither raises
+    PGRST205 like an undeployed relation, and an unregistered RPC raises PGRST202.
+    """
+
+    def __init__(self):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        self.views: Dict[str, Callable[["FakeSupabase"], List[Dict[str, Any]]]] = {}
+        self.rpcs: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self.missing_columns: Dict[str, set] = {}
+        self.failures: List[Tuple[str, str, Optional[Callable[[FakeQuery], bool]], Exception]] = []
+        self.calls: List[FakeQuery] = []
+        self.rpc_calls: List[Tuple[str, Dict[str, Any]]] = []
+        self.storage = FakeStorage()
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> FakeRpc:
+        return FakeRpc(self, name, params or {})
+
+    def rows(self, name: str) -> List[Dict[str, Any]]:
+        if name in self.views:
+            return self.views[name](self)
+        if name not in self.tables:
+            raise api_error("PGRST205", f"Could not find the table 'public.{name}' in the schema cache")
+        return self.tables[name]
+
+    def fail(self, table: str, op: str, error: Exception, when: Optional[Callable[[FakeQuery], bool]] = None) -> None:
+        """Make matching queries raise `error` instead of running."""
+        self.failures.append((table, op, when, error))
+
+    def queries(self, table: Optional[str] = None, op: Optional[str] = None) -> List[FakeQuery]:
+        return [q for q in self.calls if (table is None or q.table == table) and (op is None or q.op == op)]
+
+    def tables_read(self) -> List[str]:
+        return [q.table for q in self.calls]
+
+
+class FakeClock:
+    """Timer for TTLCaches swapped in by tests that need entries to expire."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+_MODULE_CACHES = (
+    stroke.STROKE_PROGRESS,
+    stroke._STROKE_READ_CACHE,
+    stroke._PROGRESS_OWNER_CACHE,
+    stroke._SIGNED_LOG_URL_CACHE,
+    stroke._DEBUG_RUNS_TABLE_PROBE,
+    stroke._SESSION_SUMMARY_COLUMNS_PROBE,
+    tournaments._TOURNAMENT_READ_CACHE,
+    tournaments._ITTF_CALENDAR_CACHE,
+    tournaments._ITTF_FALLBACK_CACHE,
+)
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    """A FakeSupabase behind every route's get_supabase(), with user 'u1' signed in."""
+    fake = FakeSupabase()
+    monkeypatch.setattr(stroke, "get_supabase", lambda: fake)
+    monkeypatch.setattr(tournaments, "get_supabase", lambda: fake)
+    app.dependency_overrides[get_current_user_id] = lambda: USER_ID
+    for cache in _MODULE_CACHES:
+        cache.clear()
+    yield fake
+    app.dependency_overrides.pop(get_current_user_id, None)
+    for cache in _MODULE_CACHES:
+        cache.clear()
+
+
+@pytest.fixture
+def client(fake_supabase) -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+SESSION_ID = "sess-1"
+
+
+def make_strokes(session_id: str, count: int) -> List[Dict[str, Any]]:
+    # Pairs of strokes share a start_frame so the id tiebreak matters.
+    return [
+        {
+            "id": f"s{i:04d}",
+            "session_id": session_id,
+            "start_frame": (i // 2) * 10,
+            "end_frame": (i // 2) * 10 + 8,
+            "peak_frame": (i // 2) * 10 + 4,
+            "stroke_type": "forehand" if i % 3 else "backhand",
+            "duration": 0.3,
+            "max_velocity": 1.5 + i,
+            "form_score": 70.0 + i,
+            "metrics": {},
+            "ai_insight": None,
+            "ai_insight_data": None,
+        }
+        for i in reversed(range(count))
+    ]
+
+
+@pytest.fixture
+def stroke_session(fake_supabase):
+    """Seed session 'sess-1' (owned by 'u1') with `count` strokes and migration 016 aggregates."""
+
+    def seed(count: int, **session_fields: Any) -> FakeSupabase:
+        strokes = make_strokes(SESSION_ID, count)
+        scores = [s["form_score"] for s in strokes]
+        fake_supabase.tables["sessions"] = [{
+            "id": SESSION_ID,
+            "user_id": USER_ID,
+            "updated_at": "2026-01-01T00:00:00+00:00",
+            "stroke_summary": {"consistency_score": 90.0, "timeline_tips": []},
+            "average_form_score": sum(scores) / len(scores) if scores else 0,
+            "best_form_score": max(scores, default=0),
+            "total_strokes": count,
+            "forehand_count": sum(s["stroke_type"] == "forehand" for s in strokes),
+            "backhand_count": sum(s["stroke_type"] == "backhand" for s in strokes),
+            **session_fields,
+        }]
+        fake_supabase.tables["stroke_analytics"] = strokes
+        return fake_supabase
+
+    return seed
+
+
+def _tournament(tournament_id: str, status: str, start_date: str, coach_id: str = USER_ID) -> Dict[str, Any]:
+    return {
+        "id": tournament_id,
+        "coach_id": coach_id,
+        "name": f"Open {tournament_id}",
+        "location": None,
+        "start_date": start_date,
+        "end_date": None,
+        "level": "international",
+        "status": status,
+        "surface": None,
+        "notes": None,
+        "metadata": {},
+        "created_at": "2026-01-01T00:00:00",
+        "updated_at": "2026-01-01T00:00:00",
+    }
+
+
+def _matchup(matchup_id: str, tournament_id: str, result: str, player_id: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "id": matchup_id,
+        "tournament_id": tournament_id,
+        "coach_id": USER_ID,
+        "player_id": player_id,
+        "opponent_name": f"Opponent {matchup_id}",
+        "opponent_club": None,
+        "opponent_ranking": None,
+        "round": None,
+        "scheduled_at": f"2026-03-0{matchup_id[-1]}T10:00:00",
+        "result": result,
+        "score": None,
+        "session_id": None,
+        "notes": None,
+        "youtube_url": None,
+        "created_at": "2026-01-01T00:00:00",
+        "updated_at": "2026-01-01T00:00:00",
+    }
+
+
+def tournament_stats_view(fake: FakeSupabase) -> List[Dict[str, Any]]:
+    """Rows of the tournament_stats view (migration 024) computed from the base tables."""
+    stats: Dict[str, Dict[str, Any]] = {}
+    for m in fake.tables["tournament_matchups"]:
+        row = stats.setdefault(m["tournament_id"], {
+            "tournament_id": m["tournament_id"], "matchup_count": 0, "win_count": 0, "loss_count": 0,
+        })
+        row["matchup_count"] += 1
+        row["win_count"] += m.get("result") == "win"
+        row["loss_count"] += m.get("result") == "loss"
+    return list(stats.values())
+
+
+def tournaments_with_counts_view(fake: FakeSupabase) -> List[Dict[str, Any]]:
+    """Rows of v_tournaments_with_counts (migration 027): tournaments with zero-filled matchup counts."""
+    stats = {row["tournament_id"]: row for row in tournament_stats_view(fake)}
+    empty = {"matchup_count": 0, "win_count": 0, "loss_count": 0}
+    return [
+        {**t, **{k: stats.get(t["id"], empty)[k] for k in empty}}
+        for t in fake.tables["tournaments"]
+    ]
+
+
+@pytest.fixture
+def tournament_db(fake_supabase) -> FakeSupabase:
+    """
+    Four tournaments (t1, t2 coached by 'u1'; t3, t4 by 'coach-2') and five
+    matchups on t1/t2, with neither database view deployed.
+    """
+    fake_supabase.tables.update({
+        "tournaments": [
+            _tournament("t1", "upcoming", "2026-03-01"),
+            _tournament("t2", "completed", "2025-05-01"),
+            _tournament("t3", "ongoing", "2026-01-10", coach_id="coach-2"),
+            _tournament("t4", "cancelled", "2024-01-01", coach_id="coach-2"),
+        ],
+        "tournament_matchups": [
+            _matchup("m1", "t1", "win", player_id="p1"),
+            _matchup("m2", "t1", "loss"),
+            _matchup("m3", "t1", "pending", player_id="p1"),
+            _matchup("m4", "t2", "win"),
+            _matchup("m5", "t2", "win"),
+        ],
+        "players": [{"id": "p1", "name": "Ana"}],
+    })
+    return fake_supabase
@@ -0,0 +1,73 @@
+"""POST /api/stroke/analyze/{session_id}."""
+
+import pytest
+
+from conftest import SESSION_ID, USER_ID
+
+from src.api.routes import stroke
+
+URL = f"/api/stroke/analyze/{SESSION_ID}"
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    runs = []
+    monkeypatch.setattr(stroke, "process_stroke_detection", lambda *args: runs.append(args))
+    return runs
+
+
+def _seed(fake, **session_fields):
+    fake.tables["sessions"] = [{"id": SESSION_ID, "user_id": USER_ID, "pose_video_path": None, **session_fields}]
+    fake.tables["pose_analysis"] = []
+
+
+def test_session_is_claimed_with_one_rpc_call(client, fake_supabase, queued):
+    fake_supabase.rpcs["start_stroke_analysis"] = lambda params: "started"
+
+    response = client.post(URL)
+
+    assert response.json()["status"] == "processing"
+    assert fake_supabase.rpc_calls == [("start_stroke_analysis", {"p_session_id": SESSION_ID, "p_user_id": USER_ID})]
+    assert fake_supabase.calls == []
+    assert queued == [(SESSION_ID, False, USER_ID)]
+    assert stroke._get_stroke_progress(SESSION_ID)["status"] == "processing"
+
+
+@pytest.mark.parametrize("outcome, status_code", [("not_found", 404), ("no_pose_data", 400), (None, 404)])
+def test_rpc_refusals_map_to_errors(client, fake_supabase, queued, outcome, status_code):
+    fake_supabase.rpcs["start_stroke_analysis"] = lambda params: outcome
+
+    assert client.post(URL).status_code == status_code
+    assert queued == []
+
+
+def test_missing_rpc_falls_back_to_table_reads(client, fake_supabase, queued):
+    _seed(fake_supabase)
+    fake_supabase.tables["pose_analysis"] = [{"id": "p1", "session_id": SESSION_ID}]
+
+    assert client.post(URL).status_code == 200
+
+    assert fake_supabase.tables["sessions"][0]["stroke_analysis_status"] == "processing"
+    assert queued == [(SESSION_ID, False, USER_ID)]
+
+
+def test_fallback_skips_the_pose_probe_when_a_pose_video_exists(client, fake_supabase, queued):
+    _seed(fake_supabase, pose_video_path="u1/sess-1/pose.mp4")
+
+    assert client.post(URL).status_code == 200
+    assert "pose_analysis" not in fake_supabase.tables_read()
+
+
+def test_fallback_without_pose_data_is_400(client, fake_supabase, queued):
+    _seed(fake_supabase)
+
+    assert client.post(URL).status_code == 400
+    assert "stroke_analysis_status" not in fake_supabase.tables["sessions"][0]
+    assert queued == []
+
+
+def test_fallback_for_another_users_session_is_404(client, fake_supabase, queued):
+    _seed(fake_supabase, user_id="someone-else", pose_video_path="x.mp4")
+
+    assert client.post(URL).status_code == 404
+    assert queued == []
@@ -0,0 +1,74 @@
+"""Debug-log uploads to Storage."""
+
+import gzip
+from datetime import datetime, timezone
+
+import numpy as np
+
+from conftest import FakeSupabase
+
+from src.api.routes import stroke
+
+BUCKET = "provision-videos"
+
+
+def _payload(event_count):
+    return {
+        "session_id": "sess-1",
+        "generated_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "hybrid_debug": {
+            "events": [{"frame": i, "score": np.float32(0.5), "tags": ("a", "b")} for i in range(event_count)],
+            7: {"nested": {"keys": [1, 2, 3]}},
+            "velocity": np.arange(4, dtype=np.float64),
+        },
+        "final_strokes": [],
+    }
+
+
+def test_spooled_upload_matches_in_memory_encoding():
+    payload = _payload(stroke._DEBUG_LOG_SPOOL_MIN_EVENTS)
+    supabase = FakeSupabase()
+
+    stroke._upload_debug_log_from_spool(supabase, "u1/sess-1/run.json.gz", payload)
+
+    uploaded = gzip.decompress(supabase.storage.from_(BUCKET).uploads["u1/sess-1/run.json.gz"])
+    assert uploaded == stroke._dump_debug_json(payload)
+
+
+def test_large_logs_take_the_spool_path(monkeypatch):
+    spooled = []
+    monkeypatch.setattr(stroke, "_upload_debug_log_from_spool", lambda supabase, path, payload: spooled.append(path))
+    supabase = FakeSupabase()
+
+    for event_count in (stroke._DEBUG_LOG_SPOOL_MIN_EVENTS - 1, stroke._DEBUG_LOG_SPOOL_MIN_EVENTS):
+        stroke._upload_debug_log_to_storage(
+            supabase, user_id="u1", session_id="sess-1", run_id=f"run-{event_count}", payload=_payload(event_count)
+        )
+
+    assert spooled == [f"u1/sess-1/debug/stroke-analysis/run-{stroke._DEBUG_LOG_SPOOL_MIN_EVENTS}.json.gz"]
+
+
+def test_small_logs_are_gzipped_in_memory():
+    payload = _payload(3)
+    supabase = FakeSupabase()
+
+    result = stroke._upload_debug_log_to_storage(
+        supabase, user_id="u1", session_id="sess-1", run_id="run-1", payload=payload
+    )
+
+    path = "u1/sess-1/debug/stroke-analysis/run-1.json.gz"
+    bucket = supabase.storage.from_(BUCKET)
+    assert result == {"ok": True, "reason": "ok", "path": path, "url": bucket.get_public_url(path)}
+    assert gzip.decompress(bucket.uploads[path]) == stroke._dump_debug_json(payload)
+    assert bucket.upload_options[path] == {"content-type": "application/gzip"}
+
+
+def test_logs_without_an_owner_are_not_uploaded():
+    supabase = FakeSupabase()
+
+    result = stroke._upload_debug_log_to_storage(
+        supabase, user_id=None, session_id="sess-1", run_id="run-1", payload=_payload(1)
+    )
+
+    assert result["ok"] is False
+    assert supabase.storage.buckets == {}
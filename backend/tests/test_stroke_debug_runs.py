@@ -0,0 +1,108 @@
+"""Debug-run endpoints: /debug-runs/{session_id} and /debug-run/{run_id}."""
+
+from cachetools import TTLCache
+
+from conftest import SESSION_ID, USER_ID
+
+from src.api.routes import stroke
+
+RUNS_TABLE = stroke._DEBUG_RUNS_TABLE
+
+
+def _run(run_id, **fields):
+    return {
+        "id": run_id,
+        "session_id": SESSION_ID,
+        "user_id": USER_ID,
+        "status": "completed",
+        "started_at": "2026-01-01T00:00:00+00:00",
+        "completed_at": "2026-01-01T00:01:00+00:00",
+        "created_at": f"2026-01-01T00:00:0{run_id[-1]}+00:00",
+        "storage_path": f"{USER_ID}/{SESSION_ID}/debug/stroke-analysis/{run_id}.json.gz",
+        "debug_stats": {"phase": "completed"},
+        **fields,
+    }
+
+
+def test_signed_log_url_is_reused_until_it_nears_expiry(client, fake_supabase, clock, monkeypatch):
+    monkeypatch.setattr(stroke, "_SIGNED_LOG_URL_CACHE", TTLCache(maxsize=2048, ttl=3000, timer=clock))
+    fake_supabase.tables[RUNS_TABLE] = [_run("run-1"), _run("run-2")]
+    bucket = fake_supabase.storage.from_("provision-videos")
+
+    first = client.get("/api/stroke/debug-run/run-1").json()["signed_log_url"]
+    clock.advance(2999)
+    assert client.get("/api/stroke/debug-run/run-1").json()["signed_log_url"] == first
+    assert len(bucket.signed) == 1
+
+    # Each log has its own URL, and a cached one is re-signed after 50 minutes.
+    client.get("/api/stroke/debug-run/run-2")
+    clock.advance(2)
+    refreshed = client.get("/api/stroke/debug-run/run-1").json()["signed_log_url"]
+    assert refreshed != first
+    assert bucket.signed == [_run("run-1")["storage_path"], _run("run-2")["storage_path"], _run("run-1")["storage_path"]]
+
+
+def test_missing_runs_table_is_probed_once(client, stroke_session):
+    fake = stroke_session(0)
+
+    for _ in range(2):
+        assert client.get(f"/api/stroke/debug-runs/{SESSION_ID}").json() == {
+            "session_id": SESSION_ID, "count": 0, "runs": [],
+        }
+    assert client.get("/api/stroke/debug-run/run-1").status_code == 404
+    assert len(fake.queries(RUNS_TABLE)) == 1
+
+
+def test_runs_table_created_later_is_picked_up_after_the_probe_ttl(client, stroke_session, clock, monkeypatch):
+    monkeypatch.setattr(stroke, "_DEBUG_RUNS_TABLE_PROBE", TTLCache(maxsize=1, ttl=600, timer=clock))
+    fake = stroke_session(0)
+    assert client.get(f"/api/stroke/debug-runs/{SESSION_ID}").json()["count"] == 0
+
+    fake.tables[RUNS_TABLE] = [_run("run-1")]
+    assert client.get("/api/stroke/debug-run/run-1").status_code == 404
+    clock.advance(601)
+
+    assert client.get("/api/stroke/debug-run/run-1").json()["run"]["id"] == "run-1"
+
+
+def test_finished_run_list_is_cached_until_the_session_is_invalidated(client, stroke_session):
+    fake = stroke_session(0)
+    fake.tables[RUNS_TABLE] = [_run("run-1")]
+    url = f"/api/stroke/debug-runs/{SESSION_ID}"
+    assert client.get(url).json()["count"] == 1
+    fake.tables[RUNS_TABLE].append(_run("run-2"))
+    fake.calls.clear()
+
+    assert client.get(url).json()["count"] == 1
+    assert fake.calls == []
+
+    # Starting or finalizing a run drops the session's cached reads.
+    stroke._invalidate_stroke_reads(SESSION_ID)
+    assert [r["id"] for r in client.get(url).json()["runs"]] == ["run-2", "run-1"]
+
+
+def test_run_list_is_not_cached_while_a_run_is_processing(client, stroke_session):
+    fake = stroke_session(0)
+    fake.tables[RUNS_TABLE] = [_run("run-1", status="processing")]
+    stroke._store_stroke_progress(SESSION_ID, {"run_id": "run-1", "user_id": USER_ID, "status": "processing"})
+    url = f"/api/stroke/debug-runs/{SESSION_ID}"
+
+    client.get(url)
+    fake.tables[RUNS_TABLE][0]["status"] = "completed"
+
+    assert client.get(url).json()["runs"][0]["status"] == "completed"
+
+
+def test_run_list_leaves_out_debug_stats_and_pages_by_offset(client, stroke_session):
+    fake = stroke_session(0)
+    fake.tables[RUNS_TABLE] = [_run(f"run-{i}") for i in range(1, 6)]
+    url = f"/api/stroke/debug-runs/{SESSION_ID}"
+
+    first = client.get(url, params={"limit": 2}).json()["runs"]
+    second = client.get(url, params={"limit": 2, "offset": 2}).json()["runs"]
+
+    assert [r["id"] for r in first + second] == ["run-5", "run-4", "run-3", "run-2"]
+    assert all("debug_stats" not in r for r in first + second)
+    # The detail endpoint still returns the full stats.
+    assert client.get("/api/stroke/debug-run/run-3").json()["run"]["debug_stats"] == {"phase": "completed"}
+    assert client.get(url, params={"offset": -1}).status_code == 422
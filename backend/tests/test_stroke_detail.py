@@ -0,0 +1,80 @@
+"""GET /api/stroke/stroke/{stroke_id}."""
+
+import pytest
+from postgrest.exceptions import APIError
+
+from conftest import SESSION_ID, api_error
+
+URL = "/api/stroke/stroke/s0002"
+
+
+def test_detail_comes_from_one_rpc_call(client, stroke_session):
+    fake = stroke_session(3)
+    stroke_row = fake.tables["stroke_analytics"][0]
+    frames = [{"frame_number": 11, "person_id": 0}]
+    fake.rpcs["get_stroke_detail"] = lambda params: {"stroke": stroke_row, "pose_frames": frames}
+
+    body = client.get(URL).json()
+
+    assert body == {"stroke": stroke_row, "pose_frames": frames}
+    assert fake.rpc_calls == [("get_stroke_detail", {"p_stroke_id": "s0002", "p_user_id": "u1"})]
+    assert fake.calls == []
+
+
+def test_rpc_without_a_stroke_is_404(client, stroke_session):
+    fake = stroke_session(3)
+    fake.rpcs["get_stroke_detail"] = lambda params: None
+
+    assert client.get(URL).status_code == 404
+
+
+def _seed_pose_frames(fake):
+    fake.tables["pose_analysis"] = [
+        {"session_id": SESSION_ID, "person_id": person_id, "frame_number": frame}
+        for frame in reversed(range(8, 21))
+        for person_id in (0, 1)
+    ]
+
+
+def test_missing_rpc_falls_back_to_table_reads(client, stroke_session):
+    fake = stroke_session(3)
+    _seed_pose_frames(fake)
+
+    body = client.get(URL).json()
+
+    assert body["stroke"] == next(r for r in fake.tables["stroke_analytics"] if r["id"] == "s0002")
+    # Player frames only, inside the stroke's 10..18 window, in frame order.
+    assert [(f["person_id"], f["frame_number"]) for f in body["pose_frames"]] == [(0, n) for n in range(10, 19)]
+    assert sorted(fake.tables_read()) == ["pose_analysis", "sessions", "stroke_analytics"]
+
+
+def test_fallback_hides_strokes_of_other_users_sessions(client, stroke_session):
+    fake = stroke_session(3, user_id="someone-else")
+    _seed_pose_frames(fake)
+
+    response = client.get(URL)
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Session not found"
+
+
+def test_fallback_unknown_stroke_is_404(client, stroke_session):
+    stroke_session(3)
+
+    response = client.get("/api/stroke/stroke/nope")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Stroke not found"
+
+
+def test_other_rpc_errors_are_not_masked(client, stroke_session):
+    fake = stroke_session(3)
+
+    def _timeout(params):
+        raise api_error("57014", "canceling statement due to statement timeout")
+
+    fake.rpcs["get_stroke_detail"] = _timeout
+
+    with pytest.raises(APIError):
+        client.get(URL)
+    assert fake.calls == []
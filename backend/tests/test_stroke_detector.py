@@ -0,0 +1,53 @@
+"""StrokeDetector.calculate_overall_form_score."""
+
+import statistics
+
+import pytest
+
+from src.api.services.stroke_detector import Stroke, StrokeDetector
+
+
+def _stroke(form_score, stroke_type="forehand", metrics=None):
+    return Stroke(
+        start_frame=0,
+        end_frame=8,
+        peak_frame=4,
+        stroke_type=stroke_type,
+        duration=0.3,
+        max_velocity=2.0,
+        form_score=form_score,
+        metrics=metrics or {},
+    )
+
+
+def test_overall_stats_cover_player_strokes_only():
+    scores = [62.0, 71.5, 88.0, 90.5, 79.0]
+    strokes = [_stroke(s, "forehand" if i % 2 else "backhand") for i, s in enumerate(scores)]
+    strokes.append(_stroke(99.0, metrics={"event_hitter": "opponent", "event_hitter_confidence": 0.9}))
+
+    summary = StrokeDetector().calculate_overall_form_score(strokes)
+
+    assert summary == {
+        "average_form_score": round(statistics.fmean(scores), 1),
+        "best_form_score": 90.5,
+        "consistency_score": round(max(0, 100 - statistics.pstdev(scores) * 2), 1),
+        "total_strokes": 5,
+        "forehand_count": 2,
+        "backhand_count": 3,
+    }
+
+
+def test_consistency_stays_accurate_for_large_close_scores():
+    # Population std dev 4.743...; E[x^2] - mean^2 loses it entirely at this magnitude.
+    strokes = [_stroke(1e9 + offset) for offset in (4, 7, 13, 16)]
+
+    summary = StrokeDetector().calculate_overall_form_score(strokes)
+
+    assert summary["consistency_score"] == pytest.approx(round(100 - 2 * statistics.pstdev([4, 7, 13, 16]), 1))
+
+
+@pytest.mark.parametrize("strokes", [[], [_stroke(99.0, metrics={"event_hitter": "opponent", "event_hitter_confidence": 0.8})]])
+def test_no_player_strokes_is_all_zero(strokes):
+    summary = StrokeDetector().calculate_overall_form_score(strokes)
+
+    assert set(summary.values()) == {0}
@@ -0,0 +1,207 @@
+"""process_stroke_detection end to end against the in-memory client."""
+
+from concurrent.futures import Future
+
+import logging
+
+import pytest
+
+from conftest import SESSION_ID, USER_ID, api_error
+
+from src.api.routes import stroke
+from src.api.services.stroke_detector import Stroke, StrokeDetector
+
+RUNS_TABLE = stroke._DEBUG_RUNS_TABLE
+
+
+class _InlineExecutor:
+    """Runs submitted work immediately so background writes land before asserts."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _strokes(count):
+    return [
+        Stroke(
+            start_frame=i * 10,
+            end_frame=i * 10 + 8,
+            peak_frame=i * 10 + 4,
+            stroke_type="forehand" if i % 2 else "backhand",
+            duration=0.3,
+            max_velocity=2.0,
+            form_score=70.0 + i,
+            metrics={},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def pipeline(fake_supabase, clock, monkeypatch, tmp_path):
+    """
+    Seed a session with pose data and stub the detector and insight stages.
+    `hooks.on_detect(progress_callback)` runs inside detection; the run returns
+    `hooks.strokes`. perf_counter follows `clock`.
+    """
+    fake_supabase.tables.update({
+        "sessions": [{"id": SESSION_ID, "user_id": USER_ID, "camera_facing": "back"}],
+        "pose_analysis": [
+            {"session_id": SESSION_ID, "person_id": person_id, "frame_number": frame, "timestamp": frame / 30}
+            for frame in range(40)
+            for person_id in (0, 1)
+        ],
+        "stroke_analytics": [],
+        RUNS_TABLE: [],
+    })
+    fake_supabase.rpcs["get_stroke_run_context"] = lambda params: [{
+        "trajectory_data": {"frames": []},
+        "video_path": "https://videos.test/a.mp4",
+        "user_id": USER_ID,
+        "camera_facing": "back",
+        "handedness": "left",
+    }]
+    hooks = type("Hooks", (), {"on_detect": staticmethod(lambda progress: None), "strokes": _strokes(3)})
+
+    def _detect(**kwargs):
+        hooks.on_detect(kwargs["progress_callback"])
+        return hooks.strokes, {"events": len(hooks.strokes)}, StrokeDetector(), {"events": []}
+
+    monkeypatch.setattr(stroke, "detect_strokes_hybrid", _detect)
+    monkeypatch.setattr(
+        stroke, "generate_insights_for_session", lambda **kwargs: {"skipped": True, "reason": "test"}
+    )
+    monkeypatch.setattr(stroke, "_STROKE_WRITE_EXECUTOR", _InlineExecutor())
+    monkeypatch.setattr(stroke, "_LOCAL_SHOT_LOG_DIR", tmp_path)
+    monkeypatch.setattr(stroke, "perf_counter", clock)
+    return hooks
+
+
+def _run_pipeline():
+    stroke.process_stroke_detection(SESSION_ID, use_claude_classifier=False, owner_user_id=USER_ID)
+
+
+def _debug_stats_patches(fake):
+    return [q for q in fake.queries(RUNS_TABLE, "update") if set(q.payload) == {"debug_stats"}]
+
+
+def test_running_ticks_are_patched_at_most_once_per_interval(pipeline, fake_supabase, clock):
+    seen = []
+
+    def on_detect(progress):
+        before = len(_debug_stats_patches(fake_supabase))
+        for stage in ("pose_strokes", "trajectory_events", "contact_events"):
+            progress({"stage_id": stage, "status": "running"})
+        # Every tick still reaches the in-memory progress entry.
+        seen.append(stroke._get_stroke_progress(SESSION_ID)["debug_stats"]["current_stage"])
+        seen.append(len(_debug_stats_patches(fake_supabase)) - before)
+
+        clock.advance(stroke._DEBUG_RUN_PATCH_INTERVAL_S)
+        progress({"stage_id": "classify_events", "status": "running"})
+        seen.append(len(_debug_stats_patches(fake_supabase)) - before)
+
+        # Completed stages are never held back.
+        progress({"stage_id": "classify_events", "status": "completed", "duration_ms": 5.0})
+        seen.append(len(_debug_stats_patches(fake_supabase)) - before)
+
+    pipeline.on_detect = on_detect
+    _run_pipeline()
+
+    assert seen == ["contact_events", 0, 1, 2]
+    final = fake_supabase.tables[RUNS_TABLE][0]
+    assert final["status"] == "completed"
+    assert final["debug_stats"]["stage_statuses"]["classify_events"] == "completed"
+
+
+def test_storage_pointers_are_patched_onto_the_final_run_row(pipeline, fake_supabase):
+    _run_pipeline()
+
+    run = fake_supabase.tables[RUNS_TABLE][0]
+    path = f"{USER_ID}/{SESSION_ID}/debug/stroke-analysis/{run['id']}.json.gz"
+    bucket = fake_supabase.storage.from_("provision-videos")
+    assert path in bucket.uploads
+    assert (run["status"], run["storage_path"], run["storage_url"]) == ("completed", path, bucket.get_public_url(path))
+    # The pointer patch lands after the terminal upsert.
+    last_upsert = max(i for i, q in enumerate(fake_supabase.calls) if q.op == "upsert")
+    patch = next(i for i, q in enumerate(fake_supabase.calls) if q.op == "update" and "storage_path" in q.payload)
+    assert patch > last_upsert
+
+
+def test_no_pointer_patch_without_a_run_row(pipeline, fake_supabase):
+    del fake_supabase.tables[RUNS_TABLE]
+
+    _run_pipeline()
+
+    assert fake_supabase.storage.from_("provision-videos").uploads
+    assert fake_supabase.queries(RUNS_TABLE, "update") == []
+    assert fake_supabase.queries(RUNS_TABLE, "upsert") == []
+
+
+def _fail_detection(progress):
+    raise RuntimeError("detector crashed")
+
+
+def test_failed_run_marks_the_session_and_the_run_failed(pipeline, fake_supabase):
+    pipeline.on_detect = _fail_detection
+
+    _run_pipeline()
+
+    assert fake_supabase.tables["sessions"][0]["stroke_analysis_status"] == "failed"
+    run = fake_supabase.tables[RUNS_TABLE][0]
+    assert (run["status"], run["error"]) == ("failed", "detector crashed")
+
+
+def test_empty_pose_data_marks_the_session_failed(pipeline, fake_supabase):
+    fake_supabase.tables["pose_analysis"] = []
+
+    _run_pipeline()
+
+    assert fake_supabase.tables["sessions"][0]["stroke_analysis_status"] == "failed"
+    assert fake_supabase.tables[RUNS_TABLE][0]["error"] == "no_pose_data"
+
+
+@pytest.mark.parametrize("on_detect", [_fail_detection, None])
+def test_failed_status_write_is_logged(pipeline, fake_supabase, caplog, on_detect):
+    if on_detect is None:
+        fake_supabase.tables["pose_analysis"] = []
+    else:
+        pipeline.on_detect = on_detect
+    fake_supabase.fail(
+        "sessions",
+        "update",
+        api_error("08006", "connection failure"),
+        when=lambda q: q.payload.get("stroke_analysis_status") == "failed",
+    )
+
+    with caplog.at_level(logging.ERROR, logger=stroke.logger.name):
+        _run_pipeline()
+
+    assert any(
+        f"Failed to mark session {SESSION_ID} as failed" in r.getMessage() for r in caplog.records
+    )
+    assert fake_supabase.tables[RUNS_TABLE][0]["status"] == "failed"
+
+
+def test_detection_run_drops_the_sessions_cached_reads(pipeline, fake_supabase, client):
+    url = f"/api/stroke/strokes/{SESSION_ID}"
+    assert client.get(url).json()["count"] == 0
+
+    _run_pipeline()
+
+    assert client.get(url).json()["count"] == 3
+
+
+def test_strokes_are_inserted_in_batches(pipeline, fake_supabase, monkeypatch):
+    monkeypatch.setattr(stroke, "_STROKE_INSERT_BATCH_SIZE", 2)
+    pipeline.strokes = _strokes(5)
+
+    _run_pipeline()
+
+    inserts = fake_supabase.queries("stroke_analytics", "insert")
+    assert [len(q.payload) for q in inserts] == [2, 2, 1]
+    assert [r["start_frame"] for r in fake_supabase.tables["stroke_analytics"]] == [0, 10, 20, 30, 40]
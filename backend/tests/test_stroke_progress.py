@@ -0,0 +1,78 @@
+"""GET /api/stroke/progress/{session_id}."""
+
+from cachetools import TTLCache
+
+from conftest import SESSION_ID
+
+from src.api.routes import stroke
+
+URL = f"/api/stroke/progress/{SESSION_ID}"
+
+
+def test_ownership_fallback_is_checked_once_per_user(client, stroke_session):
+    fake = stroke_session(0)
+
+    for _ in range(3):
+        assert client.get(URL).json() == {"session_id": SESSION_ID, "progress": None}
+    owner_checks = [q for q in fake.queries("sessions") if ("user_id", "eq", "u1") in q.filters]
+    assert len(owner_checks) == 1
+
+
+def test_unowned_session_is_404_and_not_remembered(client, stroke_session):
+    fake = stroke_session(0, user_id="someone-else")
+
+    assert client.get(URL).status_code == 404
+    fake.tables["sessions"][0]["user_id"] = "u1"
+    assert client.get(URL).status_code == 200
+
+
+def test_remembered_owner_expires(client, stroke_session, clock, monkeypatch):
+    monkeypatch.setattr(stroke, "_PROGRESS_OWNER_CACHE", TTLCache(maxsize=4096, ttl=300, timer=clock))
+    fake = stroke_session(0)
+    assert client.get(URL).status_code == 200
+
+    fake.tables["sessions"] = []
+    assert client.get(URL).status_code == 200
+    clock.advance(301)
+    assert client.get(URL).status_code == 404
+
+
+def _store(status="processing", stage="load_pose_data"):
+    stroke._store_stroke_progress(SESSION_ID, {
+        "run_id": "run-1",
+        "session_id": SESSION_ID,
+        "user_id": "u1",
+        "status": status,
+        "debug_stats": {"phase": "processing", "current_stage": stage},
+    })
+
+
+def test_unchanged_progress_is_a_304_without_queries(client, fake_supabase):
+    _store()
+    first = client.get(URL)
+    assert first.json()["progress"]["debug_stats"]["current_stage"] == "load_pose_data"
+
+    repeat = client.get(URL, headers={"If-None-Match": first.headers["etag"]})
+
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert fake_supabase.calls == []
+
+
+def test_new_progress_changes_the_etag(client, fake_supabase):
+    _store()
+    etag = client.get(URL).headers["etag"]
+    _store(stage="persist_results")
+
+    response = client.get(URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["progress"]["debug_stats"]["current_stage"] == "persist_results"
+
+
+def test_another_users_progress_is_404(client, fake_supabase):
+    _store()
+    stroke.STROKE_PROGRESS[SESSION_ID]["user_id"] = "someone-else"
+
+    assert client.get(URL).status_code == 404
@@ -0,0 +1,152 @@
+"""GET /api/stroke/strokes/{session_id}."""
+
+import pytest
+
+from conftest import SESSION_ID
+
+from src.api.routes import stroke
+
+URL = f"/api/stroke/strokes/{SESSION_ID}"
+
+
+def _get(client, params=None, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get(URL, params=params or {}, headers=headers)
+
+
+def _expected_ids(fake, stroke_type=None):
+    rows = [r for r in fake.tables["stroke_analytics"] if stroke_type is None or r["stroke_type"] == stroke_type]
+    return [r["id"] for r in sorted(rows, key=lambda r: (r["start_frame"], r["id"]))]
+
+
+def test_repeat_stroke_list_read_is_served_from_cache(client, stroke_session):
+    fake = stroke_session(4)
+    first = _get(client, {"stroke_type": "forehand"})
+    fake.calls.clear()
+
+    second = _get(client, {"stroke_type": "forehand"})
+
+    assert second.content == first.content
+    assert fake.calls == []
+
+
+def test_invalidation_drops_only_that_sessions_reads(client, stroke_session):
+    fake = stroke_session(4)
+    _get(client)
+    other_key = ("sess-2", "strokes", "u1", None, "id", None, 0)
+    stroke._set_cached_stroke_read(other_key, ('"tag"', {"strokes": []}))
+    fake.tables["stroke_analytics"].pop()
+
+    assert _get(client).json()["count"] == 4
+    stroke._invalidate_stroke_reads(SESSION_ID)
+    assert _get(client).json()["count"] == 3
+    assert stroke._get_cached_stroke_read(other_key) is not None
+
+
+def test_cached_read_revalidates_without_queries(client, stroke_session):
+    fake = stroke_session(4)
+    etag = _get(client).headers["etag"]
+    fake.calls.clear()
+
+    response = _get(client, etag=etag)
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert fake.calls == []
+
+
+def test_etag_match_skips_the_stroke_query(client, stroke_session):
+    fake = stroke_session(4)
+    etag = _get(client).headers["etag"]
+    stroke._STROKE_READ_CACHE.clear()
+    fake.calls.clear()
+
+    response = _get(client, etag=f'W/{etag}, "other"')
+
+    assert response.status_code == 304
+    assert fake.tables_read() == ["sessions"]
+
+
+def test_session_update_changes_the_etag(client, stroke_session):
+    fake = stroke_session(4)
+    etag = _get(client).headers["etag"]
+    fake.tables["sessions"][0]["updated_at"] = "2026-01-02T00:00:00+00:00"
+    stroke._invalidate_stroke_reads(SESSION_ID)
+
+    response = _get(client, etag=etag)
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+@pytest.mark.parametrize("count", [5, 7])
+@pytest.mark.parametrize("params", [{}, {"stroke_type": "forehand"}, {"limit": 2, "offset": 1}])
+def test_conditional_and_unconditional_bodies_match(client, stroke_session, monkeypatch, count, params):
+    # A page size of 3 makes the 5- and 7-stroke sessions take the streaming path.
+    monkeypatch.setattr(stroke, "_STROKE_STREAM_PAGE_SIZE", 3)
+    stroke_session(count)
+
+    plain = _get(client, params)
+    stroke._STROKE_READ_CACHE.clear()
+    conditional = _get(client, params, etag='"stale"')
+
+    assert plain.status_code == conditional.status_code == 200
+    assert plain.headers["etag"] == conditional.headers["etag"]
+    assert plain.content == conditional.content
+
+
+def test_unpaged_read_streams_every_page_in_order(client, stroke_session, monkeypatch):
+    monkeypatch.setattr(stroke, "_STROKE_STREAM_PAGE_SIZE", 3)
+    fake = stroke_session(7)
+
+    body = _get(client).json()
+
+    assert body["count"] == 7
+    assert [s["id"] for s in body["strokes"]] == _expected_ids(fake)
+    # The first page is handed to the stream rather than re-read.
+    page_starts = [q.ranges[None][0] for q in fake.queries("stroke_analytics")]
+    assert page_starts == [3, 6]
+
+
+def test_conditional_read_streams_from_its_first_page(client, stroke_session, monkeypatch):
+    monkeypatch.setattr(stroke, "_STROKE_STREAM_PAGE_SIZE", 3)
+    fake = stroke_session(6)
+
+    body = _get(client, etag='"stale"').json()
+
+    assert [s["id"] for s in body["strokes"]] == _expected_ids(fake)
+    page_starts = [q.ranges[None][0] for q in fake.queries("stroke_analytics")]
+    assert page_starts == [0, 3, 6]
+
+
+def test_streamed_reads_are_not_cached(client, stroke_session, monkeypatch):
+    monkeypatch.setattr(stroke, "_STROKE_STREAM_PAGE_SIZE", 3)
+    fake = stroke_session(4)
+    _get(client)
+    fake.calls.clear()
+
+    assert _get(client).json()["count"] == 4
+    assert fake.tables_read() == ["sessions", "stroke_analytics"]
+
+
+def test_unconditional_read_is_one_embedded_query(client, stroke_session):
+    fake = stroke_session(5)
+    # The migration 016 column probe is remembered across requests.
+    stroke._session_summary_columns_exist(fake)
+    fake.calls.clear()
+
+    body = _get(client, {"stroke_type": "forehand", "fields": "id,stroke_type"}).json()
+
+    assert [s["id"] for s in body["strokes"]] == _expected_ids(fake, "forehand")
+    assert all(set(s) == {"id", "stroke_type"} for s in body["strokes"])
+    assert fake.tables_read() == ["sessions"]
+
+
+def test_unowned_session_is_404_on_both_paths(client, stroke_session):
+    fake = stroke_session(2, user_id="someone-else")
+
+    assert _get(client).status_code == 404
+    assert _get(client, etag='"stale"').status_code == 404
+    assert "stroke_analytics" not in fake.tables_read()
@@ -0,0 +1,109 @@
+"""Session metadata and player settings loaded at the start of a detection run."""
+
+import pytest
+from postgrest.exceptions import APIError
+
+from conftest import SESSION_ID, api_error
+
+from src.api.routes import stroke
+
+
+def _seed_player(fake, handedness="left", camera_facing="back"):
+    fake.tables["sessions"] = [{"id": SESSION_ID, "user_id": "u1", "camera_facing": camera_facing}]
+    fake.tables["game_players"] = [{"game_id": SESSION_ID, "player_id": "p1"}]
+    fake.tables["players"] = [{"id": "p1", "handedness": handedness}]
+
+
+def test_player_settings_come_from_one_rpc_call(fake_supabase):
+    _seed_player(fake_supabase)
+    fake_supabase.rpcs["get_player_settings"] = lambda params: [{"handedness": "left", "camera_facing": "front"}]
+
+    settings = stroke._get_player_settings_for_session(fake_supabase, SESSION_ID)
+
+    assert settings == {"handedness": "left", "camera_facing": "front"}
+    assert fake_supabase.rpc_calls == [("get_player_settings", {"p_session_id": SESSION_ID})]
+    assert fake_supabase.calls == []
+
+
+def test_missing_player_settings_rpc_falls_back_to_tables(fake_supabase):
+    _seed_player(fake_supabase)
+
+    settings = stroke._get_player_settings_for_session(fake_supabase, SESSION_ID)
+
+    assert settings == {"handedness": "left", "camera_facing": "back"}
+    assert fake_supabase.tables_read() == ["sessions", "game_players", "players"]
+
+
+def test_session_camera_facing_overrides_and_skips_the_session_read(fake_supabase):
+    _seed_player(fake_supabase)
+
+    settings = stroke._get_player_settings_for_session(fake_supabase, SESSION_ID, {"camera_facing": "side"})
+
+    assert settings == {"handedness": "left", "camera_facing": "side"}
+    assert "sessions" not in fake_supabase.tables_read()
+
+
+def test_player_settings_default_without_a_linked_player(fake_supabase):
+    _seed_player(fake_supabase, camera_facing=None)
+    fake_supabase.tables["game_players"] = []
+
+    assert stroke._get_player_settings_for_session(fake_supabase, SESSION_ID) == {
+        "handedness": "right",
+        "camera_facing": "auto",
+    }
+
+
+def test_run_context_comes_from_one_rpc_call(fake_supabase):
+    row = {
+        "trajectory_data": {"frames": [1, 2]},
+        "video_path": "https://videos.test/a.mp4",
+        "user_id": "u1",
+        "camera_facing": "back",
+        "handedness": "left",
+    }
+    fake_supabase.rpcs["get_stroke_run_context"] = lambda params: [row]
+
+    session_data, settings = stroke._load_stroke_run_context(fake_supabase, SESSION_ID)
+
+    assert session_data == row
+    assert settings == {"handedness": "left", "camera_facing": "back"}
+    assert fake_supabase.rpc_calls == [("get_stroke_run_context", {"p_session_id": SESSION_ID})]
+    assert fake_supabase.calls == []
+
+
+def test_run_context_defaults_settings_for_an_empty_rpc_row(fake_supabase):
+    fake_supabase.rpcs["get_stroke_run_context"] = lambda params: [
+        {"trajectory_data": None, "video_path": None, "user_id": "u1", "camera_facing": None, "handedness": None}
+    ]
+
+    _, settings = stroke._load_stroke_run_context(fake_supabase, SESSION_ID)
+
+    assert settings == {"handedness": "right", "camera_facing": "auto"}
+
+
+def test_missing_run_context_rpc_falls_back_to_session_and_settings_reads(fake_supabase):
+    _seed_player(fake_supabase)
+    fake_supabase.tables["sessions"][0].update({"trajectory_data": {"frames": []}, "video_path": "v.mp4"})
+
+    session_data, settings = stroke._load_stroke_run_context(fake_supabase, SESSION_ID)
+
+    assert session_data == {
+        "trajectory_data": {"frames": []},
+        "video_path": "v.mp4",
+        "user_id": "u1",
+        "camera_facing": "back",
+    }
+    assert settings == {"handedness": "left", "camera_facing": "back"}
+    assert [name for name, _ in fake_supabase.rpc_calls] == ["get_stroke_run_context", "get_player_settings"]
+    # The session row already carries camera_facing, so only the player is looked up.
+    assert fake_supabase.tables_read() == ["sessions", "game_players", "players"]
+
+
+def test_other_run_context_rpc_errors_are_raised(fake_supabase):
+    def _denied(params):
+        raise api_error("42501", "permission denied for function get_stroke_run_context")
+
+    fake_supabase.rpcs["get_stroke_run_context"] = _denied
+
+    with pytest.raises(APIError):
+        stroke._load_stroke_run_context(fake_supabase, SESSION_ID)
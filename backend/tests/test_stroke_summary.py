@@ -0,0 +1,113 @@
+"""GET /api/stroke/summary/{session_id}."""
+
+from conftest import SESSION_ID
+
+from src.api.database.supabase import get_current_user_id
+from src.api.main import app
+from src.api.routes import stroke
+
+URL = f"/api/stroke/summary/{SESSION_ID}"
+
+_MIGRATION_016_COLUMNS = {"average_form_score", "best_form_score", "total_strokes", "forehand_count", "backhand_count"}
+
+
+def _drop_migration_016(fake):
+    fake.missing_columns["sessions"] = set(_MIGRATION_016_COLUMNS)
+    for row in fake.tables["sessions"]:
+        for column in _MIGRATION_016_COLUMNS:
+            row.pop(column, None)
+
+
+def test_summary_reads_aggregates_from_the_session_row(client, stroke_session):
+    fake = stroke_session(4, average_form_score=88.5, best_form_score=99.0, forehand_count=3, backhand_count=1)
+
+    body = client.get(URL, params={"include_strokes": "false"}).json()
+
+    assert body["average_form_score"] == 88.5
+    assert body["best_form_score"] == 99.0
+    assert (body["total_strokes"], body["forehand_count"], body["backhand_count"]) == (4, 3, 1)
+    assert body["consistency_score"] == 90.0
+    assert body["strokes"] == []
+    assert "stroke_analytics" not in fake.tables_read()
+
+
+def test_summary_aggregates_stroke_rows_before_migration_016(client, stroke_session):
+    fake = stroke_session(3)
+    _drop_migration_016(fake)
+    # Opponent strokes inferred with solid confidence are left out of the aggregates.
+    fake.tables["stroke_analytics"][0]["metrics"] = {"event_hitter": "opponent", "event_hitter_confidence": 0.9}
+    player_rows = fake.tables["stroke_analytics"][1:]
+    scores = [r["form_score"] for r in player_rows]
+
+    body = client.get(URL, params={"include_strokes": "false"}).json()
+
+    assert body["total_strokes"] == 2
+    assert body["average_form_score"] == sum(scores) / 2
+    assert body["best_form_score"] == max(scores)
+    assert body["forehand_count"] == sum(r["stroke_type"] == "forehand" for r in player_rows)
+    assert body["backhand_count"] == sum(r["stroke_type"] == "backhand" for r in player_rows)
+    assert body["strokes"] == []
+
+
+def test_summary_etag_tracks_stroke_count_before_migration_016(client, stroke_session):
+    fake = stroke_session(3)
+    _drop_migration_016(fake)
+    etag = client.get(URL).headers["etag"]
+    fake.tables["stroke_analytics"].pop()
+    stroke._invalidate_stroke_reads(SESSION_ID)
+
+    # updated_at is unchanged; the embedded stroke count alone moves the tag.
+    response = client.get(URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["total_strokes"] == 2
+
+
+def test_summary_of_another_users_session_is_404(client, stroke_session):
+    fake = stroke_session(2, user_id="someone-else")
+
+    assert client.get(URL).status_code == 404
+    assert client.get(URL, headers={"If-None-Match": '"stale"'}).status_code == 404
+
+
+def test_repeat_summary_read_is_served_from_cache(client, stroke_session):
+    fake = stroke_session(3)
+    first = client.get(URL)
+    fake.calls.clear()
+
+    second = client.get(URL)
+
+    assert second.content == first.content
+    assert fake.calls == []
+
+
+def test_invalidated_summary_is_read_again(client, stroke_session):
+    fake = stroke_session(3)
+    client.get(URL)
+    fake.tables["sessions"][0]["average_form_score"] = 42.0
+
+    assert client.get(URL).json()["average_form_score"] != 42.0
+    stroke._invalidate_stroke_reads(SESSION_ID)
+    assert client.get(URL).json()["average_form_score"] == 42.0
+
+
+def test_cached_summary_is_not_shared_across_users(client, stroke_session):
+    stroke_session(3)
+    assert client.get(URL).status_code == 200
+
+    app.dependency_overrides[get_current_user_id] = lambda: "someone-else"
+    assert client.get(URL).status_code == 404
+
+
+def test_summary_etag_match_reads_only_the_session(client, stroke_session):
+    fake = stroke_session(3)
+    etag = client.get(URL).headers["etag"]
+    stroke._invalidate_stroke_reads(SESSION_ID)
+    fake.calls.clear()
+
+    response = client.get(URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert fake.tables_read() == ["sessions"]
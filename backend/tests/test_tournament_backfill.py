@@ -0,0 +1,59 @@
+"""POST /api/tournaments/backfill-previews."""
+
+import logging
+
+import pytest
+
+from conftest import USER_ID, api_error
+
+from src.api.routes import tournaments
+
+URL = "/api/tournaments/backfill-previews"
+NAME_A, NAME_B = list(tournaments._WTT_PREVIEW_THUMBNAILS)[:2]
+
+
+@pytest.fixture
+def seeded(fake_supabase):
+    fake_supabase.tables["tournaments"] = [
+        {"id": "a1", "coach_id": USER_ID, "name": NAME_A, "metadata": {"source": "wtt"}},
+        {"id": "a2", "coach_id": USER_ID, "name": NAME_A, "metadata": {}},
+        {"id": "b1", "coach_id": USER_ID, "name": NAME_B, "metadata": None},
+        {"id": "c1", "coach_id": "coach-2", "name": NAME_A, "metadata": {}},
+        {"id": "d1", "coach_id": USER_ID, "name": "Local club night", "metadata": {}},
+    ]
+    return fake_supabase
+
+
+def _metadata(fake, tournament_id):
+    return next(t for t in fake.tables["tournaments"] if t["id"] == tournament_id)["metadata"]
+
+
+def test_backfill_is_one_read_and_one_upsert(client, seeded):
+    assert client.post(URL).json()["updated"] == 2
+
+    assert [q.op for q in seeded.calls] == ["select", "upsert"]
+    assert [row["id"] for row in seeded.calls[1].payload] == ["a1", "b1"]
+    thumbnail = tournaments._WTT_PREVIEW_THUMBNAILS[NAME_A]
+    assert _metadata(seeded, "a1") == {"source": "wtt", "thumbnail_url": thumbnail, "preview_image_url": thumbnail}
+    # Only the first row per name, only the caller's rows, only seeded names.
+    assert _metadata(seeded, "a2") == _metadata(seeded, "c1") == _metadata(seeded, "d1") == {}
+
+
+def test_rejected_upsert_falls_back_to_per_row_updates(client, seeded, caplog):
+    seeded.fail("tournaments", "upsert", api_error("42501", "permission denied"))
+    seeded.fail("tournaments", "update", api_error("57014", "statement timeout"), when=lambda q: ("id", "eq", "a1") in q.filters)
+
+    with caplog.at_level(logging.WARNING, logger=tournaments.logger.name):
+        body = client.post(URL).json()
+
+    assert body["updated"] == 1
+    assert _metadata(seeded, "b1")["thumbnail_url"] == tournaments._WTT_PREVIEW_THUMBNAILS[NAME_B]
+    assert _metadata(seeded, "a1") == {"source": "wtt"}
+    assert any(f"Failed to update preview for {NAME_A}" in r.getMessage() for r in caplog.records)
+
+
+def test_failed_read_updates_nothing(client, seeded):
+    seeded.fail("tournaments", "select", api_error("57014", "statement timeout"))
+
+    assert client.post(URL).json()["updated"] == 0
+    assert [q.op for q in seeded.calls] == ["select"]
@@ -0,0 +1,66 @@
+"""Tournament CRUD: /api/tournaments and /api/tournaments/{tournament_id}."""
+
+URL = "/api/tournaments"
+
+
+def test_get_tournament_includes_its_matchup_counts(client, tournament_db):
+    body = client.get(f"{URL}/t1").json()
+
+    assert (body["id"], body["matchup_count"], body["win_count"], body["loss_count"]) == ("t1", 3, 1, 1)
+    assert sorted(tournament_db.tables_read()) == ["tournament_matchups", "tournament_stats", "tournaments"]
+
+
+def test_get_tournament_without_matchups_has_zero_counts(client, tournament_db):
+    body = client.get(f"{URL}/t3").json()
+
+    assert (body["matchup_count"], body["win_count"], body["loss_count"]) == (0, 0, 0)
+
+
+def test_unknown_tournament_is_404_not_500(client, tournament_db):
+    response = client.get(f"{URL}/nope")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Tournament not found"
+
+
+def test_matchup_for_an_unknown_tournament_is_404(client, tournament_db):
+    response = client.post(f"{URL}/nope/matchups", json={"tournament_id": "nope", "opponent_name": "X"})
+
+    assert response.status_code == 404
+    assert tournament_db.queries("tournament_matchups", "insert") == []
+
+
+def test_update_of_another_coachs_tournament_is_404(client, tournament_db):
+    response = client.put(f"{URL}/t3", json={"name": "Renamed"})
+
+    assert response.status_code == 404
+    assert tournament_db.tables["tournaments"][2]["name"] == "Open t3"
+    # Ownership rides on the UPDATE filter; there is no separate ownership read.
+    assert [q.op for q in tournament_db.queries("tournaments")] == ["update"]
+    assert ("coach_id", "eq", "u1") in tournament_db.queries("tournaments")[0].filters
+
+
+def test_owner_updates_their_tournament(client, tournament_db):
+    body = client.put(f"{URL}/t1", json={"name": "Renamed"}).json()
+
+    assert (body["name"], body["matchup_count"]) == ("Renamed", 3)
+
+
+def test_delete_is_limited_to_the_owner(client, tournament_db):
+    assert client.delete(f"{URL}/t3").status_code == 404
+    assert client.delete(f"{URL}/t1").json() == {"message": "Tournament deleted"}
+    assert [t["id"] for t in tournament_db.tables["tournaments"]] == ["t2", "t3", "t4"]
+
+
+def test_update_sends_only_the_given_fields_as_json(client, tournament_db):
+    client.put(f"{URL}/t1", json={"start_date": "2026-04-02", "notes": "moved", "level": None})
+
+    payload = tournament_db.queries("tournaments", "update")[0].payload
+    assert set(payload) == {"start_date", "notes", "updated_at"}
+    assert payload["start_date"] == "2026-04-02"
+
+
+def test_update_without_fields_is_400(client, tournament_db):
+    assert client.put(f"{URL}/t1", json={"level": None}).status_code == 400
+    assert client.put(f"{URL}/matchups/m1", json={}).status_code == 400
+    assert tournament_db.calls == []
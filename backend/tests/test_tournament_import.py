@@ -0,0 +1,126 @@
+"""ITTF calendar import and WTT seeding endpoints."""
+
+import asyncio
+
+import pytest
+from cachetools import TTLCache
+
+from conftest import USER_ID, _tournament, api_error
+
+from src.api.routes import tournaments
+from src.api.services import tournament_service, wtt_tournament_seeder
+
+URL = "/api/tournaments"
+
+
+def _events(*names):
+    return {"events": [{"name": name, "location": "Doha", "date_text": "Mar 1-5"} for name in names]}
+
+
+def test_import_inserts_every_event_in_one_request(client, fake_supabase):
+    fake_supabase.tables["tournaments"] = []
+
+    body = client.post(f"{URL}/import-ittf", json=_events("A", "B", "C")).json()
+
+    assert [t["name"] for t in body] == ["A", "B", "C"]
+    assert all(t["coach_id"] == USER_ID and t["matchup_count"] == 0 for t in body)
+    inserts = fake_supabase.queries("tournaments", "insert")
+    assert len(inserts) == 1 and len(inserts[0].payload) == 3
+
+
+def test_rejected_batch_is_retried_row_by_row(client, fake_supabase):
+    fake_supabase.tables["tournaments"] = []
+    rejected = api_error("23502", "null value in column violates not-null constraint")
+    fake_supabase.fail("tournaments", "insert", rejected, when=lambda q: isinstance(q.payload, list))
+    fake_supabase.fail("tournaments", "insert", rejected, when=lambda q: q.payload.get("name") == "B")
+
+    body = client.post(f"{URL}/import-ittf", json=_events("A", "B", "C")).json()
+
+    assert [t["name"] for t in body] == ["A", "C"]
+    assert [t["name"] for t in fake_supabase.tables["tournaments"]] == ["A", "C"]
+
+
+def test_empty_import_makes_no_requests(client, fake_supabase):
+    assert client.post(f"{URL}/import-ittf", json={"events": []}).json() == []
+    assert fake_supabase.calls == []
+
+
+@pytest.fixture
+def scraper(monkeypatch, clock):
+    """Stub the ITTF scraper; `scraper.results` is consumed one call at a time. Caches follow `clock`."""
+    state = type("Scraper", (), {"calls": [], "results": []})
+
+    async def _scrape(year=None):
+        state.calls.append(year)
+        return state.results.pop(0)
+
+    monkeypatch.setattr(tournament_service, "scrape_ittf_tournaments", _scrape)
+    monkeypatch.setattr(tournaments, "_ITTF_CALENDAR_CACHE", TTLCache(maxsize=8, ttl=3600, timer=clock))
+    monkeypatch.setattr(tournaments, "_ITTF_FALLBACK_CACHE", TTLCache(maxsize=8, ttl=120, timer=clock))
+    return state
+
+
+def test_scraped_calendar_is_cached_per_year_for_an_hour(client, fake_supabase, scraper, clock):
+    live = [{"name": "WTT Contender"}]
+    scraper.results = [(live, False), ([], False), (live, False)]
+
+    assert client.get(f"{URL}/ittf-calendar").json() == {"events": live, "count": 1, "fallback": False}
+    clock.advance(3599)
+    assert client.get(f"{URL}/ittf-calendar").json()["events"] == live
+    assert client.get(f"{URL}/ittf-calendar", params={"year": 2025}).json()["count"] == 0
+    assert scraper.calls == [None, 2025]
+
+    clock.advance(2)
+    client.get(f"{URL}/ittf-calendar")
+    assert scraper.calls == [None, 2025, None]
+
+
+def test_fallback_calendar_is_only_kept_briefly(client, fake_supabase, scraper, clock):
+    static, live = [{"name": "Static list"}], [{"name": "Live"}]
+    scraper.results = [(static, True), (live, False)]
+
+    assert client.get(f"{URL}/ittf-calendar").json() == {"events": static, "count": 1, "fallback": True}
+    clock.advance(119)
+    assert client.get(f"{URL}/ittf-calendar").json()["fallback"] is True
+    assert scraper.calls == [None]
+
+    clock.advance(2)
+    assert client.get(f"{URL}/ittf-calendar").json() == {"events": live, "count": 1, "fallback": False}
+    assert scraper.calls == [None, None]
+
+
+def _off_event_loop():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
+
+
+def test_wtt_sync_runs_off_the_event_loop_and_drops_cached_lists(client, tournament_db, monkeypatch):
+    ran = []
+
+    def _seed(coach_id, supabase):
+        ran.append((coach_id, _off_event_loop()))
+        supabase.table("tournaments").insert(_tournament("wtt-1", "upcoming", "2026-05-01")).execute()
+        return [{"id": "wtt-1"}]
+
+    monkeypatch.setattr(wtt_tournament_seeder, "seed_real_wtt_tournaments", _seed)
+    before = client.get(URL).json()
+
+    assert client.post(f"{URL}/sync-wtt").json()["message"] == "Synced 1 tournaments"
+    assert ran == [(USER_ID, True)]
+    assert len(client.get(URL).json()) == len(before) + 1
+
+
+def test_video_backfill_runs_off_the_event_loop(client, fake_supabase, monkeypatch):
+    ran = []
+
+    def _backfill(coach_id, supabase):
+        ran.append((coach_id, _off_event_loop()))
+        return {"searched": 2, "found": 1}
+
+    monkeypatch.setattr(wtt_tournament_seeder, "backfill_videos", _backfill)
+
+    assert client.post(f"{URL}/backfill-videos").json() == {"message": "Searched 2, found 1", "searched": 2, "found": 1}
+    assert ran == [(USER_ID, True)]
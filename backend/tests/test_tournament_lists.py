@@ -0,0 +1,140 @@
+"""Tournament list endpoints: /api/tournaments, /upcoming and /past."""
+
+import pytest
+
+from conftest import api_error, tournament_stats_view, tournaments_with_counts_view
+
+from src.api.routes import tournaments
+
+URL = "/api/tournaments"
+
+
+def _counts(body):
+    return {t["id"]: (t["matchup_count"], t["win_count"], t["loss_count"]) for t in body}
+
+
+def test_list_counts_matchups_with_one_query_for_all_tournaments(client, tournament_db):
+    body = client.get(URL).json()
+
+    assert [t["id"] for t in body] == ["t1", "t3", "t2", "t4"]
+    assert _counts(body) == {"t1": (3, 1, 1), "t2": (2, 2, 0), "t3": (0, 0, 0), "t4": (0, 0, 0)}
+    matchup_reads = tournament_db.queries("tournament_matchups")
+    assert len(matchup_reads) == 1
+    assert matchup_reads[0].filters == [("tournament_id", "in", ["t1", "t3", "t2", "t4"])]
+
+
+def test_status_filtered_lists_count_only_their_tournaments(client, tournament_db):
+    assert _counts(client.get(f"{URL}/upcoming").json()) == {"t3": (0, 0, 0), "t1": (3, 1, 1)}
+    assert _counts(client.get(f"{URL}/past").json()) == {"t2": (2, 2, 0), "t4": (0, 0, 0)}
+    assert _counts(client.get(URL, params={"status": "completed"}).json()) == {"t2": (2, 2, 0)}
+
+
+def test_counts_come_from_the_tournament_stats_view(client, tournament_db):
+    tournament_db.views["tournament_stats"] = tournament_stats_view
+
+    body = client.get(URL).json()
+
+    assert _counts(body) == {"t1": (3, 1, 1), "t2": (2, 2, 0), "t3": (0, 0, 0), "t4": (0, 0, 0)}
+    assert "tournament_matchups" not in tournament_db.tables_read()
+
+
+def test_missing_stats_view_falls_back_to_tallying_matchups(client, tournament_db):
+    body = client.get(URL).json()
+
+    assert _counts(body)["t1"] == (3, 1, 1)
+    assert tournament_db.tables_read()[-2:] == ["tournament_stats", "tournament_matchups"]
+
+
+def test_other_stats_view_errors_are_not_masked(client, tournament_db):
+    tournament_db.views["tournament_stats"] = tournament_stats_view
+    tournament_db.fail("tournament_stats", "select", api_error("57014", "canceling statement due to statement timeout"))
+
+    response = client.get(URL)
+
+    assert response.status_code == 500
+    assert "tournament_matchups" not in tournament_db.tables_read()
+
+
+def test_repeat_list_reads_are_served_from_cache(client, tournament_db):
+    first = [client.get(url).content for url in (URL, f"{URL}/upcoming", f"{URL}/past")]
+    tournament_db.calls.clear()
+
+    assert [client.get(url).content for url in (URL, f"{URL}/upcoming", f"{URL}/past")] == first
+    assert tournament_db.calls == []
+    # Each status filter is its own entry.
+    assert [t["id"] for t in client.get(URL, params={"status": "ongoing"}).json()] == ["t3"]
+
+
+_WRITES = {
+    "create tournament": lambda c: c.post(URL, json={"name": "New Open"}),
+    "update tournament": lambda c: c.put(f"{URL}/t1", json={"notes": "moved"}),
+    "delete tournament": lambda c: c.delete(f"{URL}/t2"),
+    "import": lambda c: c.post(f"{URL}/import-ittf", json={"events": [{"name": "Imported"}]}),
+    "create matchup": lambda c: c.post(f"{URL}/t1/matchups", json={"tournament_id": "t1", "opponent_name": "Z"}),
+    "update matchup": lambda c: c.put(f"{URL}/matchups/m2", json={"result": "win"}),
+    "delete matchup": lambda c: c.delete(f"{URL}/matchups/m1"),
+}
+
+
+@pytest.mark.parametrize("write", list(_WRITES))
+def test_writes_drop_the_cached_lists_and_stats(client, tournament_db, write):
+    before = (client.get(URL).content, client.get(f"{URL}/stats/summary").json())
+
+    assert _WRITES[write](client).status_code == 200
+    tournament_db.calls.clear()
+
+    after = (client.get(URL).content, client.get(f"{URL}/stats/summary").json())
+    assert after != before
+    assert "tournaments" in tournament_db.tables_read()
+
+
+def test_stats_are_served_from_cache(client, tournament_db):
+    first = client.get(f"{URL}/stats/summary").json()
+    tournament_db.calls.clear()
+
+    assert client.get(f"{URL}/stats/summary").json() == first
+    assert tournament_db.calls == [] and tournament_db.rpc_calls == [("tournament_stats_summary", {})]
+
+
+def test_list_body_matches_the_response_models(client, tournament_db):
+    response = client.get(f"{URL}/past")
+
+    expected = [
+        tournaments.TournamentResponse(**t, matchup_count=m, win_count=w, loss_count=l).model_dump(mode="json")
+        for t, (m, w, l) in zip(
+            [tournament_db.tables["tournaments"][1], tournament_db.tables["tournaments"][3]],
+            [(2, 2, 0), (0, 0, 0)],
+        )
+    ]
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == expected
+
+
+def test_list_rows_are_still_validated(client, tournament_db):
+    del tournament_db.tables["tournaments"][0]["created_at"]
+
+    assert client.get(URL).status_code == 500
+
+
+def test_lists_are_one_read_of_the_counts_view(client, tournament_db):
+    tournament_db.views["v_tournaments_with_counts"] = tournaments_with_counts_view
+
+    assert _counts(client.get(URL).json()) == {"t1": (3, 1, 1), "t3": (0, 0, 0), "t2": (2, 2, 0), "t4": (0, 0, 0)}
+    assert [t["id"] for t in client.get(f"{URL}/upcoming").json()] == ["t3", "t1"]
+    assert [t["id"] for t in client.get(f"{URL}/past").json()] == ["t2", "t4"]
+    assert tournament_db.tables_read() == ["v_tournaments_with_counts"] * 3
+
+
+def test_missing_counts_view_falls_back_to_the_tournaments_table(client, tournament_db):
+    tournament_db.views["tournament_stats"] = tournament_stats_view
+
+    assert _counts(client.get(f"{URL}/upcoming").json()) == {"t3": (0, 0, 0), "t1": (3, 1, 1)}
+    assert tournament_db.tables_read() == ["v_tournaments_with_counts", "tournaments", "tournament_stats"]
+
+
+def test_other_counts_view_errors_are_not_masked(client, tournament_db):
+    tournament_db.views["v_tournaments_with_counts"] = tournaments_with_counts_view
+    tournament_db.fail("v_tournaments_with_counts", "select", api_error("57014", "statement timeout"))
+
+    assert client.get(URL).status_code == 500
+    assert tournament_db.tables_read() == ["v_tournaments_with_counts"]
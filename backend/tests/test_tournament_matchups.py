@@ -0,0 +1,51 @@
+"""Matchup endpoints under /api/tournaments."""
+
+URL = "/api/tournaments"
+
+
+def test_matchup_list_embeds_player_names(client, tournament_db):
+    body = client.get(f"{URL}/t1/matchups").json()
+
+    assert [(m["id"], m["player_name"]) for m in body] == [("m1", "Ana"), ("m2", None), ("m3", "Ana")]
+    assert all("player" not in m for m in body)
+    assert sorted(tournament_db.tables_read()) == ["tournament_matchups", "tournaments"]
+
+
+def test_matchup_list_of_unknown_tournament_is_404(client, tournament_db):
+    assert client.get(f"{URL}/nope/matchups").status_code == 404
+
+
+def test_matchup_writes_are_limited_to_the_owner(client, tournament_db):
+    tournament_db.tables["tournament_matchups"][1]["coach_id"] = "coach-2"
+
+    assert client.put(f"{URL}/matchups/m2", json={"result": "win"}).status_code == 404
+    assert client.delete(f"{URL}/matchups/m2").status_code == 404
+    assert tournament_db.tables["tournament_matchups"][1]["result"] == "loss"
+
+    assert client.put(f"{URL}/matchups/m1", json={"result": "loss"}).json()["result"] == "loss"
+    assert client.delete(f"{URL}/matchups/m1").json() == {"message": "Matchup deleted"}
+
+
+def test_created_matchup_carries_its_player_name(client, tournament_db):
+    body = client.post(
+        f"{URL}/t1/matchups",
+        json={"tournament_id": "t1", "opponent_name": "Lee", "player_id": "p1"},
+    ).json()
+
+    assert (body["player_name"], body["result"], body["coach_id"]) == ("Ana", "pending", "u1")
+    assert sorted(tournament_db.tables_read()) == ["players", "tournament_matchups", "tournaments"]
+
+
+def test_matchup_on_another_coachs_tournament_is_404(client, tournament_db):
+    response = client.post(f"{URL}/t3/matchups", json={"tournament_id": "t3", "opponent_name": "Lee"})
+
+    assert response.status_code == 404
+    assert tournament_db.queries("tournament_matchups", "insert") == []
+
+
+def test_updated_matchup_carries_its_player_name(client, tournament_db):
+    tournament_db.tables["players"].append({"id": "p2", "name": "Bo"})
+
+    assert client.put(f"{URL}/matchups/m2", json={"player_id": "p2"}).json()["player_name"] == "Bo"
+    # Without a new player_id the name follows the row's existing player.
+    assert client.put(f"{URL}/matchups/m1", json={"score": "3-1"}).json()["player_name"] == "Ana"
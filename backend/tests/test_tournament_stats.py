@@ -0,0 +1,71 @@
+"""GET /api/tournaments/stats/summary."""
+
+from conftest import api_error
+
+from src.api.routes import tournaments
+
+URL = "/api/tournaments/stats/summary"
+
+# Totals over the tournament_db fixture.
+EXPECTED = {
+    "total_tournaments": 4,
+    "upcoming_tournaments": 2,
+    "completed_tournaments": 1,
+    "total_matchups": 5,
+    "wins": 3,
+    "losses": 1,
+    "pending_matchups": 1,
+    "win_rate": 75.0,
+}
+
+
+def test_stats_come_from_one_rpc_call(client, tournament_db):
+    counters = {k: v for k, v in EXPECTED.items() if k != "win_rate"}
+    tournament_db.rpcs["tournament_stats_summary"] = lambda params: [counters]
+
+    assert client.get(URL).json() == EXPECTED
+    assert tournament_db.rpc_calls == [("tournament_stats_summary", {})]
+    assert tournament_db.calls == []
+
+
+def test_null_rpc_counters_read_as_zero(client, tournament_db):
+    tournament_db.rpcs["tournament_stats_summary"] = lambda params: [{"total_tournaments": 2, "wins": None}]
+
+    body = client.get(URL).json()
+
+    assert body["total_tournaments"] == 2
+    assert body["wins"] == body["losses"] == body["win_rate"] == 0
+
+
+def test_missing_rpc_falls_back_to_tallying_the_tables(client, tournament_db):
+    assert client.get(URL).json() == EXPECTED
+    assert sorted(tournament_db.tables_read()) == ["tournament_matchups", "tournaments"]
+
+
+def test_other_rpc_errors_are_500(client, tournament_db):
+    def _timeout(params):
+        raise api_error("57014", "canceling statement due to statement timeout")
+
+    tournament_db.rpcs["tournament_stats_summary"] = _timeout
+
+    assert client.get(URL).status_code == 500
+    assert tournament_db.calls == []
+
+
+def test_tally_counts_each_category_in_one_pass():
+    tournaments_rows = [{"status": s} for s in ("upcoming", "ongoing", "completed", "cancelled", None, "upcoming")]
+    matchup_rows = [{"result": r} for r in ("win", "loss", "pending", "win", None, "walkover")]
+
+    assert tournaments._tally_tournament_stats(tournaments_rows, matchup_rows) == {
+        "total_tournaments": 6,
+        "upcoming_tournaments": 3,
+        "completed_tournaments": 1,
+        "total_matchups": 6,
+        "wins": 2,
+        "losses": 1,
+        "pending_matchups": 1,
+    }
+
+
+def test_tally_of_empty_tables_is_zero():
+    assert set(tournaments._tally_tournament_stats([], []).values()) == {0}
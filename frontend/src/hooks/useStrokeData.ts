@@ -1,5 +1,5 @@
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
-import { analyzeStrokes, cancelStrokeInsights, getStrokeDebugRuns, getStrokeProgress, getStrokeSummary } from "@/lib/api";
+import { analyzeStrokes, cancelStrokeInsights, getStrokeProgress, getStrokeSummary } from "@/lib/api";
 import { sessionKeys } from "@/hooks/useSessions";
 
 // Query key factory for stroke data
@@ -7,7 +7,6 @@ export const strokeKeys = {
   all: ["strokes"] as const,
   summaries: () => [...strokeKeys.all, "summaries"] as const,
   summary: (sessionId: string) => [...strokeKeys.summaries(), sessionId] as const,
-  debugRuns: (sessionId: string) => [...strokeKeys.all, "debug-runs", sessionId] as const,
   progress: (sessionId: string) => [...strokeKeys.all, "progress", sessionId] as const,
 };
 
@@ -69,23 +68,6 @@ export function useCancelInsights(sessionId: string) {
   });
 }
 
-/**
- * Hook to fetch latest stroke debug run (used for live pipeline stage status)
- */
-export function useLatestStrokeDebugRun(sessionId: string, enabled: boolean = true) {
-  return useQuery({
-    queryKey: strokeKeys.debugRuns(sessionId),
-    queryFn: async () => {
-      const response = await getStrokeDebugRuns(sessionId, 1);
-      return (response.data?.runs && response.data.runs.length > 0) ? response.data.runs[0] : null;
-    },
-    enabled: !!sessionId && enabled,
-    staleTime: 0,
-    retry: false,
-    refetchInterval: enabled ? 1500 : false,
-  });
-}
-
 /**
  * Hook to fetch live in-memory stroke pipeline progress.
  */
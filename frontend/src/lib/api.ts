@@ -374,7 +374,6 @@ export interface StrokeDebugRunSummary {
   completed_at?: string;
   handedness?: string;
   camera_facing?: string;
-  debug_stats?: Record<string, unknown>;
   storage_path?: string;
   storage_url?: string;
   created_at?: string;
@@ -415,8 +414,8 @@ export const analyzeStrokes = (sessionId: string, data?: AnalyzeStrokesRequest)
 export const getStrokeSummary = (sessionId: string) =>
   api.get<StrokeSummary>(`/api/stroke/summary/${sessionId}`);
 
-export const getStrokeDebugRuns = (sessionId: string, limit: number = 20) =>
-  api.get<StrokeDebugRunsResponse>(`/api/stroke/debug-runs/${sessionId}`, { params: { limit } });
+export const getStrokeDebugRuns = (sessionId: string, limit: number = 20, offset: number = 0) =>
+  api.get<StrokeDebugRunsResponse>(`/api/stroke/debug-runs/${sessionId}`, { params: { limit, offset } });
 
 export const getStrokeProgress = (sessionId: string) =>
   api.get<StrokeProgressResponse>(`/api/stroke/progress/${sessionId}`);